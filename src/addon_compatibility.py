@@ -4,11 +4,67 @@ Provides comprehensive addon version compatibility mapping across EKS versions.
 """
 
 import json
+import os
+import time
+import functools
+import types
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import boto3
-from typing import Dict, List, Any, Optional
+from botocore.config import Config
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# On-disk cache of the fetched compatibility matrix, shared between runs
+CACHE_DIR = Path.home() / '.cache' / 'eks-upgrade-assessment'
+CACHE_TTL_SECONDS = 24 * 60 * 60
+# Bump when the cached matrix layout changes so stale files are ignored
+CACHE_SCHEMA_VERSION = 1
+
+# Reuse keep-alive connections and back off adaptively if the scan gets throttled
+EKS_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+
+CORE_AWS_ADDONS = frozenset({
+    'vpc-cni', 'coredns', 'kube-proxy', 'aws-ebs-csi-driver',
+    'aws-efs-csi-driver', 'aws-fsx-csi-driver'
+})
+
+AWS_MANAGED_ADDONS = frozenset({
+    'aws-load-balancer-controller', 'aws-for-fluent-bit',
+    'aws-cloudwatch-metrics', 'aws-node-termination-handler',
+    'cluster-autoscaler', 'aws-distro-for-opentelemetry'
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ver(version: str) -> tuple:
+    """Parse a version like 'v1.12.6-eksbuild.2' into a comparable tuple of ints."""
+    return tuple(int(x) for x in version.lstrip('v').split('-')[0].split('.'))
+
+
+def _try_parse_ver(version: Optional[str]) -> Optional[tuple]:
+    """Parse a version, returning None if it is missing or malformed."""
+    try:
+        return _parse_ver(version)
+    except Exception:
+        return None
+
+
+def _as_ver(version) -> tuple:
+    """Return a parsed version tuple, parsing strings on demand."""
+    return version if isinstance(version, tuple) else _parse_ver(version)
+
 
 @dataclass
 class AddonVersionInfo:
@@ -27,18 +83,58 @@ class EKSAddonCompatibilityAnalyzer:
     
     def __init__(self, region: str = 'us-west-2'):
         self.region = region
-        self.eks_client = boto3.client('eks', region_name=region)
+        self.eks_client = boto3.client('eks', region_name=region, config=EKS_CLIENT_CONFIG)
         self.compatibility_data = {}
+        self._compatibility_index = None
         
     def fetch_addon_compatibility_data(self) -> Dict[str, Any]:
         """Fetch comprehensive addon compatibility data from AWS."""
+        compatibility_matrix, _ = self._fetch_compatibility_matrix()
+        return compatibility_matrix
+    
+    def _fetch_compatibility_matrix(self) -> Tuple[Dict[str, Any], bool]:
+        """Fetch the compatibility matrix, returning it with whether the scan finished.
+        
+        A failed scan still returns whatever pages arrived, but must not be cached.
+        """
         print("🔍 Fetching EKS addon compatibility data...")
         
-        # Get all supported EKS versions
-        eks_versions = self._get_supported_eks_versions()
+        # An unfiltered describe_addon_versions scan returns every addon version along with
+        # the cluster versions it supports, so the whole matrix can be pivoted locally
+        # instead of issuing one call per (EKS version, addon) pair.
+        collected = {}
+        addon_names = set()
+        complete = True
+        try:
+            paginator = self.eks_client.get_paginator('describe_addon_versions')
+            for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+                for addon in page.get('addons', []):
+                    addon_name = addon.get('addonName')
+                    addon_names.add(addon_name)
+                    for addon_version in addon.get('addonVersions', []):
+                        version = addon_version.get('addonVersion')
+                        if not version:
+                            continue
+                        
+                        for compatibility in addon_version.get('compatibilities', []):
+                            eks_version = compatibility.get('clusterVersion')
+                            if not eks_version:
+                                continue
+                            
+                            entry = collected.setdefault(eks_version, {}).setdefault(addon_name, {
+                                'addon': addon,
+                                'versions': [],
+                                'default_version': None
+                            })
+                            entry['versions'].append(version)
+                            if compatibility.get('defaultVersion'):
+                                entry['default_version'] = version
+        except Exception as e:
+            complete = False
+            print(f"   ⚠️  Warning: Could not fetch addon versions: {e}")
         
-        # Get all available addons
-        available_addons = self._get_available_addons()
+        eks_versions = sorted(collected, key=_parse_ver)
+        print(f"   📊 Found {len(eks_versions)} EKS versions and {len(addon_names)} addons")
         
         compatibility_matrix = {}
         
@@ -46,169 +142,105 @@ class EKSAddonCompatibilityAnalyzer:
             print(f"   📊 Analyzing EKS version {eks_version}...")
             compatibility_matrix[eks_version] = {}
             
-            for addon_name in available_addons:
-                try:
-                    addon_info = self._get_addon_versions_for_eks_version(addon_name, eks_version)
-                    if addon_info:
-                        compatibility_matrix[eks_version][addon_name] = addon_info
-                except Exception as e:
-                    print(f"   ⚠️  Warning: Could not get addon info for {addon_name} on EKS {eks_version}: {e}")
+            for addon_name, entry in collected[eks_version].items():
+                addon_data = entry['addon']
+                # Sorting also drops versions repeated across pages
+                sorted_versions = self._sort_addon_versions(entry['versions'])
+                
+                compatibility_matrix[eks_version][addon_name] = {
+                    'addon_name': addon_name,
+                    'eks_version': eks_version,
+                    'min_addon_version': sorted_versions[0],
+                    'max_addon_version': sorted_versions[-1],
+                    'default_version': entry['default_version'] or entry['versions'][0],
+                    'all_versions': sorted_versions,
+                    'addon_type': self._determine_addon_type(addon_name),
+                    'publisher': addon_data.get('publisher', 'AWS'),
+                    'owner': addon_data.get('owner', 'aws')
+                }
         
-        return compatibility_matrix
-    
-    def _get_supported_eks_versions(self) -> List[str]:
-        """Get list of supported EKS versions."""
-        try:
-            # Get EKS versions from describe-addon-versions for a common addon
-            response = self.eks_client.describe_addon_versions(addonName='vpc-cni')
-            versions = set()
-            
-            for addon_version in response.get('addons', []):
-                for compatibility in addon_version.get('compatibilities', []):
-                    versions.add(compatibility.get('clusterVersion'))
-            
-            # Sort versions
-            sorted_versions = sorted(list(versions), key=lambda x: [int(i) for i in x.split('.')])
-            return sorted_versions
-            
-        except Exception as e:
-            print(f"⚠️  Warning: Could not fetch EKS versions, using default list: {e}")
-            return ['1.27', '1.28', '1.29', '1.30', '1.31', '1.32', '1.33']
-    
-    def _get_available_addons(self) -> List[str]:
-        """Get list of all available EKS addons."""
-        try:
-            response = self.eks_client.describe_addon_versions()
-            addon_names = []
-            
-            for addon in response.get('addons', []):
-                addon_names.append(addon.get('addonName'))
-            
-            return list(set(addon_names))
-            
-        except Exception as e:
-            print(f"⚠️  Warning: Could not fetch addon list: {e}")
-            return ['vpc-cni', 'coredns', 'kube-proxy', 'aws-ebs-csi-driver', 'aws-efs-csi-driver', 'aws-load-balancer-controller']
-    
-    def _get_addon_versions_for_eks_version(self, addon_name: str, eks_version: str) -> Optional[Dict[str, Any]]:
-        """Get addon version information for a specific EKS version."""
-        try:
-            response = self.eks_client.describe_addon_versions(
-                addonName=addon_name,
-                kubernetesVersion=eks_version
-            )
-            
-            if not response.get('addons'):
-                return None
-            
-            addon_data = response['addons'][0]
-            addon_versions = [av['addonVersion'] for av in addon_data.get('addonVersions', [])]
-            
-            if not addon_versions:
-                return None
-            
-            # Determine addon type
-            addon_type = self._determine_addon_type(addon_name)
-            
-            # Sort versions to find min/max
-            sorted_versions = self._sort_addon_versions(addon_versions)
-            
-            return {
-                'addon_name': addon_name,
-                'eks_version': eks_version,
-                'min_addon_version': sorted_versions[0] if sorted_versions else None,
-                'max_addon_version': sorted_versions[-1] if sorted_versions else None,
-                'default_version': addon_data.get('addonVersions', [{}])[0].get('addonVersion'),
-                'all_versions': sorted_versions,
-                'addon_type': addon_type,
-                'publisher': addon_data.get('publisher', 'AWS'),
-                'owner': addon_data.get('owner', 'aws')
-            }
-            
-        except Exception as e:
-            print(f"   ⚠️  Could not get versions for {addon_name} on EKS {eks_version}: {e}")
-            return None
+        return compatibility_matrix, complete
     
     def _determine_addon_type(self, addon_name: str) -> str:
         """Determine the type of addon."""
-        core_aws_addons = {
-            'vpc-cni', 'coredns', 'kube-proxy', 'aws-ebs-csi-driver', 
-            'aws-efs-csi-driver', 'aws-fsx-csi-driver'
-        }
-        
-        aws_addons = {
-            'aws-load-balancer-controller', 'aws-for-fluent-bit', 
-            'aws-cloudwatch-metrics', 'aws-node-termination-handler',
-            'cluster-autoscaler', 'aws-distro-for-opentelemetry'
-        }
-        
-        if addon_name in core_aws_addons:
+        if addon_name in CORE_AWS_ADDONS:
             return 'core_aws'
-        elif addon_name in aws_addons:
-            return 'aws_managed'
-        else:
-            return 'third_party'
+        return 'aws_managed' if addon_name in AWS_MANAGED_ADDONS else 'third_party'
     
     def _sort_addon_versions(self, versions: List[str]) -> List[str]:
-        """Sort addon versions in ascending order."""
+        """Sort unique addon versions in ascending order."""
+        # Deduplicate first so the (comparatively expensive) comparisons only run on unique values
+        unique_versions = set(versions)
         try:
-            # Handle different version formats (semantic versioning)
-            def version_key(version):
-                # Remove 'v' prefix and split by '-' to handle versions like 'v1.12.6-eksbuild.2'
-                clean_version = version.lstrip('v').split('-')[0]
-                return [int(x) for x in clean_version.split('.')]
-            
-            return sorted(versions, key=version_key)
+            return sorted(unique_versions, key=_parse_ver)
         except Exception:
             # Fallback to string sorting if version parsing fails
-            return sorted(versions)
+            return sorted(unique_versions)
     
     def analyze_cluster_addon_compatibility(self, cluster_name: str, current_eks_version: str, 
-                                          target_eks_version: str, current_addons: List[Dict]) -> Dict[str, Any]:
+                                          target_eks_version: str, current_addons: List[Dict],
+                                          compatibility_index: Optional[types.MappingProxyType] = None) -> Dict[str, Any]:
         """Analyze addon compatibility for cluster upgrade to target version."""
         print(f"🔍 Analyzing addon compatibility for {cluster_name}: {current_eks_version} → {target_eks_version}")
         
         # Load or fetch compatibility data
-        compatibility_data = self.get_compatibility_data()
+        if compatibility_index is None:
+            compatibility_index = self.get_compatibility_index()
         
-        analysis_results = {
+        addon_analysis = []
+        for current_addon in current_addons:
+            addon_name = current_addon.get('name', current_addon.get('addonName', ''))
+            current_version = current_addon.get('version', current_addon.get('addonVersion', ''))
+            
+            addon_analysis.append(self._analyze_single_addon_compatibility(
+                addon_name, current_version, current_eks_version, target_eks_version, compatibility_index
+            ))
+        
+        status_counts = Counter(a['compatibility_status'] for a in addon_analysis)
+        
+        return {
             'cluster_name': cluster_name,
             'current_eks_version': current_eks_version,
             'target_eks_version': target_eks_version,
-            'addon_analysis': [],
+            'addon_analysis': addon_analysis,
             'summary': {
                 'total_addons': len(current_addons),
-                'compatible': 0,
-                'upgrade_required': 0,
-                'incompatible': 0,
-                'unknown': 0
+                'compatible': status_counts['compatible'],
+                'upgrade_required': status_counts['upgrade_required'],
+                'incompatible': status_counts['incompatible'],
+                'unknown': status_counts['unknown']
             }
         }
+    
+    def analyze_clusters_batch(self, clusters: List[Dict], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Analyze addon compatibility for many clusters against one shared index.
         
-        for current_addon in current_addons:
-            addon_name = current_addon.get('name', current_addon.get('addonName', ''))
-            current_version = current_addon.get('version', current_addon.get('addonVersion', ''))
-            
-            addon_analysis = self._analyze_single_addon_compatibility(
-                addon_name, current_version, current_eks_version, target_eks_version, compatibility_data
+        Each cluster dict needs cluster_name, current_eks_version, target_eks_version
+        and current_addons. Set max_workers to analyze clusters on a thread pool.
+        """
+        compatibility_index = self.get_compatibility_index()
+        
+        def analyze(cluster: Dict) -> Dict[str, Any]:
+            return self.analyze_cluster_addon_compatibility(
+                cluster['cluster_name'],
+                cluster['current_eks_version'],
+                cluster['target_eks_version'],
+                cluster.get('current_addons', []),
+                compatibility_index
             )
-            
-            analysis_results['addon_analysis'].append(addon_analysis)
-            
-            # Update summary
-            status = addon_analysis['compatibility_status']
-            analysis_results['summary'][status] += 1
         
-        return analysis_results
+        if max_workers and len(clusters) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(analyze, clusters))
+        return [analyze(cluster) for cluster in clusters]
     
     def _analyze_single_addon_compatibility(self, addon_name: str, current_version: str, 
                                           current_eks_version: str, target_eks_version: str,
-                                          compatibility_data: Dict) -> Dict[str, Any]:
+                                          compatibility_index: Dict) -> Dict[str, Any]:
         """Analyze compatibility for a single addon."""
         
         # Get target version compatibility info
-        target_addon_info = compatibility_data.get(target_eks_version, {}).get(addon_name)
-        current_addon_info = compatibility_data.get(current_eks_version, {}).get(addon_name)
+        target_addon_info = compatibility_index.get((target_eks_version, addon_name))
         
         if not target_addon_info:
             return {
@@ -229,7 +261,9 @@ class EKSAddonCompatibilityAnalyzer:
         addon_type = target_addon_info.get('addon_type', 'unknown')
         
         compatibility_status, recommended_action = self._determine_compatibility_status(
-            current_version, target_min, target_max, addon_name
+            current_version, target_min, target_max, addon_name,
+            target_addon_info.get('min_addon_version_parsed'),
+            target_addon_info.get('max_addon_version_parsed')
         )
         
         return {
@@ -246,63 +280,133 @@ class EKSAddonCompatibilityAnalyzer:
             'all_target_versions': target_addon_info.get('all_versions', [])
         }
     
-    def _determine_compatibility_status(self, current_version: str, target_min: str, 
-                                      target_max: str, addon_name: str) -> tuple:
-        """Determine compatibility status and recommended action."""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _determine_compatibility_status(current_version: str, target_min: str, 
+                                      target_max: str, addon_name: str,
+                                      target_min_parsed: Optional[tuple] = None,
+                                      target_max_parsed: Optional[tuple] = None) -> tuple:
+        """Determine compatibility status and recommended action.
+        
+        Pre-parsed target bounds are used when provided so only the current version is parsed.
+        The verdict depends only on the arguments, so it is cached across clusters, which
+        usually share addon versions.
+        """
         if not target_min or not target_max:
             return 'unknown', 'Unable to determine compatibility - version range not available'
         
+        min_version = target_min_parsed or target_min
+        max_version = target_max_parsed or target_max
+        
         try:
             # Compare versions
-            if self._is_version_in_range(current_version, target_min, target_max):
+            if EKSAddonCompatibilityAnalyzer._is_version_in_range(current_version, min_version, max_version):
                 return 'compatible', 'Current version is compatible with target EKS version'
-            elif self._is_version_less_than(current_version, target_min):
+            elif EKSAddonCompatibilityAnalyzer._is_version_less_than(current_version, min_version):
                 return 'upgrade_required', f'Upgrade required: minimum version {target_min} needed'
             else:
                 return 'upgrade_required', f'Version update recommended: use version between {target_min} and {target_max}'
         except Exception:
             return 'unknown', 'Unable to compare versions - manual verification required'
     
-    def _is_version_in_range(self, version: str, min_version: str, max_version: str) -> bool:
-        """Check if version is within the specified range."""
+    @staticmethod
+    def _is_version_in_range(version, min_version, max_version) -> bool:
+        """Check if version is within the specified range (strings or parsed tuples)."""
         try:
-            def parse_version(v):
-                return [int(x) for x in v.lstrip('v').split('-')[0].split('.')]
-            
-            v_parsed = parse_version(version)
-            min_parsed = parse_version(min_version)
-            max_parsed = parse_version(max_version)
-            
-            return min_parsed <= v_parsed <= max_parsed
+            return _as_ver(min_version) <= _as_ver(version) <= _as_ver(max_version)
         except Exception:
             return False
     
-    def _is_version_less_than(self, version1: str, version2: str) -> bool:
-        """Check if version1 is less than version2."""
+    @staticmethod
+    def _is_version_less_than(version1, version2) -> bool:
+        """Check if version1 is less than version2 (strings or parsed tuples)."""
         try:
-            def parse_version(v):
-                return [int(x) for x in v.lstrip('v').split('-')[0].split('.')]
-            
-            v1_parsed = parse_version(version1)
-            v2_parsed = parse_version(version2)
-            
-            return v1_parsed < v2_parsed
+            return _as_ver(version1) < _as_ver(version2)
         except Exception:
             return False
     
     def get_compatibility_data(self) -> Dict[str, Any]:
-        """Get compatibility data, fetching if not cached."""
+        """Get compatibility data, fetching if not cached in memory or on disk."""
+        if not self.compatibility_data:
+            self.compatibility_data = self._load_cached_compatibility_data()
         if not self.compatibility_data:
-            self.compatibility_data = self.fetch_addon_compatibility_data()
+            self.compatibility_data, complete = self._fetch_compatibility_matrix()
+            # A partial scan (throttling, expired credentials) would otherwise stick for a day
+            if complete:
+                self._save_cached_compatibility_data(self.compatibility_data)
         return self.compatibility_data
     
+    def get_compatibility_index(self) -> types.MappingProxyType:
+        """Get a read-only (eks_version, addon_name) -> info view of the compatibility data.
+        
+        Entries carry the min/max addon versions pre-parsed into tuples so the
+        per-addon analysis does not reparse them for every cluster.
+        """
+        if self._compatibility_index is None:
+            self._compatibility_index = types.MappingProxyType({
+                (eks_version, addon_name): dict(
+                    addon_info,
+                    min_addon_version_parsed=_try_parse_ver(addon_info.get('min_addon_version')),
+                    max_addon_version_parsed=_try_parse_ver(addon_info.get('max_addon_version'))
+                )
+                for eks_version, addons in self.get_compatibility_data().items()
+                for addon_name, addon_info in addons.items()
+            })
+        return self._compatibility_index
+    
+    def _get_cache_file(self) -> Path:
+        """Get the disk cache file for this region."""
+        return CACHE_DIR / f"addon-compat-{self.region}.json"
+    
+    def _load_cached_compatibility_data(self) -> Dict[str, Any]:
+        """Load compatibility data from the disk cache if it is fresh."""
+        cache_file = self._get_cache_file()
+        try:
+            if time.time() - cache_file.stat().st_mtime >= CACHE_TTL_SECONDS:
+                return {}
+            
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+            
+            if cached.get('schema_version') != CACHE_SCHEMA_VERSION or cached.get('region') != self.region:
+                return {}
+            
+            print(f"✅ Using cached addon compatibility data: {cache_file}")
+            return cached.get('compatibility_matrix', {})
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_cached_compatibility_data(self, compatibility_data: Dict[str, Any]):
+        """Atomically write compatibility data to the disk cache."""
+        if not compatibility_data:
+            return
+        
+        cache_file = self._get_cache_file()
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump({
+                    'schema_version': CACHE_SCHEMA_VERSION,
+                    'region': self.region,
+                    'compatibility_matrix': compatibility_data
+                }, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not write addon compatibility cache: {e}")
+    
     def save_compatibility_data(self, output_path: str):
         """Save compatibility data to JSON file."""
         compatibility_data = self.get_compatibility_data()
         
         output_file = Path(output_path) / "eks-addon-compatibility.json"
-        with open(output_file, 'w') as f:
-            json.dump(compatibility_data, f, indent=2, default=str)
+        if orjson is not None:
+            output_file.write_bytes(orjson.dumps(
+                compatibility_data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(compatibility_data, f, indent=2, default=str)
         
         print(f"✅ Addon compatibility data saved to: {output_file}")
         return output_file
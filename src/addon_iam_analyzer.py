@@ -7,12 +7,27 @@ AWS requirements for addon functionality and upgrades.
 
 import boto3
 import json
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from pathlib import Path
 import click
 
 
+logger = logging.getLogger(__name__)
+
+# AWS managed policy ARNs in the commercial, GovCloud and China partitions
+_AWS_MANAGED_PREFIXES = (
+    'arn:aws:iam::aws:policy/',
+    'arn:aws-us-gov:iam::aws:policy/',
+    'arn:aws-cn:iam::aws:policy/'
+)
+
+
 @dataclass
 class IAMPolicyInfo:
     """Information about an IAM policy."""
@@ -70,12 +85,20 @@ class AddonIAMAnalysis:
 class AddonIAMAnalyzer:
     """Analyzes EKS addon IAM roles and policies."""
     
+    # Role lookups shared by every analyzer in the process: role_arn -> (expires_at, IAMRoleInfo)
+    ROLE_CACHE_TTL_SECONDS = 60
+    ROLE_CACHE_MAXSIZE = 1024
+    _role_cache = OrderedDict()
+    _role_cache_lock = threading.Lock()
+    
     def __init__(self, aws_client, shared_data_dir=None):
         """Initialize the analyzer with AWS clients."""
         self.aws_client = aws_client
         self.eks_client = aws_client.eks_client
         self.iam_client = aws_client.iam_client
         self.shared_data_dir = shared_data_dir
+        # describe_addon responses for this analyzer: (cluster_name, addon_name) -> addon details
+        self._addon_details_cache: Dict[tuple, Dict[str, Any]] = {}
         
         # Load IAM policy mapping from shared data
         if shared_data_dir:
@@ -104,23 +127,78 @@ class AddonIAMAnalyzer:
             'recommendations': []
         }
         
-        for addon in addons:
-            addon_name = addon.get('name', addon.get('addonName', ''))
-            addon_analysis = self._analyze_single_addon_iam(cluster_name, addon_name, addon)
-            analysis_results['addon_iam_analysis'].append(addon_analysis.to_dict())
-            
-            # Update summary
-            status = addon_analysis.validation_status
-            analysis_results['summary'][status] = analysis_results['summary'].get(status, 0) + 1
+        addon_names = [addon.get('name', addon.get('addonName', '')) for addon in addons]
+        
+        # Addon dicts that already carry describe_addon fields (the role ARN, or the
+        # addon ARN for addons without one) are full details; reuse them
+        addon_details = {
+            addon_name: addon for addon_name, addon in zip(addon_names, addons)
+            if 'serviceAccountRoleArn' in addon or 'addonArn' in addon
+        }
+        # Fan out the remaining describe calls, then look up each distinct IAM role
+        # once so addons sharing a role don't repeat the IAM round trips
+        addon_details.update(self._prefetch_addon_details(
+            cluster_name, [addon_name for addon_name in addon_names if addon_name not in addon_details]
+        ))
+        role_arns = [
+            details['serviceAccountRoleArn'] for addon_name, details in addon_details.items()
+            if details.get('serviceAccountRoleArn')
+            and self.addon_iam_policies.get(addon_name, {}).get('requires_iam')
+        ]
+        role_infos = self._get_iam_roles_info(role_arns)
+        
+        addon_analyses = [
+            self._analyze_single_addon_iam(
+                cluster_name, addon_name, addon,
+                details=addon_details.get(addon_name), role_infos=role_infos
+            )
+            for addon_name, addon in zip(addon_names, addons)
+        ]
+        
+        # Update summary
+        analysis_results['summary'].update(Counter(a.validation_status for a in addon_analyses))
         
         # Generate cluster-level recommendations
-        analysis_results['recommendations'] = self._generate_cluster_recommendations(
-            [addon_analysis for addon_analysis in analysis_results['addon_iam_analysis']]
-        )
+        analysis_results['recommendations'] = self._generate_cluster_recommendations(addon_analyses)
+        
+        analysis_results['addon_iam_analysis'] = [a.to_dict() for a in addon_analyses]
         
         return analysis_results
     
-    def _analyze_single_addon_iam(self, cluster_name: str, addon_name: str, addon_info: Dict[str, Any]) -> AddonIAMAnalysis:
+    def _prefetch_addon_details(self, cluster_name: str, addon_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Describe all addons concurrently, returning {addon_name: details} for the ones that succeeded."""
+        def describe(addon_name: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self._describe_addon_cached(cluster_name, addon_name)
+            except Exception:
+                # Left out so the per-addon analysis retries and reports the error
+                return None
+        
+        if not addon_names:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(addon_names))) as executor:
+            return {
+                addon_name: details
+                for addon_name, details in zip(addon_names, executor.map(describe, addon_names))
+                if details is not None
+            }
+    
+    def _describe_addon_cached(self, cluster_name: str, addon_name: str) -> Dict[str, Any]:
+        """Describe an addon once per analyzer; failures are not cached."""
+        key = (cluster_name, addon_name)
+        details = self._addon_details_cache.get(key)
+        if details is None:
+            response = self.eks_client.describe_addon(
+                clusterName=cluster_name,
+                addonName=addon_name
+            )
+            details = self._addon_details_cache[key] = response.get('addon', {})
+        return details
+    
+    def _analyze_single_addon_iam(self, cluster_name: str, addon_name: str, addon_info: Dict[str, Any],
+                                  details: Optional[Dict[str, Any]] = None,
+                                  role_infos: Optional[Dict[str, Optional[IAMRoleInfo]]] = None) -> AddonIAMAnalysis:
         """Analyze IAM configuration for a single addon."""
         try:
             # Get addon IAM requirements from mapping
@@ -129,11 +207,10 @@ class AddonIAMAnalyzer:
             expected_policies = addon_requirements.get('managed_policies', [])
             
             # Get detailed addon information
-            response = self.eks_client.describe_addon(
-                clusterName=cluster_name,
-                addonName=addon_name
-            )
-            addon_details = response.get('addon', {})
+            if details is not None:
+                addon_details = details
+            else:
+                addon_details = self._describe_addon_cached(cluster_name, addon_name)
             
             # Extract service account role ARN
             service_account_role_arn = addon_details.get('serviceAccountRoleArn')
@@ -172,7 +249,7 @@ class AddonIAMAnalyzer:
                         expected_managed_policies=expected_policies,
                         validation_status='error',
                         issues=[f'Addon {addon_name} requires IAM role but none is configured'],
-                        recommendations=[f'Configure IAM role with required policies: {", ".join([p.split("/")[-1] for p in expected_policies])}']
+                        recommendations=[f'Configure IAM role with required policies: {", ".join(p.rsplit("/", 1)[-1] for p in expected_policies)}']
                     )
                 else:
                     return AddonIAMAnalysis(
@@ -186,7 +263,10 @@ class AddonIAMAnalyzer:
                     )
             
             # Analyze the IAM role
-            iam_role_info = self._get_iam_role_info(service_account_role_arn)
+            if role_infos is not None and service_account_role_arn in role_infos:
+                iam_role_info = role_infos[service_account_role_arn]
+            else:
+                iam_role_info = self._get_iam_role_info(service_account_role_arn)
             
             # Validate IAM configuration
             validation_result = self._validate_iam_configuration(
@@ -217,30 +297,101 @@ class AddonIAMAnalyzer:
     
     def _get_iam_role_info(self, role_arn: str) -> Optional[IAMRoleInfo]:
         """Get detailed information about an IAM role."""
+        return self._get_iam_roles_info([role_arn])[role_arn]
+    
+    def _get_iam_roles_info(self, role_arns: List[str]) -> Dict[str, Optional[IAMRoleInfo]]:
+        """Get detailed information for distinct IAM roles, issuing all IAM calls concurrently."""
+        role_arns = list(dict.fromkeys(role_arns))
+        role_infos = self._get_cached_roles(role_arns)
+        missing_arns = [role_arn for role_arn in role_arns if role_arn not in role_infos]
+        if not missing_arns:
+            return role_infos
+        
+        with ThreadPoolExecutor(max_workers=min(16, 2 * len(missing_arns))) as executor:
+            pending = {}
+            for role_arn in missing_arns:
+                # Extract role name from ARN
+                role_name = role_arn.rsplit('/', 1)[-1]
+                pending[role_arn] = (
+                    executor.submit(self.iam_client.get_role, RoleName=role_name),
+                    executor.submit(self._list_attached_role_policies, role_name)
+                )
+            
+            fetched = {
+                role_arn: self._build_iam_role_info(role_arn, role_future, policies_future)
+                for role_arn, (role_future, policies_future) in pending.items()
+            }
+        
+        self._cache_roles(fetched)
+        role_infos.update(fetched)
+        return role_infos
+    
+    @classmethod
+    def _get_cached_roles(cls, role_arns: List[str]) -> Dict[str, IAMRoleInfo]:
+        """Return unexpired cached role info for the given ARNs."""
+        now = time.monotonic()
+        cached = {}
+        with cls._role_cache_lock:
+            for role_arn in role_arns:
+                entry = cls._role_cache.get(role_arn)
+                if entry is None:
+                    continue
+                expires_at, role_info = entry
+                if expires_at <= now:
+                    del cls._role_cache[role_arn]
+                    continue
+                cls._role_cache.move_to_end(role_arn)
+                cached[role_arn] = role_info
+        return cached
+    
+    @classmethod
+    def _cache_roles(cls, role_infos: Dict[str, Optional[IAMRoleInfo]]):
+        """Cache successful role lookups, evicting the least recently used entries."""
+        expires_at = time.monotonic() + cls.ROLE_CACHE_TTL_SECONDS
+        with cls._role_cache_lock:
+            for role_arn, role_info in role_infos.items():
+                # Failed lookups are retried on the next analysis
+                if role_info is None:
+                    continue
+                cls._role_cache[role_arn] = (expires_at, role_info)
+                cls._role_cache.move_to_end(role_arn)
+            while len(cls._role_cache) > cls.ROLE_CACHE_MAXSIZE:
+                cls._role_cache.popitem(last=False)
+    
+    def _list_attached_role_policies(self, role_name: str) -> List[Dict[str, Any]]:
+        """List every managed policy attached to a role across all result pages."""
+        paginator = self.iam_client.get_paginator('list_attached_role_policies')
+        return [
+            policy
+            for page in paginator.paginate(RoleName=role_name)
+            for policy in page['AttachedPolicies']
+        ]
+    
+    def _build_iam_role_info(self, role_arn: str, role_future, policies_future) -> Optional[IAMRoleInfo]:
+        """Assemble an IAMRoleInfo from pending get_role and list_attached_role_policies calls."""
         try:
-            # Extract role name from ARN
-            role_name = role_arn.split('/')[-1]
+            role_name = role_arn.rsplit('/', 1)[-1]
             
             # Get role details
-            role_response = self.iam_client.get_role(RoleName=role_name)
-            role_data = role_response['Role']
+            role_data = role_future.result()['Role']
             
             # Get attached policies
-            policies_response = self.iam_client.list_attached_role_policies(RoleName=role_name)
             attached_policies = []
             
-            for policy in policies_response['AttachedPolicies']:
+            for policy in policies_future.result():
                 policy_info = IAMPolicyInfo(
                     policy_arn=policy['PolicyArn'],
                     policy_name=policy['PolicyName'],
-                    is_aws_managed=policy['PolicyArn'].startswith('arn:aws:iam::aws:policy/')
+                    is_aws_managed=policy['PolicyArn'].startswith(_AWS_MANAGED_PREFIXES)
                 )
                 attached_policies.append(policy_info)
             
             click.echo(f"      📋 Found IAM role: {role_name} with {len(attached_policies)} policies")
-            for policy in attached_policies:
-                policy_type = "AWS Managed" if policy.is_aws_managed else "Custom"
-                click.echo(f"        - {policy.policy_name} ({policy_type})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("IAM role %s policies: %s", role_name, ", ".join(
+                    f"{policy.policy_name} ({'AWS Managed' if policy.is_aws_managed else 'Custom'})"
+                    for policy in attached_policies
+                ))
             
             return IAMRoleInfo(
                 role_name=role_name,
@@ -288,13 +439,12 @@ class AddonIAMAnalyzer:
         
         issues = []
         recommendations = []
-        attached_policy_arns = [p.policy_arn for p in iam_role_info.attached_policies]
+        attached_policy_arns = {p.policy_arn for p in iam_role_info.attached_policies}
         
         # Check if all expected managed policies are attached
-        missing_policies = []
-        for expected_policy in expected_policies:
-            if expected_policy not in attached_policy_arns:
-                missing_policies.append(expected_policy)
+        missing_policies = [p for p in expected_policies if p not in attached_policy_arns]
+        
+        missing_names = ", ".join(p.rsplit('/', 1)[-1] for p in missing_policies)
         
         # Check if using custom policies instead of managed policies
         custom_policies = [p for p in iam_role_info.attached_policies if not p.is_aws_managed]
@@ -304,20 +454,20 @@ class AddonIAMAnalyzer:
             return {
                 'status': 'warning',
                 'issues': [
-                    f'Missing expected AWS managed policies: {", ".join([p.split("/")[-1] for p in missing_policies])}',
+                    f'Missing expected AWS managed policies: {missing_names}',
                     f'Using custom policies: {", ".join([p.policy_name for p in custom_policies])}'
                 ],
                 'recommendations': [
                     'Verify custom policies provide equivalent permissions to AWS managed policies',
-                    f'Consider using AWS managed policies: {", ".join([p.split("/")[-1] for p in missing_policies])}'
+                    f'Consider using AWS managed policies: {missing_names}'
                 ]
             }
         elif missing_policies:
             # Missing managed policies, no custom policies
             return {
                 'status': 'error',
-                'issues': [f'Missing required AWS managed policies: {", ".join([p.split("/")[-1] for p in missing_policies])}'],
-                'recommendations': [f'Attach required policies: {", ".join([p.split("/")[-1] for p in missing_policies])}']
+                'issues': [f'Missing required AWS managed policies: {missing_names}'],
+                'recommendations': [f'Attach required policies: {missing_names}']
             }
         elif custom_policies:
             # Has all managed policies but also has custom policies
@@ -334,12 +484,12 @@ class AddonIAMAnalyzer:
                 'recommendations': []
             }
     
-    def _generate_cluster_recommendations(self, addon_analyses: List[Dict[str, Any]]) -> List[str]:
+    def _generate_cluster_recommendations(self, addon_analyses: List[AddonIAMAnalysis]) -> List[str]:
         """Generate cluster-level IAM recommendations."""
         recommendations = []
         
-        error_addons = [a for a in addon_analyses if a.get('validation_status') == 'error']
-        warning_addons = [a for a in addon_analyses if a.get('validation_status') == 'warning']
+        error_addons = [a for a in addon_analyses if a.validation_status == 'error']
+        warning_addons = [a for a in addon_analyses if a.validation_status == 'warning']
         
         if error_addons:
             recommendations.append(
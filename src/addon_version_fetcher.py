@@ -4,13 +4,62 @@ Fetches and caches common addon version compatibility data for all EKS versions.
 This data is cluster-independent and should be fetched once per assessment run.
 """
 
+import functools
 import json
+import threading
+import time
 import boto3
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from pathlib import Path
 import click
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Shared addon version data older than this is fetched again
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# The pool is sized above the fetch fan-out, and retries back off adaptively when throttled
+_CONFIG = Config(max_pool_connections=32, retries={'max_attempts': 10, 'mode': 'adaptive'})
+
+
+# Session.client() is not thread-safe, so fetchers created on worker threads take turns
+_SESSION_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session() -> boto3.session.Session:
+    """Create the session on first use and share it, so service models load once per process."""
+    return boto3.session.Session()
+
+
+@functools.lru_cache(maxsize=4096)
+def _version_key(version: str) -> tuple:
+    """Parse 'v1.12.6-eksbuild.2' into (1, 12, 6); the same versions recur across EKS versions."""
+    return tuple(int(x) for x in version.lstrip('v').split('-', 1)[0].split('.'))
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_shared_data_dir(output_dir: str) -> Path:
+    """Resolve the shared-data directory that sits alongside assessment output."""
+    output_path = Path(output_dir)
+    
+    # If output_dir is like "assessment-reports/629244530291-us-east-1-20250810-143449-assessment"
+    # we want "assessment-reports/shared-data/"
+    if output_path.parent.name == "assessment-reports":
+        # We're in a timestamped assessment directory, go to parent
+        return output_path.parent / "shared-data"
+    
+    # Inside the assessment-reports directory itself or a custom output
+    # directory, use a shared-data subdirectory
+    return output_path / "shared-data"
+
 
 @dataclass
 class AddonVersionInfo:
@@ -29,9 +78,23 @@ class AddonVersionInfo:
 class EKSAddonVersionFetcher:
     """Fetches and caches EKS addon version compatibility data."""
     
+    _ADDON_TYPE = {
+        **dict.fromkeys((
+            'vpc-cni', 'coredns', 'kube-proxy', 'aws-ebs-csi-driver',
+            'aws-efs-csi-driver', 'aws-fsx-csi-driver'
+        ), 'core_aws'),
+        **dict.fromkeys((
+            'aws-load-balancer-controller', 'aws-for-fluent-bit',
+            'aws-cloudwatch-metrics', 'aws-node-termination-handler',
+            'cluster-autoscaler', 'aws-distro-for-opentelemetry',
+            'metrics-server', 'snapshot-controller'
+        ), 'aws_managed')
+    }
+    
     def __init__(self, region: str = 'us-west-2'):
         self.region = region
-        self.eks_client = boto3.client('eks', region_name=region)
+        with _SESSION_LOCK:
+            self.eks_client = _get_session().client('eks', region_name=region, config=_CONFIG)
         
     def fetch_all_addon_versions(self) -> Dict[str, Any]:
         """Fetch comprehensive addon version data for all EKS versions."""
@@ -56,17 +119,23 @@ class EKSAddonVersionFetcher:
             'addon_versions': {}
         }
         
+        # One paginated describe_addon_versions call per addon already lists the
+        # compatible cluster versions of every addon version, so pivot it locally
+        def fetch(addon_name):
+            try:
+                return self._get_addon_versions_by_eks_version(addon_name, eks_versions)
+            except Exception as e:
+                click.echo(f"      ⚠️  Warning: Could not get addon info for {addon_name}: {e}")
+                return {}
+        
         for eks_version in eks_versions:
-            click.echo(f"   📊 Analyzing EKS version {eks_version}...")
             compatibility_matrix['addon_versions'][eks_version] = {}
-            
-            for addon_name in available_addons:
-                try:
-                    addon_info = self._get_addon_versions_for_eks_version(addon_name, eks_version)
-                    if addon_info:
+        
+        if available_addons:
+            with ThreadPoolExecutor(max_workers=min(20, len(available_addons))) as executor:
+                for addon_name, per_version in zip(available_addons, executor.map(fetch, available_addons)):
+                    for eks_version, addon_info in per_version.items():
                         compatibility_matrix['addon_versions'][eks_version][addon_name] = addon_info
-                except Exception as e:
-                    click.echo(f"      ⚠️  Warning: Could not get addon info for {addon_name} on EKS {eks_version}: {e}")
         
         click.echo("✅ Addon version compatibility data fetched successfully")
         return compatibility_matrix
@@ -75,126 +144,103 @@ class EKSAddonVersionFetcher:
         """Get list of supported EKS versions."""
         try:
             # Get EKS versions from describe-addon-versions for a common addon
-            response = self.eks_client.describe_addon_versions(addonName='vpc-cni')
-            versions = set()
-            
-            for addon_version in response.get('addons', []):
-                for compatibility in addon_version.get('compatibilities', []):
-                    cluster_version = compatibility.get('clusterVersion')
-                    if cluster_version:
-                        versions.add(cluster_version)
-            
-            # Sort versions
-            sorted_versions = sorted(list(versions), key=lambda x: [int(i) for i in x.split('.')])
+            versions = self._get_cluster_versions_for_addon('vpc-cni')
             
             # If we still don't have versions, try a different approach
-            if not sorted_versions:
+            if not versions:
                 # Try getting versions from multiple addons
-                common_addons = ['vpc-cni', 'coredns', 'kube-proxy']
+                common_addons = ['coredns', 'kube-proxy']
                 for addon in common_addons:
                     try:
-                        response = self.eks_client.describe_addon_versions(addonName=addon)
-                        for addon_data in response.get('addons', []):
-                            for addon_version in addon_data.get('addonVersions', []):
-                                for compatibility in addon_version.get('compatibilities', []):
-                                    cluster_version = compatibility.get('clusterVersion')
-                                    if cluster_version:
-                                        versions.add(cluster_version)
+                        versions.update(self._get_cluster_versions_for_addon(addon))
                     except Exception:
                         continue
-                
-                sorted_versions = sorted(list(versions), key=lambda x: [int(i) for i in x.split('.')])
             
-            return sorted_versions
+            # Sort versions
+            return sorted(versions, key=lambda x: [int(i) for i in x.split('.')])
             
         except Exception as e:
             click.echo(f"⚠️  Warning: Could not fetch EKS versions, using default list: {e}")
             return ['1.27', '1.28', '1.29', '1.30', '1.31', '1.32', '1.33']
     
+    def _get_cluster_versions_for_addon(self, addon_name: str) -> set:
+        """Collect every cluster version listed as compatible with any version of an addon."""
+        versions = set()
+        paginator = self.eks_client.get_paginator('describe_addon_versions')
+        for page in paginator.paginate(addonName=addon_name, PaginationConfig={'PageSize': 100}):
+            for addon_data in page.get('addons', []):
+                for addon_version in addon_data.get('addonVersions', []):
+                    for compatibility in addon_version.get('compatibilities', []):
+                        cluster_version = compatibility.get('clusterVersion')
+                        if cluster_version:
+                            versions.add(cluster_version)
+        return versions
+    
     def _get_available_addons(self) -> List[str]:
         """Get list of all available EKS addons."""
         try:
-            response = self.eks_client.describe_addon_versions()
-            addon_names = []
+            addon_names = set()
+            paginator = self.eks_client.get_paginator('describe_addon_versions')
+            for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+                addon_names.update(addon['addonName'] for addon in page.get('addons', []))
             
-            for addon in response.get('addons', []):
-                addon_names.append(addon.get('addonName'))
-            
-            return list(set(addon_names))
+            return list(addon_names)
             
         except Exception as e:
             click.echo(f"⚠️  Warning: Could not fetch addon list: {e}")
             return ['vpc-cni', 'coredns', 'kube-proxy', 'aws-ebs-csi-driver', 'aws-efs-csi-driver', 'aws-load-balancer-controller']
     
-    def _get_addon_versions_for_eks_version(self, addon_name: str, eks_version: str) -> Optional[Dict[str, Any]]:
-        """Get addon version information for a specific EKS version."""
-        try:
-            response = self.eks_client.describe_addon_versions(
-                addonName=addon_name,
-                kubernetesVersion=eks_version
-            )
-            
-            if not response.get('addons'):
-                return None
-            
-            addon_data = response['addons'][0]
-            addon_versions = [av['addonVersion'] for av in addon_data.get('addonVersions', [])]
-            
-            if not addon_versions:
-                return None
-            
-            # Determine addon type
-            addon_type = self._determine_addon_type(addon_name)
-            
+    def _get_addon_versions_by_eks_version(self, addon_name: str, eks_versions: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get addon version information for every requested EKS version from one addon lookup."""
+        wanted_versions = set(eks_versions)
+        versions_by_eks_version = {}
+        defaults_by_eks_version = {}
+        addon_data = {}
+        
+        paginator = self.eks_client.get_paginator('describe_addon_versions')
+        for page in paginator.paginate(addonName=addon_name, PaginationConfig={'PageSize': 100}):
+            for addon in page.get('addons', []):
+                addon_data = addon
+                for addon_version in addon.get('addonVersions', []):
+                    version = addon_version['addonVersion']
+                    for compatibility in addon_version.get('compatibilities', []):
+                        eks_version = compatibility.get('clusterVersion')
+                        if eks_version not in wanted_versions:
+                            continue
+                        versions_by_eks_version.setdefault(eks_version, []).append(version)
+                        if compatibility.get('defaultVersion'):
+                            defaults_by_eks_version[eks_version] = version
+        
+        # Determine addon type
+        addon_type = self._determine_addon_type(addon_name)
+        
+        results = {}
+        for eks_version, addon_versions in versions_by_eks_version.items():
             # Sort versions to find min/max
             sorted_versions = self._sort_addon_versions(addon_versions)
             
-            return {
+            results[eks_version] = {
                 'addon_name': addon_name,
                 'eks_version': eks_version,
-                'min_addon_version': sorted_versions[0] if sorted_versions else None,
-                'max_addon_version': sorted_versions[-1] if sorted_versions else None,
-                'default_version': addon_data.get('addonVersions', [{}])[0].get('addonVersion'),
+                'min_addon_version': sorted_versions[0],
+                'max_addon_version': sorted_versions[-1],
+                'default_version': defaults_by_eks_version.get(eks_version, addon_versions[0]),
                 'all_versions': sorted_versions,
                 'addon_type': addon_type,
                 'publisher': addon_data.get('publisher', 'AWS'),
                 'owner': addon_data.get('owner', 'aws')
             }
-            
-        except Exception as e:
-            return None
+        
+        return results
     
     def _determine_addon_type(self, addon_name: str) -> str:
         """Determine the type of addon."""
-        core_aws_addons = {
-            'vpc-cni', 'coredns', 'kube-proxy', 'aws-ebs-csi-driver', 
-            'aws-efs-csi-driver', 'aws-fsx-csi-driver'
-        }
-        
-        aws_managed_addons = {
-            'aws-load-balancer-controller', 'aws-for-fluent-bit', 
-            'aws-cloudwatch-metrics', 'aws-node-termination-handler',
-            'cluster-autoscaler', 'aws-distro-for-opentelemetry',
-            'metrics-server', 'snapshot-controller'
-        }
-        
-        if addon_name in core_aws_addons:
-            return 'core_aws'
-        elif addon_name in aws_managed_addons:
-            return 'aws_managed'
-        else:
-            return 'third_party'
+        return self._ADDON_TYPE.get(addon_name, 'third_party')
     
     def _sort_addon_versions(self, versions: List[str]) -> List[str]:
         """Sort addon versions in ascending order."""
         try:
-            # Handle different version formats (semantic versioning)
-            def version_key(version):
-                # Remove 'v' prefix and split by '-' to handle versions like 'v1.12.6-eksbuild.2'
-                clean_version = version.lstrip('v').split('-')[0]
-                return [int(x) for x in clean_version.split('.')]
-            
-            return sorted(versions, key=version_key)
+            return sorted(versions, key=_version_key)
         except Exception:
             # Fallback to string sorting if version parsing fails
             return sorted(versions)
@@ -203,26 +249,15 @@ class EKSAddonVersionFetcher:
         """Fetch and save addon version data to a shared parent directory."""
         addon_versions_data = self.fetch_all_addon_versions()
         
-        # Determine the parent directory for shared addon data
-        output_path = Path(output_dir)
-        
-        # If output_dir is like "assessment-reports/629244530291-us-east-1-20250810-143449-assessment"
-        # we want to save to "assessment-reports/shared-data/"
-        if output_path.parent.name == "assessment-reports":
-            # We're in a timestamped assessment directory, go to parent
-            shared_data_dir = output_path.parent / "shared-data"
-        elif output_path.name.startswith("assessment-reports"):
-            # We're in the assessment-reports directory itself
-            shared_data_dir = output_path / "shared-data"
-        else:
-            # For custom output directories, create a shared-data subdirectory
-            shared_data_dir = output_path / "shared-data"
-        
+        shared_data_dir = _resolve_shared_data_dir(output_dir)
         shared_data_dir.mkdir(parents=True, exist_ok=True)
         
         addon_versions_file = shared_data_dir / "eks-addon-versions.json"
-        with open(addon_versions_file, 'w') as f:
-            json.dump(addon_versions_data, f, indent=2, default=str)
+        if orjson is not None:
+            addon_versions_file.write_bytes(orjson.dumps(addon_versions_data, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            with open(addon_versions_file, 'w') as f:
+                json.dump(addon_versions_data, f, indent=2, default=str)
         
         click.echo(f"✅ EKS addon version data saved to shared location: {addon_versions_file}")
         return str(addon_versions_file)
@@ -230,23 +265,12 @@ class EKSAddonVersionFetcher:
     @staticmethod
     def load_addon_versions_data(output_dir: str) -> Optional[Dict[str, Any]]:
         """Load cached addon version data from shared parent directory."""
-        output_path = Path(output_dir)
-        
-        # Determine the parent directory for shared addon data
-        if output_path.parent.name == "assessment-reports":
-            # We're in a timestamped assessment directory, go to parent
-            shared_data_dir = output_path.parent / "shared-data"
-        elif output_path.name.startswith("assessment-reports"):
-            # We're in the assessment-reports directory itself
-            shared_data_dir = output_path / "shared-data"
-        else:
-            # For custom output directories, create a shared-data subdirectory
-            shared_data_dir = output_path / "shared-data"
-        
-        addon_versions_file = shared_data_dir / "eks-addon-versions.json"
+        addon_versions_file = _resolve_shared_data_dir(output_dir) / "eks-addon-versions.json"
         
         if addon_versions_file.exists():
             try:
+                if orjson is not None:
+                    return orjson.loads(addon_versions_file.read_bytes())
                 with open(addon_versions_file, 'r') as f:
                     return json.load(f)
             except Exception as e:
@@ -258,22 +282,18 @@ class EKSAddonVersionFetcher:
 def fetch_and_cache_addon_versions(region: str, output_dir: str, force_refresh: bool = False) -> str:
     """Fetch and cache addon version data for the assessment."""
     
-    # Check if cached data exists and is recent (unless force refresh)
+    # Check if cached data exists and is recent (unless force refresh); the
+    # file's mtime is enough to decide, so skip parsing it here
     if not force_refresh:
-        cached_data = EKSAddonVersionFetcher.load_addon_versions_data(output_dir)
-        if cached_data:
+        addon_versions_file = _resolve_shared_data_dir(output_dir) / "eks-addon-versions.json"
+        try:
+            cache_age = time.time() - addon_versions_file.stat().st_mtime
+        except OSError:
+            cache_age = None
+        
+        if cache_age is not None and cache_age < CACHE_TTL_SECONDS:
             click.echo("✅ Using cached EKS addon version data from shared location")
-            
-            # Return the path to the shared data file
-            output_path = Path(output_dir)
-            if output_path.parent.name == "assessment-reports":
-                shared_data_dir = output_path.parent / "shared-data"
-            elif output_path.name.startswith("assessment-reports"):
-                shared_data_dir = output_path / "shared-data"
-            else:
-                shared_data_dir = output_path / "shared-data"
-            
-            return str(shared_data_dir / "eks-addon-versions.json")
+            return str(addon_versions_file)
     
     # Fetch fresh data
     fetcher = EKSAddonVersionFetcher(region=region)
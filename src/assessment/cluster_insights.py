@@ -6,16 +6,125 @@ This module integrates with AWS EKS Cluster Insights to gather upgrade readiness
 
 import boto3
 import json
-from typing import Dict, List, Optional
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from botocore.config import Config
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from ..utils.aws_client import AWSClient
 
 
+# Upper bound on concurrent describe_insight calls
+DESCRIBE_INSIGHT_WORKERS = 32
+
+# Pool sized for the describe_insight fan-out, with keep-alive and adaptive retries
+EKS_CLIENT_CONFIG = Config(
+    max_pool_connections=DESCRIBE_INSIGHT_WORKERS,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+
+# Insights fetched per (region, profile, cluster), kept briefly so readiness
+# analysis and raw insight lookups don't repeat the same describe fan-out
+INSIGHTS_CACHE_TTL_SECONDS = 300
+INSIGHTS_CACHE_MAXSIZE = 64
+_insights_cache = OrderedDict()
+_insights_cache_lock = threading.Lock()
+
+# EKS insights carry no severity field, only insightStatus.status; ERROR and
+# WARNING map onto the readiness severities and PASSING/UNKNOWN count as LOW
+STATUS_SEVERITY = {
+    'ERROR': 'HIGH',
+    'WARNING': 'MEDIUM'
+}
+
+# Insight severity -> (readiness bucket, score penalty)
+SEVERITY_MAP = {
+    'HIGH': ('upgrade_blockers', 30),
+    'MEDIUM': ('warnings', 15),
+    'LOW': ('recommendations', 5)
+}
+
+# Ordering used by the min_severity filter
+SEVERITY_RANK = {'LOW': 0, 'MEDIUM': 1, 'HIGH': 2}
+
+# Fields copied from each insight into the readiness buckets, with their defaults
+INSIGHT_FIELD_DEFAULTS = {
+    'id': None,
+    'name': None,
+    'description': None,
+    'category': 'Unknown',
+    'recommendation': None
+}
+
+
+def _insight_severity(insight: Dict) -> str:
+    """Readiness severity of an insight, from the insightStatus list_insights already returns."""
+    return STATUS_SEVERITY.get((insight.get('insightStatus') or {}).get('status'), 'LOW')
+
+
+class InsightFetcher:
+    """
+    Thread pool that batches describe_insight calls, optionally across clusters.
+    
+    A fetcher is bound to one EKS client, so one region and profile. Use one fetcher
+    per client, pass it to each ClusterInsightsAnalyzer built on that client, and
+    close it (or use it as a context manager) when the run ends.
+    """
+    
+    def __init__(self, eks_client, workers: int = DESCRIBE_INSIGHT_WORKERS):
+        self._eks = eks_client
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+    
+    def submit(self, cluster_name: str, insight_id: str) -> Future:
+        """Queue a describe_insight call and return its future."""
+        return self._executor.submit(self._eks.describe_insight, clusterName=cluster_name, id=insight_id)
+    
+    def close(self):
+        """Shut down the worker threads once queued calls finish."""
+        self._executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
 class ClusterInsightsAnalyzer:
     """Analyzes EKS clusters using AWS Cluster Insights."""
     
-    def __init__(self, aws_client: AWSClient):
+    # EKS clients shared by analyzers built from the same AWSClient; entries go away with it
+    _CLIENT_CACHE = weakref.WeakKeyDictionary()
+    _CLIENT_CACHE_LOCK = threading.Lock()
+    
+    def __init__(self, aws_client: AWSClient, insight_fetcher: Optional[InsightFetcher] = None,
+                 eks_client=None):
+        """
+        Args:
+            aws_client: AWS client wrapper for the cluster's region and profile
+            insight_fetcher: Fetcher shared by the analyzers using the same EKS client; the
+                caller owns and closes it. Without one, each describe batch gets its own
+                short-lived pool.
+            eks_client: EKS client to use instead of the one cached for aws_client
+        """
         self.aws_client = aws_client
-        self.eks_client = aws_client.get_client('eks')
+        if eks_client is None:
+            with self._CLIENT_CACHE_LOCK:
+                eks_client = self._CLIENT_CACHE.get(aws_client)
+                if eks_client is None:
+                    eks_client = aws_client.get_client('eks', config=EKS_CLIENT_CONFIG)
+                    self._CLIENT_CACHE[aws_client] = eks_client
+        self.eks_client = eks_client
+        self.insight_fetcher = insight_fetcher
+    
+    @classmethod
+    def clear_client_cache(cls):
+        """Drop the cached EKS clients, e.g. after credentials change."""
+        with cls._CLIENT_CACHE_LOCK:
+            cls._CLIENT_CACHE.clear()
     
     def get_cluster_insights(self, cluster_name: str) -> Dict:
         """
@@ -27,6 +136,64 @@ class ClusterInsightsAnalyzer:
         Returns:
             Dictionary containing cluster insights data
         """
+        summaries, details = self._get_insight_summaries(cluster_name)
+        if 'error' in summaries:
+            return summaries
+        
+        insights = [
+            insight for insight in self._hydrate(cluster_name, summaries['insights'], details)
+            if insight is not None
+        ]
+        
+        return {
+            'cluster_name': cluster_name,
+            'insights': insights,
+            'summary': {
+                'total_insights': len(insights),
+                'categories': dict(Counter(insight.get('category', 'Unknown') for insight in insights))
+            }
+        }
+    
+    def invalidate(self, cluster_name: str):
+        """Drop cached insights for a cluster so the next call fetches fresh data."""
+        with _insights_cache_lock:
+            _insights_cache.pop(self._insights_cache_key(cluster_name), None)
+    
+    def _insights_cache_key(self, cluster_name: str) -> tuple:
+        return (self.aws_client.region, self.aws_client.profile, cluster_name)
+    
+    def _get_insight_summaries(self, cluster_name: str) -> Tuple[Dict, Dict[str, Dict]]:
+        """
+        Get the list_insights summaries for a cluster, reusing results fetched within
+        the last INSIGHTS_CACHE_TTL_SECONDS.
+        
+        Returns:
+            Tuple of the summaries data and the cluster's {insight_id: details} cache
+            that _hydrate fills in
+        """
+        cache_key = self._insights_cache_key(cluster_name)
+        now = time.monotonic()
+        with _insights_cache_lock:
+            entry = _insights_cache.get(cache_key)
+            if entry is not None and entry[0] > now:
+                _insights_cache.move_to_end(cache_key)
+                return entry[1], entry[2]
+        
+        summaries = self._list_insight_summaries(cluster_name)
+        details = {}
+        
+        # Errors are not cached so the next call retries
+        if 'error' not in summaries:
+            with _insights_cache_lock:
+                _insights_cache[cache_key] = (now + INSIGHTS_CACHE_TTL_SECONDS, summaries, details)
+                _insights_cache.move_to_end(cache_key)
+                while len(_insights_cache) > INSIGHTS_CACHE_MAXSIZE:
+                    _insights_cache.popitem(last=False)
+        
+        return summaries, details
+    
+    def _list_insight_summaries(self, cluster_name: str) -> Dict:
+        """List insight summaries for a cluster from the EKS API, without describing them."""
         try:
             # Check if the client has the list_insights method
             if not hasattr(self.eks_client, 'list_insights'):
@@ -37,42 +204,11 @@ class ClusterInsightsAnalyzer:
                     'summary': {'total_insights': 0, 'categories': {}}
                 }
             
-            # Get cluster insights
-            response = self.eks_client.list_insights(
-                clusterName=cluster_name
-            )
-            
-            insights_data = {
+            return {
                 'cluster_name': cluster_name,
-                'insights': [],
-                'summary': {
-                    'total_insights': 0,
-                    'categories': {}
-                }
+                'insights': self._list_insights(cluster_name)
             }
             
-            for insight in response.get('insights', []):
-                try:
-                    insight_detail = self.eks_client.describe_insight(
-                        clusterName=cluster_name,
-                        id=insight['id']
-                    )
-                    
-                    insights_data['insights'].append(insight_detail['insight'])
-                    
-                    # Update summary
-                    category = insight_detail['insight'].get('category', 'Unknown')
-                    insights_data['summary']['categories'][category] = \
-                        insights_data['summary']['categories'].get(category, 0) + 1
-                        
-                except Exception as e:
-                    print(f"Warning: Could not retrieve insight {insight.get('id', 'unknown')}: {str(e)}")
-                    continue
-            
-            insights_data['summary']['total_insights'] = len(insights_data['insights'])
-            
-            return insights_data
-            
         except Exception as e:
             error_msg = str(e)
             if 'list_insights' in error_msg or 'describe_insight' in error_msg:
@@ -86,17 +222,93 @@ class ClusterInsightsAnalyzer:
                 'summary': {'total_insights': 0, 'categories': {}}
             }
     
-    def analyze_upgrade_readiness(self, cluster_name: str) -> Dict:
+    def _hydrate(self, cluster_name: str, insights: List[Dict], details: Dict[str, Dict]) -> List[Optional[Dict]]:
+        """
+        Merge describe_insight details into insight summaries, describing each insight
+        at most once per cached summary list.
+        
+        details is shared through the insights cache, so it is only read and updated
+        under _insights_cache_lock.
+        
+        Returns:
+            The hydrated insights in input order, with None for any that could not be described
+        """
+        with _insights_cache_lock:
+            missing = [
+                insight for insight in
+                {insight.get('id', 'unknown'): insight for insight in insights}.values()
+                if insight.get('id', 'unknown') not in details
+            ]
+        
+        fetched = {}
+        
+        if missing:
+            # Use the run's shared fetcher if given, else a pool scoped to this batch
+            fetcher = self.insight_fetcher or InsightFetcher(
+                self.eks_client, workers=min(DESCRIBE_INSIGHT_WORKERS, len(missing))
+            )
+            try:
+                # Queue every missing describe, then collect in list order
+                futures = [
+                    (insight, fetcher.submit(cluster_name, insight.get('id', 'unknown')))
+                    for insight in missing
+                ]
+                for insight, future in futures:
+                    insight_id = insight.get('id', 'unknown')
+                    insight_detail = self._collect_insight(insight_id, future)
+                    if insight_detail is not None:
+                        fetched[insight_id] = {**insight, **insight_detail}
+            finally:
+                if fetcher is not self.insight_fetcher:
+                    fetcher.close()
+        
+        with _insights_cache_lock:
+            details.update(fetched)
+            return [details.get(insight.get('id', 'unknown')) for insight in insights]
+    
+    def _list_insights(self, cluster_name: str) -> List[Dict]:
+        """List insight summaries for a cluster across all result pages."""
+        if not self.eks_client.can_paginate('list_insights'):
+            return self.eks_client.list_insights(clusterName=cluster_name).get('insights', [])
+        
+        paginator = self.eks_client.get_paginator('list_insights')
+        return [
+            insight
+            for page in paginator.paginate(clusterName=cluster_name, PaginationConfig={'PageSize': 100})
+            for insight in page.get('insights', [])
+        ]
+    
+    def _collect_insight(self, insight_id: str, future: Future) -> Optional[Dict]:
+        """Wait for a queued describe_insight call, returning None if it failed."""
+        try:
+            return future.result()['insight']
+        except Exception as e:
+            print(f"Warning: Could not retrieve insight {insight_id}: {str(e)}")
+            return None
+    
+    def analyze_upgrade_readiness(self, cluster_name: str, only_score: bool = False,
+                                  min_severity: str = 'LOW') -> Dict:
         """
         Analyze cluster upgrade readiness using insights.
         
         Args:
             cluster_name: Name of the EKS cluster
+            only_score: Skip building the finding lists and stop once the score reaches 0
+            min_severity: Ignore insights below this severity (LOW, MEDIUM or HIGH), where
+                ERROR insights are HIGH, WARNING are MEDIUM and the rest LOW
             
         Returns:
             Dictionary containing upgrade readiness analysis
         """
-        insights = self.get_cluster_insights(cluster_name)
+        if min_severity not in SEVERITY_RANK:
+            raise ValueError(f"Invalid min_severity: {min_severity}. Must be one of: {list(SEVERITY_RANK)}")
+        
+        summaries, details = self._get_insight_summaries(cluster_name)
+        min_rank = SEVERITY_RANK[min_severity]
+        insights = [
+            insight for insight in summaries.get('insights', [])
+            if SEVERITY_RANK[_insight_severity(insight)] >= min_rank
+        ]
         
         upgrade_analysis = {
             'cluster_name': cluster_name,
@@ -106,41 +318,28 @@ class ClusterInsightsAnalyzer:
             'readiness_score': 100
         }
         
-        for insight in insights.get('insights', []):
-            severity = insight.get('severity', 'LOW')
-            category = insight.get('category', 'Unknown')
+        # Severity comes from the summaries, so the score alone never needs
+        # describe_insight; every reported finding is hydrated for its recommendation
+        if not only_score:
+            hydrated = self._hydrate(cluster_name, insights, details)
+            # A failed describe still reports the finding from its summary row
+            insights = [detail or insight for detail, insight in zip(hydrated, insights)]
+        
+        score = 100
+        for insight in insights:
+            bucket, penalty = SEVERITY_MAP[_insight_severity(insight)]
+            score -= penalty
+            if only_score:
+                if score <= 0:
+                    upgrade_analysis['readiness_score'] = 0
+                    return upgrade_analysis
+                continue
             
-            if severity == 'HIGH':
-                upgrade_analysis['upgrade_blockers'].append({
-                    'id': insight.get('id'),
-                    'name': insight.get('name'),
-                    'description': insight.get('description'),
-                    'category': category,
-                    'recommendation': insight.get('recommendation')
-                })
-                upgrade_analysis['readiness_score'] -= 30
-                
-            elif severity == 'MEDIUM':
-                upgrade_analysis['warnings'].append({
-                    'id': insight.get('id'),
-                    'name': insight.get('name'),
-                    'description': insight.get('description'),
-                    'category': category,
-                    'recommendation': insight.get('recommendation')
-                })
-                upgrade_analysis['readiness_score'] -= 15
-                
-            else:  # LOW severity
-                upgrade_analysis['recommendations'].append({
-                    'id': insight.get('id'),
-                    'name': insight.get('name'),
-                    'description': insight.get('description'),
-                    'category': category,
-                    'recommendation': insight.get('recommendation')
-                })
-                upgrade_analysis['readiness_score'] -= 5
+            upgrade_analysis[bucket].append({
+                field: insight.get(field, default) for field, default in INSIGHT_FIELD_DEFAULTS.items()
+            })
         
         # Ensure score doesn't go below 0
-        upgrade_analysis['readiness_score'] = max(0, upgrade_analysis['readiness_score'])
+        upgrade_analysis['readiness_score'] = max(0, score)
         
         return upgrade_analysis
@@ -7,9 +7,23 @@ This module integrates with kubent and pluto tools to scan for deprecated APIs.
 import subprocess
 import json
 import yaml
-from typing import Dict, List, Optional
+from collections import Counter
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 from pathlib import Path
 
+# orjson parses the scanners' JSON straight from bytes; json.loads accepts bytes too
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+def _utc_timestamp() -> str:
+    """Get the current UTC time as an ISO 8601 string ending in Z."""
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
 
 class DeprecatedAPIScanner:
     """Scans for deprecated Kubernetes APIs using kubent and pluto."""
@@ -28,68 +42,11 @@ class DeprecatedAPIScanner:
         Returns:
             Dictionary containing kubent scan results
         """
-        try:
-            cmd = ['kubent', '--target-version', target_version, '--output', 'json']
-            
-            if self.kubeconfig_path:
-                cmd.extend(['--kubeconfig', self.kubeconfig_path])
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            
-            if result.returncode == 0:
-                try:
-                    kubent_data = json.loads(result.stdout)
-                    return {
-                        'cluster_name': cluster_name,
-                        'target_version': target_version,
-                        'tool': 'kubent',
-                        'status': 'success',
-                        'deprecated_apis': kubent_data,
-                        'summary': self._summarize_kubent_results(kubent_data)
-                    }
-                except json.JSONDecodeError:
-                    return {
-                        'cluster_name': cluster_name,
-                        'target_version': target_version,
-                        'tool': 'kubent',
-                        'status': 'error',
-                        'error': 'Failed to parse kubent output as JSON',
-                        'raw_output': result.stdout
-                    }
-            else:
-                return {
-                    'cluster_name': cluster_name,
-                    'target_version': target_version,
-                    'tool': 'kubent',
-                    'status': 'error',
-                    'error': result.stderr,
-                    'return_code': result.returncode
-                }
-                
-        except subprocess.TimeoutExpired:
-            return {
-                'cluster_name': cluster_name,
-                'target_version': target_version,
-                'tool': 'kubent',
-                'status': 'error',
-                'error': 'kubent scan timed out after 300 seconds'
-            }
-        except FileNotFoundError:
-            return {
-                'cluster_name': cluster_name,
-                'target_version': target_version,
-                'tool': 'kubent',
-                'status': 'error',
-                'error': 'kubent tool not found. Please install kubent.'
-            }
-        except Exception as e:
-            return {
-                'cluster_name': cluster_name,
-                'target_version': target_version,
-                'tool': 'kubent',
-                'status': 'error',
-                'error': str(e)
-            }
+        return self._run_tool(
+            cluster_name, target_version, 'kubent',
+            ['kubent', '--target-version', target_version, '--output', 'json'],
+            self._summarize_kubent_results
+        )
     
     def run_pluto_scan(self, cluster_name: str, target_version: str) -> Dict:
         """
@@ -102,68 +59,59 @@ class DeprecatedAPIScanner:
         Returns:
             Dictionary containing pluto scan results
         """
+        return self._run_tool(
+            cluster_name, target_version, 'pluto',
+            ['pluto', 'detect-all-in-cluster', '--target-versions', f'k8s={target_version}', '--output', 'json'],
+            self._summarize_pluto_results
+        )
+    
+    def _run_tool(self, cluster_name: str, target_version: str, tool: str,
+                  cmd: List[str], summarizer: Callable[[Any], Dict]) -> Dict:
+        """Run a deprecated API scanner and parse its JSON output."""
+        result_base = {
+            'cluster_name': cluster_name,
+            'target_version': target_version,
+            'tool': tool
+        }
+        
         try:
-            cmd = ['pluto', 'detect-all-in-cluster', '--target-versions', f'k8s={target_version}', '--output', 'json']
-            
             if self.kubeconfig_path:
-                cmd.extend(['--kubeconfig', self.kubeconfig_path])
+                cmd = cmd + ['--kubeconfig', self.kubeconfig_path]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            # Keep stdout as bytes so large reports skip a separate decode step
+            result = subprocess.run(cmd, capture_output=True, timeout=300)
             
-            if result.returncode == 0:
-                try:
-                    pluto_data = json.loads(result.stdout)
-                    return {
-                        'cluster_name': cluster_name,
-                        'target_version': target_version,
-                        'tool': 'pluto',
-                        'status': 'success',
-                        'deprecated_apis': pluto_data,
-                        'summary': self._summarize_pluto_results(pluto_data)
-                    }
-                except json.JSONDecodeError:
-                    return {
-                        'cluster_name': cluster_name,
-                        'target_version': target_version,
-                        'tool': 'pluto',
-                        'status': 'error',
-                        'error': 'Failed to parse pluto output as JSON',
-                        'raw_output': result.stdout
-                    }
-            else:
+            if result.returncode != 0:
                 return {
-                    'cluster_name': cluster_name,
-                    'target_version': target_version,
-                    'tool': 'pluto',
+                    **result_base,
                     'status': 'error',
-                    'error': result.stderr,
+                    'error': result.stderr.decode('utf-8', 'replace'),
                     'return_code': result.returncode
                 }
-                
-        except subprocess.TimeoutExpired:
+            
+            try:
+                data = _json_loads(result.stdout)
+            except json.JSONDecodeError:
+                return {
+                    **result_base,
+                    'status': 'error',
+                    'error': f'Failed to parse {tool} output as JSON',
+                    'raw_output': result.stdout.decode('utf-8', 'replace')
+                }
+            
             return {
-                'cluster_name': cluster_name,
-                'target_version': target_version,
-                'tool': 'pluto',
-                'status': 'error',
-                'error': 'pluto scan timed out after 300 seconds'
+                **result_base,
+                'status': 'success',
+                'deprecated_apis': data,
+                'summary': summarizer(data)
             }
+                
+        except subprocess.TimeoutExpired:
+            return {**result_base, 'status': 'error', 'error': f'{tool} scan timed out after 300 seconds'}
         except FileNotFoundError:
-            return {
-                'cluster_name': cluster_name,
-                'target_version': target_version,
-                'tool': 'pluto',
-                'status': 'error',
-                'error': 'pluto tool not found. Please install pluto.'
-            }
+            return {**result_base, 'status': 'error', 'error': f'{tool} tool not found. Please install {tool}.'}
         except Exception as e:
-            return {
-                'cluster_name': cluster_name,
-                'target_version': target_version,
-                'tool': 'pluto',
-                'status': 'error',
-                'error': str(e)
-            }
+            return {**result_base, 'status': 'error', 'error': str(e)}
     
     def comprehensive_scan(self, cluster_name: str, target_version: str) -> Dict:
         """
@@ -176,13 +124,17 @@ class DeprecatedAPIScanner:
         Returns:
             Dictionary containing comprehensive scan results
         """
-        kubent_results = self.run_kubent_scan(cluster_name, target_version)
-        pluto_results = self.run_pluto_scan(cluster_name, target_version)
+        # Each tool walks the whole cluster on its own, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            kubent_future = executor.submit(self.run_kubent_scan, cluster_name, target_version)
+            pluto_future = executor.submit(self.run_pluto_scan, cluster_name, target_version)
+            kubent_results = kubent_future.result()
+            pluto_results = pluto_future.result()
         
         return {
             'cluster_name': cluster_name,
             'target_version': target_version,
-            'scan_timestamp': self._get_timestamp(),
+            'scan_timestamp': _utc_timestamp(),
             'kubent_results': kubent_results,
             'pluto_results': pluto_results,
             'combined_summary': self._combine_results(kubent_results, pluto_results)
@@ -190,53 +142,27 @@ class DeprecatedAPIScanner:
     
     def _summarize_kubent_results(self, kubent_data: Dict) -> Dict:
         """Summarize kubent scan results."""
-        summary = {
-            'total_deprecated': 0,
-            'by_api_version': {},
-            'by_kind': {},
-            'critical_count': 0
-        }
-        
         # Process kubent results structure
-        if isinstance(kubent_data, list):
-            for item in kubent_data:
-                summary['total_deprecated'] += 1
-                
-                api_version = item.get('apiVersion', 'unknown')
-                kind = item.get('kind', 'unknown')
-                
-                summary['by_api_version'][api_version] = summary['by_api_version'].get(api_version, 0) + 1
-                summary['by_kind'][kind] = summary['by_kind'].get(kind, 0) + 1
-                
-                if item.get('deprecated', False):
-                    summary['critical_count'] += 1
+        items = kubent_data if isinstance(kubent_data, list) else []
         
-        return summary
+        return {
+            'total_deprecated': len(items),
+            'by_api_version': dict(Counter(item.get('apiVersion', 'unknown') for item in items)),
+            'by_kind': dict(Counter(item.get('kind', 'unknown') for item in items)),
+            'critical_count': sum(1 for item in items if item.get('deprecated', False))
+        }
     
     def _summarize_pluto_results(self, pluto_data: Dict) -> Dict:
         """Summarize pluto scan results."""
-        summary = {
-            'total_deprecated': 0,
-            'by_api_version': {},
-            'by_kind': {},
-            'critical_count': 0
-        }
-        
         # Process pluto results structure
         items = pluto_data.get('items', [])
-        for item in items:
-            summary['total_deprecated'] += 1
-            
-            api_version = item.get('api-version', 'unknown')
-            kind = item.get('kind', 'unknown')
-            
-            summary['by_api_version'][api_version] = summary['by_api_version'].get(api_version, 0) + 1
-            summary['by_kind'][kind] = summary['by_kind'].get(kind, 0) + 1
-            
-            if item.get('deprecated', False):
-                summary['critical_count'] += 1
         
-        return summary
+        return {
+            'total_deprecated': len(items),
+            'by_api_version': dict(Counter(item.get('api-version', 'unknown') for item in items)),
+            'by_kind': dict(Counter(item.get('kind', 'unknown') for item in items)),
+            'critical_count': sum(1 for item in items if item.get('deprecated', False))
+        }
     
     def _combine_results(self, kubent_results: Dict, pluto_results: Dict) -> Dict:
         """Combine results from both tools."""
@@ -279,8 +205,3 @@ class DeprecatedAPIScanner:
             )
         
         return combined
-    
-    def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat() + 'Z'
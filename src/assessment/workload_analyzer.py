@@ -5,97 +5,150 @@ This module analyzes workloads for upgrade readiness including PodDisruptionBudg
 topology constraints, and other workload-specific considerations.
 """
 
-from typing import Dict, List, Optional
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 
+# orjson parses the raw list responses straight from bytes; json.loads accepts bytes too
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+logger = logging.getLogger(__name__)
+
+# Connections kept per host by the shared ApiClient; comprehensive analysis
+# issues its list calls concurrently
+K8S_CONNECTION_POOL_MAXSIZE = 10
+
+# Items requested per page from list calls
+LIST_PAGE_SIZE = 500
+
+# Finished pods don't occupy nodes, so they are left out of the distribution
+RUNNING_POD_FIELD_SELECTOR = 'status.phase!=Failed,status.phase!=Succeeded'
+
+# How long list results are reused by repeat analyses on the same analyzer
+LIST_CACHE_TTL_SECONDS = 60
+
+# Percentage form of a PDB minAvailable, e.g. "80%"
+_PCT_RE = re.compile(r'^(\d+)%$')
+
+# Owner kind -> workload type reported for the pod
+_KIND_TO_WORKLOAD = {
+    'ReplicaSet': 'deployment',
+    'Deployment': 'deployment',
+    'DaemonSet': 'daemonset',
+    'StatefulSet': 'statefulset',
+    'Job': 'job'
+}
+
+
+def _pdb_to_info(pdb: Dict) -> Dict:
+    """Build the PDB summary dict from a raw PodDisruptionBudget dict."""
+    spec = pdb.get('spec') or {}
+    status = pdb.get('status')
+    return {
+        'name': pdb['metadata'].get('name'),
+        'namespace': pdb['metadata'].get('namespace'),
+        'min_available': spec.get('minAvailable'),
+        'max_unavailable': spec.get('maxUnavailable'),
+        'current_healthy': status.get('currentHealthy') if status else 0,
+        'desired_healthy': status.get('desiredHealthy') if status else 0,
+        'disruptions_allowed': status.get('disruptionsAllowed') if status else 0
+    }
+
+
+def _check_pdb(pdb_info: Dict) -> List[Dict]:
+    """Return the issues a PDB may cause during node upgrades."""
+    issues = []
+    
+    if pdb_info['disruptions_allowed'] == 0:
+        issues.append({
+            'pdb': f"{pdb_info['namespace']}/{pdb_info['name']}",
+            'issue': 'No disruptions allowed - may block node upgrades',
+            'severity': 'high'
+        })
+    
+    # minAvailable may also be a plain pod count (int); malformed percentages are ignored
+    pct_match = isinstance(pdb_info['min_available'], str) and _PCT_RE.match(pdb_info['min_available'])
+    if pct_match:
+        percentage = int(pct_match.group(1))
+        if percentage > 80:
+            issues.append({
+                'pdb': f"{pdb_info['namespace']}/{pdb_info['name']}",
+                'issue': f'High min_available percentage ({percentage}%) may limit upgrade flexibility',
+                'severity': 'medium'
+            })
+    
+    return issues
+
+
+class KubeConfigError(Exception):
+    """Raised when no usable Kubernetes configuration could be loaded."""
+
 
 class WorkloadAnalyzer:
     """Analyzes workloads for EKS upgrade readiness."""
     
     def __init__(self, kubeconfig_path: Optional[str] = None):
         self.kubeconfig_path = kubeconfig_path
+        self._list_cache = {}
+        self._list_cache_lock = threading.Lock()
         self._load_kubernetes_config()
     
     def _load_kubernetes_config(self):
-        """Load Kubernetes configuration."""
+        """Load Kubernetes configuration, raising KubeConfigError if it can't be loaded."""
         try:
             if self.kubeconfig_path:
                 config.load_kube_config(config_file=self.kubeconfig_path)
             else:
                 config.load_kube_config()
             
-            self.v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()
-            self.policy_v1 = client.PolicyV1Api()
-            self.networking_v1 = client.NetworkingV1Api()
+            # One ApiClient (and connection pool) shared by every API group
+            configuration = client.Configuration.get_default_copy()
+            configuration.connection_pool_maxsize = K8S_CONNECTION_POOL_MAXSIZE
+            api_client = client.ApiClient(configuration)
+            
+            self.v1 = client.CoreV1Api(api_client)
+            self.apps_v1 = client.AppsV1Api(api_client)
+            self.policy_v1 = client.PolicyV1Api(api_client)
+            self.networking_v1 = client.NetworkingV1Api(api_client)
             
         except Exception as e:
-            print(f"Failed to load Kubernetes config: {e}")
-            self.v1 = None
-            self.apps_v1 = None
-            self.policy_v1 = None
-            self.networking_v1 = None
+            raise KubeConfigError(f"Failed to load Kubernetes config: {e}") from e
     
-    def analyze_pod_disruption_budgets(self, cluster_name: str) -> Dict:
+    def analyze_pod_disruption_budgets(self, cluster_name: str,
+                                       list_pdbs: Optional[Callable] = None) -> Dict:
         """
         Analyze PodDisruptionBudgets for upgrade impact.
         
         Args:
             cluster_name: Name of the EKS cluster
+            list_pdbs: Optional callable returning already requested PDBs as raw dicts
             
         Returns:
             Dictionary containing PDB analysis
         """
-        if not self.policy_v1:
-            return {
-                'cluster_name': cluster_name,
-                'error': 'Kubernetes client not available',
-                'pdbs': []
-            }
-        
         try:
-            pdbs = self.policy_v1.list_pod_disruption_budget_for_all_namespaces()
+            pdbs = list_pdbs() if list_pdbs else \
+                self._list_cached(self.policy_v1.list_pod_disruption_budget_for_all_namespaces)
+            
+            pdb_infos = [_pdb_to_info(pdb) for pdb in pdbs]
             
             analysis = {
                 'cluster_name': cluster_name,
-                'total_pdbs': len(pdbs.items),
-                'pdbs': [],
-                'potential_issues': [],
+                'total_pdbs': len(pdbs),
+                'pdbs': pdb_infos,
+                'potential_issues': [issue for pdb_info in pdb_infos for issue in _check_pdb(pdb_info)],
                 'recommendations': []
             }
             
-            for pdb in pdbs.items:
-                pdb_info = {
-                    'name': pdb.metadata.name,
-                    'namespace': pdb.metadata.namespace,
-                    'min_available': pdb.spec.min_available,
-                    'max_unavailable': pdb.spec.max_unavailable,
-                    'current_healthy': pdb.status.current_healthy if pdb.status else 0,
-                    'desired_healthy': pdb.status.desired_healthy if pdb.status else 0,
-                    'disruptions_allowed': pdb.status.disruptions_allowed if pdb.status else 0
-                }
-                
-                analysis['pdbs'].append(pdb_info)
-                
-                # Check for potential issues
-                if pdb_info['disruptions_allowed'] == 0:
-                    analysis['potential_issues'].append({
-                        'pdb': f"{pdb_info['namespace']}/{pdb_info['name']}",
-                        'issue': 'No disruptions allowed - may block node upgrades',
-                        'severity': 'high'
-                    })
-                
-                if pdb_info['min_available'] and isinstance(pdb_info['min_available'], str):
-                    if pdb_info['min_available'].endswith('%'):
-                        percentage = int(pdb_info['min_available'].rstrip('%'))
-                        if percentage > 80:
-                            analysis['potential_issues'].append({
-                                'pdb': f"{pdb_info['namespace']}/{pdb_info['name']}",
-                                'issue': f'High min_available percentage ({percentage}%) may limit upgrade flexibility',
-                                'severity': 'medium'
-                            })
-            
             # Add recommendations
             if analysis['potential_issues']:
                 analysis['recommendations'].append(
@@ -120,33 +173,31 @@ class WorkloadAnalyzer:
                 'pdbs': []
             }
     
-    def analyze_workload_distribution(self, cluster_name: str) -> Dict:
+    def analyze_workload_distribution(self, cluster_name: str,
+                                      list_pods: Optional[Callable] = None,
+                                      list_nodes: Optional[Callable] = None) -> Dict:
         """
         Analyze workload distribution across nodes and zones.
         
         Args:
             cluster_name: Name of the EKS cluster
+            list_pods: Optional callable returning already requested pods as raw dicts
+            list_nodes: Optional callable returning already requested nodes as raw dicts
             
         Returns:
             Dictionary containing workload distribution analysis
         """
-        if not self.v1 or not self.apps_v1:
-            return {
-                'cluster_name': cluster_name,
-                'error': 'Kubernetes client not available'
-            }
-        
         try:
             # Get all pods
-            pods = self.v1.list_pod_for_all_namespaces()
+            pods = (list_pods or self._list_running_pods)()
             
             # Get all nodes
-            nodes = self.v1.list_node()
+            nodes = list_nodes() if list_nodes else self._list_cached(self.v1.list_node)
             
             analysis = {
                 'cluster_name': cluster_name,
-                'total_pods': len(pods.items),
-                'total_nodes': len(nodes.items),
+                'total_pods': len(pods),
+                'total_nodes': len(nodes),
                 'node_distribution': {},
                 'zone_distribution': {},
                 'namespace_distribution': {},
@@ -155,46 +206,41 @@ class WorkloadAnalyzer:
                 'recommendations': []
             }
             
-            # Analyze pod distribution
-            for pod in pods.items:
-                if pod.spec.node_name:
-                    node_name = pod.spec.node_name
-                    namespace = pod.metadata.namespace
-                    
-                    # Count by node
-                    analysis['node_distribution'][node_name] = \
-                        analysis['node_distribution'].get(node_name, 0) + 1
-                    
-                    # Count by namespace
-                    analysis['namespace_distribution'][namespace] = \
-                        analysis['namespace_distribution'].get(namespace, 0) + 1
-                    
-                    # Determine workload type
-                    owner_refs = pod.metadata.owner_references or []
-                    workload_type = 'standalone-pod'
+            # Zone of each node; every zone with a node is reported, even with no pods
+            node_to_zone = {
+                node['metadata'].get('name'):
+                    (node['metadata'].get('labels') or {}).get('topology.kubernetes.io/zone', 'unknown')
+                for node in nodes
+            }
+            zone_distribution = dict.fromkeys(node_to_zone.values(), 0)
+            
+            # Analyze pod distribution; collect keys in one pass and count them at the end
+            node_names = []
+            namespaces = []
+            workload_types = []
+            for pod in pods:
+                node_name = pod['spec'].get('nodeName')
+                if node_name:
+                    node_names.append(node_name)
+                    namespaces.append(pod['metadata'].get('namespace'))
                     
-                    for owner in owner_refs:
-                        if owner.kind in ['ReplicaSet', 'Deployment']:
-                            workload_type = 'deployment'
-                        elif owner.kind == 'DaemonSet':
-                            workload_type = 'daemonset'
-                        elif owner.kind == 'StatefulSet':
-                            workload_type = 'statefulset'
-                        elif owner.kind == 'Job':
-                            workload_type = 'job'
-                        break
+                    # Count by zone; pods on nodes missing from the node list aren't counted
+                    zone = node_to_zone.get(node_name)
+                    if zone is not None:
+                        zone_distribution[zone] += 1
                     
-                    analysis['workload_types'][workload_type] = \
-                        analysis['workload_types'].get(workload_type, 0) + 1
+                    # Determine workload type from the first owner of a known kind
+                    owner_refs = pod['metadata'].get('ownerReferences') or []
+                    workload_types.append(next(
+                        (_KIND_TO_WORKLOAD[owner['kind']] for owner in owner_refs
+                         if owner.get('kind') in _KIND_TO_WORKLOAD),
+                        'standalone-pod'
+                    ))
             
-            # Analyze zone distribution
-            for node in nodes.items:
-                zone = node.metadata.labels.get('topology.kubernetes.io/zone', 'unknown')
-                node_name = node.metadata.name
-                pod_count = analysis['node_distribution'].get(node_name, 0)
-                
-                analysis['zone_distribution'][zone] = \
-                    analysis['zone_distribution'].get(zone, 0) + pod_count
+            analysis['node_distribution'] = dict(Counter(node_names))
+            analysis['namespace_distribution'] = dict(Counter(namespaces))
+            analysis['workload_types'] = dict(Counter(workload_types))
+            analysis['zone_distribution'] = zone_distribution
             
             # Check for potential issues
             self._check_distribution_issues(analysis)
@@ -212,28 +258,28 @@ class WorkloadAnalyzer:
                 'error': f'Unexpected error: {e}'
             }
     
-    def analyze_resource_constraints(self, cluster_name: str) -> Dict:
+    def analyze_resource_constraints(self, cluster_name: str,
+                                     list_quotas: Optional[Callable] = None,
+                                     list_limit_ranges: Optional[Callable] = None) -> Dict:
         """
         Analyze resource constraints that might affect upgrades.
         
         Args:
             cluster_name: Name of the EKS cluster
+            list_quotas: Optional callable returning already requested resource quotas as raw dicts
+            list_limit_ranges: Optional callable returning already requested limit ranges as raw dicts
             
         Returns:
             Dictionary containing resource constraint analysis
         """
-        if not self.v1:
-            return {
-                'cluster_name': cluster_name,
-                'error': 'Kubernetes client not available'
-            }
-        
         try:
             # Get resource quotas
-            quotas = self.v1.list_resource_quota_for_all_namespaces()
+            quotas = list_quotas() if list_quotas else \
+                self._list_cached(self.v1.list_resource_quota_for_all_namespaces)
             
             # Get limit ranges
-            limit_ranges = self.v1.list_limit_range_for_all_namespaces()
+            limit_ranges = list_limit_ranges() if list_limit_ranges else \
+                self._list_cached(self.v1.list_limit_range_for_all_namespaces)
             
             analysis = {
                 'cluster_name': cluster_name,
@@ -244,56 +290,57 @@ class WorkloadAnalyzer:
             }
             
             # Analyze resource quotas
-            for quota in quotas.items:
+            for quota in quotas:
+                hard = (quota.get('spec') or {}).get('hard') or {}
+                used_by_resource = (quota.get('status') or {}).get('used') or {}
+                namespace = quota['metadata'].get('namespace')
                 quota_info = {
-                    'name': quota.metadata.name,
-                    'namespace': quota.metadata.namespace,
-                    'hard_limits': dict(quota.spec.hard) if quota.spec.hard else {},
-                    'used': dict(quota.status.used) if quota.status and quota.status.used else {}
+                    'name': quota['metadata'].get('name'),
+                    'namespace': namespace,
+                    'hard_limits': hard,
+                    'used': used_by_resource
                 }
                 
                 analysis['resource_quotas'].append(quota_info)
                 
                 # Check for tight quotas
-                if quota.status and quota.status.used and quota.spec.hard:
-                    for resource, used_str in quota.status.used.items():
-                        if resource in quota.spec.hard:
-                            hard_limit_str = quota.spec.hard[resource]
-                            
-                            # Simple numeric comparison (could be enhanced for different units)
-                            try:
-                                used = int(used_str)
-                                hard_limit = int(hard_limit_str)
-                                
-                                if used / hard_limit > 0.8:  # 80% threshold
-                                    analysis['potential_constraints'].append({
-                                        'type': 'resource_quota',
-                                        'namespace': quota.metadata.namespace,
-                                        'resource': resource,
-                                        'usage_percentage': (used / hard_limit) * 100,
-                                        'issue': f'High resource quota usage for {resource}'
-                                    })
-                            except ValueError:
-                                # Skip non-numeric resources
-                                pass
+                if used_by_resource and hard:
+                    for resource, used_str in used_by_resource.items():
+                        hard_limit_str = hard.get(resource)
+                        
+                        # Simple numeric comparison (could be enhanced for different units);
+                        # quantities with units and zero limits are skipped
+                        if not (hard_limit_str and str(used_str).isdigit() and str(hard_limit_str).isdigit()):
+                            continue
+                        used = int(used_str)
+                        hard_limit = int(hard_limit_str)
+                        
+                        # 80% threshold, compared as integers so only hot quotas pay for a division
+                        if hard_limit and used * 5 > hard_limit * 4:
+                            analysis['potential_constraints'].append({
+                                'type': 'resource_quota',
+                                'namespace': namespace,
+                                'resource': resource,
+                                'usage_percentage': (used / hard_limit) * 100,
+                                'issue': f'High resource quota usage for {resource}'
+                            })
             
             # Analyze limit ranges
-            for lr in limit_ranges.items:
+            for lr in limit_ranges:
                 lr_info = {
-                    'name': lr.metadata.name,
-                    'namespace': lr.metadata.namespace,
+                    'name': lr['metadata'].get('name'),
+                    'namespace': lr['metadata'].get('namespace'),
                     'limits': []
                 }
                 
-                if lr.spec.limits:
-                    for limit in lr.spec.limits:
-                        lr_info['limits'].append({
-                            'type': limit.type,
-                            'default': dict(limit.default) if limit.default else {},
-                            'default_request': dict(limit.default_request) if limit.default_request else {},
-                            'max': dict(limit.max) if limit.max else {},
-                            'min': dict(limit.min) if limit.min else {}
-                        })
+                for limit in (lr.get('spec') or {}).get('limits') or []:
+                    lr_info['limits'].append({
+                        'type': limit.get('type'),
+                        'default': limit.get('default') or {},
+                        'default_request': limit.get('defaultRequest') or {},
+                        'max': limit.get('max') or {},
+                        'min': limit.get('min') or {}
+                    })
                 
                 analysis['limit_ranges'].append(lr_info)
             
@@ -329,9 +376,7 @@ class WorkloadAnalyzer:
         Returns:
             Dictionary containing comprehensive workload analysis
         """
-        pdb_analysis = self.analyze_pod_disruption_budgets(cluster_name)
-        distribution_analysis = self.analyze_workload_distribution(cluster_name)
-        constraint_analysis = self.analyze_resource_constraints(cluster_name)
+        pdb_analysis, distribution_analysis, constraint_analysis = self._run_analyses(cluster_name)
         
         return {
             'cluster_name': cluster_name,
@@ -344,22 +389,87 @@ class WorkloadAnalyzer:
             )
         }
     
+    def _run_analyses(self, cluster_name: str) -> Tuple[Dict, Dict, Dict]:
+        """Run the PDB, distribution and constraint analyses for comprehensive_workload_analysis."""
+        # Issue all five list calls at once; each analyzer waits on the results it
+        # needs and reports a failed call as its own error
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            pdbs = executor.submit(self._list_cached, self.policy_v1.list_pod_disruption_budget_for_all_namespaces)
+            pods = executor.submit(self._list_running_pods)
+            nodes = executor.submit(self._list_cached, self.v1.list_node)
+            quotas = executor.submit(self._list_cached, self.v1.list_resource_quota_for_all_namespaces)
+            limit_ranges = executor.submit(self._list_cached, self.v1.list_limit_range_for_all_namespaces)
+            
+            return (
+                self.analyze_pod_disruption_budgets(cluster_name, pdbs.result),
+                self.analyze_workload_distribution(cluster_name, pods.result, nodes.result),
+                self.analyze_resource_constraints(cluster_name, quotas.result, limit_ranges.result)
+            )
+    
+    def _list_running_pods(self) -> List[Dict]:
+        """List pods that are not yet finished, as raw dicts."""
+        return self._list_cached(
+            self.v1.list_pod_for_all_namespaces, field_selector=RUNNING_POD_FIELD_SELECTOR
+        )
+    
+    def invalidate(self):
+        """Drop cached list results so the next analysis lists everything again."""
+        with self._list_cache_lock:
+            self._list_cache.clear()
+    
+    def _list_cached(self, list_method: Callable, **kwargs) -> List[Dict]:
+        """
+        Return _list_raw results, reusing ones fetched within the last
+        LIST_CACHE_TTL_SECONDS so repeat analyses don't list the cluster again.
+        """
+        cache_key = (list_method, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self._list_cache_lock:
+            entry = self._list_cache.get(cache_key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+        
+        items = self._list_raw(list_method, **kwargs)
+        with self._list_cache_lock:
+            self._list_cache[cache_key] = (now + LIST_CACHE_TTL_SECONDS, items)
+        return items
+    
+    def _list_raw(self, list_method: Callable, **kwargs) -> List[Dict]:
+        """
+        Page through a list call and return its items as plain dicts.
+        
+        The responses are parsed as raw JSON, which skips the client's model
+        deserialization for fields the analyzers never read.
+        """
+        items = []
+        continue_token = None
+        while True:
+            response = list_method(
+                limit=LIST_PAGE_SIZE, _continue=continue_token, _preload_content=False, **kwargs
+            )
+            try:
+                page = _json_loads(response.data)
+            finally:
+                # Return the connection to the shared pool even if the body doesn't parse
+                response.release_conn()
+            
+            items.extend(page.get('items') or [])
+            continue_token = (page.get('metadata') or {}).get('continue')
+            if not continue_token:
+                return items
+    
     def _check_distribution_issues(self, analysis: Dict):
         """Check for workload distribution issues."""
         # Check for uneven node distribution
-        if analysis['node_distribution']:
-            pod_counts = list(analysis['node_distribution'].values())
-            if pod_counts:
-                avg_pods = sum(pod_counts) / len(pod_counts)
-                max_pods = max(pod_counts)
-                min_pods = min(pod_counts)
-                
-                if max_pods > avg_pods * 2:
-                    analysis['potential_issues'].append({
-                        'type': 'uneven_distribution',
-                        'issue': 'Uneven pod distribution across nodes may cause upgrade issues',
-                        'severity': 'medium'
-                    })
+        pod_counts = analysis['node_distribution'].values()
+        if pod_counts:
+            # max > 2 * average, compared as integers
+            if max(pod_counts) * len(pod_counts) > 2 * sum(pod_counts):
+                analysis['potential_issues'].append({
+                    'type': 'uneven_distribution',
+                    'issue': 'Uneven pod distribution across nodes may cause upgrade issues',
+                    'severity': 'medium'
+                })
         
         # Check for single points of failure
         if analysis['workload_types'].get('standalone-pod', 0) > 0:
@@ -398,16 +508,50 @@ class WorkloadAnalyzer:
         ])
         
         # Remove duplicates while preserving order
-        seen = set()
-        unique_recommendations = []
-        for rec in recommendations:
-            if rec not in seen:
-                seen.add(rec)
-                unique_recommendations.append(rec)
-        
-        return unique_recommendations
+        return list(dict.fromkeys(recommendations))
     
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
         from datetime import datetime
         return datetime.utcnow().isoformat() + 'Z'
+
+
+class UnavailableWorkloadAnalyzer(WorkloadAnalyzer):
+    """Stand-in used when no Kubernetes config could be loaded; every analysis reports the error."""
+    
+    def __init__(self, error: str = 'Kubernetes client not available'):
+        self.kubeconfig_path = None
+        self.error = error
+    
+    def analyze_pod_disruption_budgets(self, cluster_name: str,
+                                       list_pdbs: Optional[Callable] = None) -> Dict:
+        return {'cluster_name': cluster_name, 'error': self.error, 'pdbs': []}
+    
+    def analyze_workload_distribution(self, cluster_name: str,
+                                      list_pods: Optional[Callable] = None,
+                                      list_nodes: Optional[Callable] = None) -> Dict:
+        return {'cluster_name': cluster_name, 'error': self.error}
+    
+    def analyze_resource_constraints(self, cluster_name: str,
+                                     list_quotas: Optional[Callable] = None,
+                                     list_limit_ranges: Optional[Callable] = None) -> Dict:
+        return {'cluster_name': cluster_name, 'error': self.error}
+    
+    def invalidate(self):
+        pass
+    
+    def _run_analyses(self, cluster_name: str) -> Tuple[Dict, Dict, Dict]:
+        return (
+            self.analyze_pod_disruption_budgets(cluster_name),
+            self.analyze_workload_distribution(cluster_name),
+            self.analyze_resource_constraints(cluster_name)
+        )
+
+
+def create_workload_analyzer(kubeconfig_path: Optional[str] = None) -> WorkloadAnalyzer:
+    """Create a WorkloadAnalyzer, or an UnavailableWorkloadAnalyzer if the Kubernetes config can't be loaded."""
+    try:
+        return WorkloadAnalyzer(kubeconfig_path)
+    except KubeConfigError as e:
+        logger.warning("%s", e)
+        return UnavailableWorkloadAnalyzer(str(e))
@@ -4,10 +4,18 @@ Analyzes individual cluster addons against the pre-fetched addon version data.
 """
 
 import json
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import click
 
+# Analyzer set up in each worker process by analyze_many_clusters
+_worker_analyzer = None
+
+# Addon statuses that mean the addon needs a version change for the upgrade
+_UPGRADE_STATUSES = frozenset({'error', 'warning'})
+
 
 class ClusterAddonCompatibilityAnalyzer:
     """Analyzes cluster addon compatibility using pre-fetched version data."""
@@ -15,6 +23,20 @@ class ClusterAddonCompatibilityAnalyzer:
     def __init__(self, addon_versions_data: Dict[str, Any]):
         self.addon_versions_data = addon_versions_data
         self.addon_versions_matrix = addon_versions_data.get('addon_versions', {})
+        
+        # {eks_version: {addon_name: (addon_info, min_parsed, max_parsed)}}, parsed once
+        # so every cluster analyzed against this data reuses it
+        self._parsed_matrix = {
+            eks_version: {
+                addon_name: (
+                    addon_info,
+                    _parse_version(addon_info.get('min_addon_version')),
+                    _parse_version(addon_info.get('max_addon_version'))
+                )
+                for addon_name, addon_info in addons.items()
+            }
+            for eks_version, addons in self.addon_versions_matrix.items()
+        }
     
     def analyze_cluster_addon_compatibility(self, cluster_name: str, current_eks_version: str, 
                                           target_eks_version: str, current_addons: List[Dict]) -> Dict[str, Any]:
@@ -38,7 +60,7 @@ class ClusterAddonCompatibilityAnalyzer:
         }
         
         # Get target version addon requirements
-        target_addon_requirements = self.addon_versions_matrix.get(target_eks_version, {})
+        target_addon_requirements = self._parsed_matrix.get(target_eks_version, {})
         
         if not target_addon_requirements:
             click.echo(f"      ⚠️  No addon version data available for EKS {target_eks_version}")
@@ -66,7 +88,7 @@ class ClusterAddonCompatibilityAnalyzer:
                     'issue': addon_analysis['message'],
                     'action_required': addon_analysis['action_required']
                 })
-            elif status in ['error', 'warning']:
+            if status in _UPGRADE_STATUSES:
                 analysis_results['upgrade_required'] = True
         
         return analysis_results
@@ -76,7 +98,8 @@ class ClusterAddonCompatibilityAnalyzer:
         """Analyze compatibility for a single addon."""
         
         # Get target version requirements for this addon
-        target_addon_info = target_addon_requirements.get(addon_name)
+        target_entry = target_addon_requirements.get(addon_name)
+        target_addon_info = target_entry[0] if target_entry else None
         
         if not target_addon_info:
             return {
@@ -111,7 +134,8 @@ class ClusterAddonCompatibilityAnalyzer:
         
         # Determine compatibility status
         compatibility_result = self._determine_compatibility_status(
-            current_version, target_min, target_max, target_default, addon_name
+            current_version, target_min, target_max, target_default, addon_name,
+            target_entry[1], target_entry[2]
         )
         
         return {
@@ -130,80 +154,59 @@ class ClusterAddonCompatibilityAnalyzer:
         }
     
     def _determine_compatibility_status(self, current_version: str, target_min: str, 
-                                      target_max: str, target_default: str, addon_name: str) -> Dict[str, str]:
+                                      target_max: str, target_default: str, addon_name: str,
+                                      min_parsed: Optional[Tuple[int, ...]],
+                                      max_parsed: Optional[Tuple[int, ...]]) -> Dict[str, str]:
         """Determine compatibility status and required actions."""
-        try:
-            # Compare versions
-            if self._is_version_in_range(current_version, target_min, target_max):
-                return {
-                    'status': 'pass',
-                    'message': f'Current version {current_version} is compatible with target EKS version',
-                    'action_required': 'No action required - addon is compatible'
-                }
-            elif self._is_version_less_than(current_version, target_min):
-                return {
-                    'status': 'error',
-                    'message': f'Current version {current_version} is below minimum required version {target_min}',
-                    'action_required': f'UPGRADE REQUIRED: Update to version {target_default or target_min} or higher before EKS upgrade'
-                }
-            elif self._is_version_greater_than(current_version, target_max):
-                return {
-                    'status': 'warning',
-                    'message': f'Current version {current_version} is above maximum supported version {target_max}',
-                    'action_required': f'DOWNGRADE RECOMMENDED: Consider using version {target_default or target_max} for better compatibility'
-                }
-            else:
-                return {
-                    'status': 'warning',
-                    'message': f'Version compatibility unclear between {current_version} and range {target_min}-{target_max}',
-                    'action_required': f'VERIFICATION REQUIRED: Consider updating to recommended version {target_default}'
-                }
-        except Exception as e:
-            return {
-                'status': 'unknown',
-                'message': f'Unable to compare versions: {str(e)}',
-                'action_required': 'Manual verification required - version comparison failed'
-            }
-    
-    def _is_version_in_range(self, version: str, min_version: str, max_version: str) -> bool:
-        """Check if version is within the specified range."""
-        try:
-            def parse_version(v):
-                return [int(x) for x in v.lstrip('v').split('-')[0].split('.')]
-            
-            v_parsed = parse_version(version)
-            min_parsed = parse_version(min_version)
-            max_parsed = parse_version(max_version)
-            
-            return min_parsed <= v_parsed <= max_parsed
-        except Exception:
-            return False
-    
-    def _is_version_less_than(self, version1: str, version2: str) -> bool:
-        """Check if version1 is less than version2."""
-        try:
-            def parse_version(v):
-                return [int(x) for x in v.lstrip('v').split('-')[0].split('.')]
-            
-            v1_parsed = parse_version(version1)
-            v2_parsed = parse_version(version2)
-            
-            return v1_parsed < v2_parsed
-        except Exception:
-            return False
+        return _compatibility_status(
+            current_version, target_min, target_max, target_default, min_parsed, max_parsed
+        )
+
+
+@lru_cache(maxsize=4096)
+def _parse_version(version: str) -> Optional[Tuple[int, ...]]:
+    """Parse an addon version like v1.18.0-eksbuild.1 into (1, 18, 0), or None if it isn't numeric."""
+    try:
+        return tuple(int(x) for x in version.lstrip('v').split('-', 1)[0].split('.'))
+    except Exception:
+        return None
+
+
+# Statuses are cached per version/bounds combination; fleets run the same
+# addon versions on many clusters. The returned dicts are shared, so don't mutate them.
+@lru_cache(maxsize=4096)
+def _compatibility_status(current_version: str, target_min: str, target_max: str,
+                          target_default: str, min_parsed: Optional[Tuple[int, ...]],
+                          max_parsed: Optional[Tuple[int, ...]]) -> Dict[str, str]:
+    """Determine compatibility status and required actions for one addon version."""
+    # An unparseable version (None) fails every comparison it's in
+    current_parsed = _parse_version(current_version)
     
-    def _is_version_greater_than(self, version1: str, version2: str) -> bool:
-        """Check if version1 is greater than version2."""
-        try:
-            def parse_version(v):
-                return [int(x) for x in v.lstrip('v').split('-')[0].split('.')]
-            
-            v1_parsed = parse_version(version1)
-            v2_parsed = parse_version(version2)
-            
-            return v1_parsed > v2_parsed
-        except Exception:
-            return False
+    if current_parsed is not None and min_parsed is not None and max_parsed is not None \
+            and min_parsed <= current_parsed <= max_parsed:
+        return {
+            'status': 'pass',
+            'message': f'Current version {current_version} is compatible with target EKS version',
+            'action_required': 'No action required - addon is compatible'
+        }
+    elif current_parsed is not None and min_parsed is not None and current_parsed < min_parsed:
+        return {
+            'status': 'error',
+            'message': f'Current version {current_version} is below minimum required version {target_min}',
+            'action_required': f'UPGRADE REQUIRED: Update to version {target_default or target_min} or higher before EKS upgrade'
+        }
+    elif current_parsed is not None and max_parsed is not None and current_parsed > max_parsed:
+        return {
+            'status': 'warning',
+            'message': f'Current version {current_version} is above maximum supported version {target_max}',
+            'action_required': f'DOWNGRADE RECOMMENDED: Consider using version {target_default or target_max} for better compatibility'
+        }
+    else:
+        return {
+            'status': 'warning',
+            'message': f'Version compatibility unclear between {current_version} and range {target_min}-{target_max}',
+            'action_required': f'VERIFICATION REQUIRED: Consider updating to recommended version {target_default}'
+        }
 
 
 def analyze_cluster_addons(cluster_name: str, current_eks_version: str, target_eks_version: str,
@@ -214,3 +217,39 @@ def analyze_cluster_addons(cluster_name: str, current_eks_version: str, target_e
     return analyzer.analyze_cluster_addon_compatibility(
         cluster_name, current_eks_version, target_eks_version, current_addons
     )
+
+
+def analyze_many_clusters(clusters: List[Tuple[str, str, str, List[Dict]]],
+                          addon_versions_data: Dict[str, Any],
+                          max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Analyze addon compatibility for many clusters.
+    
+    Clusters are analyzed sequentially unless max_workers is given; per-cluster
+    analysis is cheap enough that process startup usually outweighs the gain.
+    
+    Args:
+        clusters: (cluster_name, current_eks_version, target_eks_version, current_addons) per cluster
+        addon_versions_data: Pre-fetched addon version data
+        max_workers: Worker process count; opt-in, pass a value above 1 for large fleets
+        
+    Returns:
+        Analysis results in the same order as clusters
+    """
+    # The version matrix is parsed once here and shared by every cluster
+    analyzer = ClusterAddonCompatibilityAnalyzer(addon_versions_data)
+    if not max_workers or max_workers < 2 or len(clusters) < 2:
+        return [analyzer.analyze_cluster_addon_compatibility(*cluster) for cluster in clusters]
+    
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(analyzer,)) as executor:
+        return list(executor.map(_analyze_in_worker, clusters, chunksize=8))
+
+
+def _init_worker(analyzer: ClusterAddonCompatibilityAnalyzer):
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _analyze_in_worker(cluster: Tuple[str, str, str, List[Dict]]) -> Dict[str, Any]:
+    return _worker_analyzer.analyze_cluster_addon_compatibility(*cluster)
@@ -7,27 +7,85 @@ to generate comprehensive EKS cluster metadata in JSON format.
 """
 
 import json
+import logging
+import queue
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import click
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the src directory to the path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from utils.aws_client import AWSClient
+from utils.aws_client import AWSClient, AWSCredentialsError, METADATA_MAX_WORKERS
 from config.parser import ConfigParser, EKSUpgradeConfig
 
+# Upper bound on clusters collected at once, to stay clear of EKS API throttling
+MAX_CONCURRENT_CLUSTERS = 10
+
+logger = logging.getLogger(__name__)
+
+# Loggers whose INFO records make up the metadata progress output
+_PROGRESS_LOGGERS = (logger, logging.getLogger(AWSClient.__module__))
+
+
+@contextmanager
+def _progress_logging():
+    """
+    Print generator and AWSClient progress to stdout for the length of a run.
+    
+    Records go through a queue to a listener thread, so workers never block on the TTY
+    and lines from both loggers come out in the order they were logged.
+    """
+    if any(isinstance(h, QueueHandler) for h in logger.handlers):
+        # Already routed by an enclosing call
+        yield
+        return
+    
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter('%(message)s'))
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, stdout_handler)
+    queue_handler = QueueHandler(log_queue)
+    
+    saved = [(progress_logger, progress_logger.handlers[:], progress_logger.level, progress_logger.propagate)
+             for progress_logger in _PROGRESS_LOGGERS]
+    for progress_logger in _PROGRESS_LOGGERS:
+        progress_logger.handlers = [queue_handler]
+        progress_logger.setLevel(logging.INFO)
+        progress_logger.propagate = False
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        for progress_logger, handlers, level, propagate in saved:
+            progress_logger.handlers = handlers
+            progress_logger.setLevel(level)
+            progress_logger.propagate = propagate
+
 
 class ClusterMetadataGenerator:
     """Independent cluster metadata generator."""
     
-    def __init__(self, region: str, profile: str = "default"):
-        """Initialize the metadata generator."""
+    def __init__(self, region: str, profile: str = "default", max_workers: int = METADATA_MAX_WORKERS):
+        """Initialize the metadata generator.
+        
+        max_workers bounds the concurrent AWS calls made for each cluster; lower it
+        if the account is hitting API rate limits.
+        """
         self.region = region
         self.profile = profile
-        self.aws_client = AWSClient(region=region, profile=profile)
+        self.aws_client = AWSClient(region=region, profile=profile, max_workers=max_workers)
     
     def test_connection(self) -> bool:
         """Test AWS connection."""
@@ -55,47 +113,72 @@ class ClusterMetadataGenerator:
         if not cluster_names:
             raise ValueError("No clusters found or specified")
         
-        all_clusters_metadata = {}
+        total = len(cluster_names)
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_CLUSTERS, total)) as executor:
+            results = list(executor.map(
+                lambda item: self._collect_cluster_metadata(item[1], output_dir, item[0], total),
+                enumerate(cluster_names, 1)
+            ))
         
-        for i, cluster_name in enumerate(cluster_names, 1):
-            print(f"🔍 [{i}/{len(cluster_names)}] Collecting metadata for: {cluster_name}")
-            
-            try:
-                # Collect comprehensive cluster metadata
-                cluster_metadata = self.aws_client.get_cluster_metadata(cluster_name, output_dir)
-                all_clusters_metadata[cluster_name] = cluster_metadata
-                
-                # Print summary
-                print(f"✅ Metadata collected for {cluster_name}")
-                print(f"   - Version: {cluster_metadata.get('cluster_version', 'N/A')}")
-                print(f"   - Status: {cluster_metadata.get('cluster_status', 'N/A')}")
-                print(f"   - Node Groups: {len(cluster_metadata.get('node_groups', []))}")
-                print(f"   - Addons: {len(cluster_metadata.get('addons', []))}")
-                print(f"   - Karpenter: {'✅' if cluster_metadata.get('karpenter', {}).get('installed') else '❌'}")
-                
-                # Show installed plugins
-                installed_plugins = cluster_metadata.get('aws_plugins', {}).get('installed_plugins', [])
-                print(f"   - AWS Plugins: {len(installed_plugins)} installed")
-                
-            except Exception as e:
-                print(f"❌ Error collecting metadata for {cluster_name}: {str(e)}")
-                all_clusters_metadata[cluster_name] = {'error': str(e)}
+        return dict(zip(cluster_names, results))
+    
+    def _collect_cluster_metadata(self, cluster_name: str, output_dir: Optional[str],
+                                  index: int, total: int) -> Dict[str, Any]:
+        """Collect metadata for one cluster; errors other than credential failures are returned."""
+        logger.info("🔍 [%s/%s] Collecting metadata for: %s", index, total, cluster_name)
         
-        return all_clusters_metadata
+        try:
+            # Collect comprehensive cluster metadata
+            cluster_metadata = self.aws_client.get_cluster_metadata(cluster_name, output_dir)
+            
+            # Log summary as one record so concurrent clusters don't interleave lines
+            installed_plugins = cluster_metadata.get('aws_plugins', {}).get('installed_plugins', [])
+            logger.info(
+                "✅ Metadata collected for %s\n"
+                "   - Version: %s\n"
+                "   - Status: %s\n"
+                "   - Node Groups: %s\n"
+                "   - Addons: %s\n"
+                "   - Karpenter: %s\n"
+                "   - AWS Plugins: %s installed",
+                cluster_name,
+                cluster_metadata.get('cluster_version', 'N/A'),
+                cluster_metadata.get('cluster_status', 'N/A'),
+                len(cluster_metadata.get('node_groups', [])),
+                len(cluster_metadata.get('addons', [])),
+                '✅' if cluster_metadata.get('karpenter', {}).get('installed') else '❌',
+                len(installed_plugins)
+            )
+            return cluster_metadata
+            
+        except AWSCredentialsError:
+            # Every other cluster would fail the same way, so stop the run
+            raise
+        except Exception as e:
+            logger.error("❌ Error collecting metadata for %s: %s", cluster_name, e)
+            return {'error': str(e)}
     
     def save_metadata_json(self, metadata: Dict[str, Any], output_file: str) -> None:
         """Save metadata to JSON file."""
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(metadata, f, indent=2, default=str)
+        if orjson is not None:
+            # Pass datetimes through to default=str so timestamps read the same as with json
+            output_path.write_bytes(orjson.dumps(
+                metadata, default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            ))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(metadata, f, indent=2, default=str)
         
-        print(f"✅ Metadata saved to: {output_path}")
+        logger.info("✅ Metadata saved to: %s", output_path)
     
     def generate_and_save(self, cluster_names: Optional[List[str]] = None,
                          output_file: str = "clusters-metadata.json",
-                         output_dir: Optional[str] = None) -> Dict[str, Any]:
+                         output_dir: Optional[str] = None,
+                         check_connection: bool = False) -> Dict[str, Any]:
         """
         Generate cluster metadata and save to JSON file.
         
@@ -103,42 +186,51 @@ class ClusterMetadataGenerator:
             cluster_names: List of cluster names to analyze. If None, discovers all clusters.
             output_file: Path to save the JSON metadata file.
             output_dir: Directory to save original YAML files. If None, no YAML files are saved.
+            check_connection: Probe AWS before collecting. Off by default; the first real
+                API call surfaces credential errors anyway.
             
         Returns:
             Dictionary containing metadata for all clusters.
+            
+        Raises:
+            AWSCredentialsError: If listing or describing clusters fails on credentials
         """
-        print(f"🚀 Starting cluster metadata generation...")
-        print(f"📍 Region: {self.region}")
-        print(f"👤 Profile: {self.profile}")
-        
-        # Test connection
-        if not self.test_connection():
-            raise ConnectionError("Failed to connect to AWS. Check credentials and permissions.")
-        
-        print("✅ AWS connection successful")
-        
-        # Generate metadata
-        metadata = self.generate_cluster_metadata(cluster_names, output_dir)
-        
-        # Ensure output_file is in cluster-metadata directory if output_dir is specified
-        if output_dir and not output_file.startswith(output_dir):
-            cluster_metadata_dir = os.path.join(output_dir, "cluster-metadata")
-            output_file = os.path.join(cluster_metadata_dir, os.path.basename(output_file))
-        
-        # Save to file
-        self.save_metadata_json(metadata, output_file)
-        
-        print(f"\n📊 Summary:")
-        print(f"   - Total clusters: {len(metadata)}")
-        print(f"   - Successful: {len([m for m in metadata.values() if 'error' not in m])}")
-        print(f"   - Errors: {len([m for m in metadata.values() if 'error' in m])}")
+        with _progress_logging():
+            logger.info("🚀 Starting cluster metadata generation...")
+            logger.info("📍 Region: %s", self.region)
+            logger.info("👤 Profile: %s", self.profile)
+            
+            # Test connection
+            if check_connection:
+                if not self.test_connection():
+                    raise ConnectionError("Failed to connect to AWS. Check credentials and permissions.")
+                
+                logger.info("✅ AWS connection successful")
+            
+            # Generate metadata
+            metadata = self.generate_cluster_metadata(cluster_names, output_dir)
+            
+            # Ensure output_file is in cluster-metadata directory if output_dir is specified
+            if output_dir and not output_file.startswith(output_dir):
+                cluster_metadata_dir = os.path.join(output_dir, "cluster-metadata")
+                output_file = os.path.join(cluster_metadata_dir, os.path.basename(output_file))
+            
+            # Save to file
+            self.save_metadata_json(metadata, output_file)
+            
+            errors = sum('error' in m for m in metadata.values())
+            logger.info("\n📊 Summary:")
+            logger.info("   - Total clusters: %s", len(metadata))
+            logger.info("   - Successful: %s", len(metadata) - errors)
+            logger.info("   - Errors: %s", errors)
         
         return metadata
 
 
 def load_config_and_generate(config_file: str = "eks-upgrade-config.yaml",
                            output_file: str = "clusters-metadata.json",
-                           output_dir: Optional[str] = None) -> Dict[str, Any]:
+                           output_dir: Optional[str] = None,
+                           check_connection: bool = False) -> Dict[str, Any]:
     """
     Load configuration from file and generate metadata.
     
@@ -146,6 +238,7 @@ def load_config_and_generate(config_file: str = "eks-upgrade-config.yaml",
         config_file: Path to the EKS upgrade configuration file.
         output_file: Path to save the JSON metadata file.
         output_dir: Directory to save original YAML files.
+        check_connection: Probe AWS before collecting.
         
     Returns:
         Dictionary containing metadata for all clusters.
@@ -168,7 +261,7 @@ def load_config_and_generate(config_file: str = "eks-upgrade-config.yaml",
         cluster_names = None  # Will discover all clusters
     
     # Generate and save metadata
-    return generator.generate_and_save(cluster_names, output_file, output_dir)
+    return generator.generate_and_save(cluster_names, output_file, output_dir, check_connection)
 
 
 # CLI interface for standalone usage
@@ -185,18 +278,21 @@ def load_config_and_generate(config_file: str = "eks-upgrade-config.yaml",
               help='AWS profile (overrides config file)')
 @click.option('--clusters', '-cl', multiple=True,
               help='Specific cluster names to analyze (can be used multiple times)')
+@click.option('--check-connection', is_flag=True, default=False,
+              help='Verify AWS access before collecting metadata')
 def main(config: str, output: str, output_dir: Optional[str], 
-         region: Optional[str], profile: Optional[str], clusters: tuple):
+         region: Optional[str], profile: Optional[str], clusters: tuple,
+         check_connection: bool):
     """Generate EKS cluster metadata JSON file."""
     try:
         if region and profile:
             # Use command line parameters
             generator = ClusterMetadataGenerator(region=region, profile=profile)
             cluster_names = list(clusters) if clusters else None
-            generator.generate_and_save(cluster_names, output, output_dir)
+            generator.generate_and_save(cluster_names, output, output_dir, check_connection)
         else:
             # Use configuration file
-            load_config_and_generate(config, output, output_dir)
+            load_config_and_generate(config, output, output_dir, check_connection)
             
     except Exception as e:
         click.echo(f"❌ Error: {str(e)}", err=True)
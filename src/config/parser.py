@@ -2,8 +2,15 @@
 
 import yaml
 import os
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+
+# LibYAML's C loader when PyYAML was built with it, else the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 
 @dataclass
@@ -64,77 +71,49 @@ class EKSUpgradeConfig:
     assessment_options: AssessmentOptions = field(default_factory=AssessmentOptions)
 
 
+# Top-level YAML sections and the dataclass each one is parsed into
+CONFIG_SECTIONS = (
+    ('aws_configuration', AWSConfiguration),
+    ('cluster_info', ClusterInfo),
+    ('upgrade_targets', UpgradeTargets),
+    ('upgrade_strategy', UpgradeStrategy),
+    ('resilience_requirements', ResilienceRequirements),
+    ('assessment_options', AssessmentOptions),
+)
+
+
 class ConfigParser:
     """Parser for EKS upgrade configuration files."""
     
     @staticmethod
     def load_config(config_path: str) -> EKSUpgradeConfig:
-        """Load configuration from YAML file."""
-        if not os.path.exists(config_path):
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        """Load configuration from YAML file.
         
-        with open(config_path, 'r') as file:
-            config_data = yaml.safe_load(file)
+        The parsed config is cached per (path, mtime) and shared between callers,
+        so treat it as read-only.
+        """
+        abs_path = os.path.abspath(config_path)
+        try:
+            mtime = os.stat(abs_path).st_mtime
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
         
-        return ConfigParser._parse_config(config_data)
+        return _load_config_cached(abs_path, mtime)
     
     @staticmethod
     def _parse_config(config_data: Dict[str, Any]) -> EKSUpgradeConfig:
         """Parse configuration data into EKSUpgradeConfig object."""
         config = EKSUpgradeConfig()
         
-        # Parse AWS configuration
-        if 'aws_configuration' in config_data:
-            aws_config = config_data['aws_configuration']
-            config.aws_configuration = AWSConfiguration(
-                region=aws_config.get('region', 'us-west-2'),
-                credentials_profile=aws_config.get('credentials_profile', 'default')
-            )
-        
-        # Parse cluster info
-        if 'cluster_info' in config_data:
-            cluster_config = config_data['cluster_info']
-            config.cluster_info = ClusterInfo(
-                cluster_names=cluster_config.get('cluster_names', []),
-                current_control_plane_version=cluster_config.get('current_control_plane_version'),
-                current_data_plane_version=cluster_config.get('current_data_plane_version')
-            )
-        
-        # Parse upgrade targets
-        if 'upgrade_targets' in config_data:
-            targets_config = config_data['upgrade_targets']
-            config.upgrade_targets = UpgradeTargets(
-                control_plane_target_version=targets_config.get('control_plane_target_version', '1.28'),
-                data_plane_target_version=targets_config.get('data_plane_target_version', '1.28')
-            )
-        
-        # Parse upgrade strategy
-        if 'upgrade_strategy' in config_data:
-            strategy_config = config_data['upgrade_strategy']
-            config.upgrade_strategy = UpgradeStrategy(
-                method=strategy_config.get('method', 'both')
-            )
-        
-        # Parse resilience requirements
-        if 'resilience_requirements' in config_data:
-            resilience_config = config_data['resilience_requirements']
-            config.resilience_requirements = ResilienceRequirements(
-                enable_resilience_hub=resilience_config.get('enable_resilience_hub', True),
-                backup_strategy=resilience_config.get('backup_strategy', 'velero')
-            )
-        
-        # Parse assessment options
-        if 'assessment_options' in config_data:
-            assessment_config = config_data['assessment_options']
-            config.assessment_options = AssessmentOptions(
-                run_cluster_insights=assessment_config.get('run_cluster_insights', True),
-                run_kubent_scan=assessment_config.get('run_kubent_scan', True),
-                run_pluto_scan=assessment_config.get('run_pluto_scan', True),
-                check_deprecated_apis=assessment_config.get('check_deprecated_apis', True),
-                run_addon_compatibility_analysis=assessment_config.get('run_addon_compatibility_analysis', True),
-                run_addon_iam_analysis=assessment_config.get('run_addon_iam_analysis', True),
-                collect_cluster_metadata=assessment_config.get('collect_cluster_metadata', True)
-            )
+        for key, section_cls in CONFIG_SECTIONS:
+            if key not in config_data:
+                continue
+            section = config_data[key] or {}
+            # Fields missing from the file keep the dataclass defaults
+            defaults = getattr(config, key)
+            setattr(config, key, section_cls(**{
+                f.name: section.get(f.name, getattr(defaults, f.name)) for f in fields(section_cls)
+            }))
         
         return config
     
@@ -189,4 +168,13 @@ assessment_options:
 """
         
         with open(output_path, 'w') as file:
-            file.write(config_content)
\ No newline at end of file
+            file.write(config_content)
+
+
+@lru_cache(maxsize=16)
+def _load_config_cached(abs_path: str, mtime: float) -> EKSUpgradeConfig:
+    """Parse a config file once per (path, mtime); editing the file invalidates the entry."""
+    with open(abs_path, 'r') as file:
+        config_data = yaml.load(file, Loader=_SafeLoader)
+    
+    return ConfigParser._parse_config(config_data)
@@ -5,9 +5,19 @@ This module defines which EKS addons require IAM roles and their corresponding
 AWS managed policies. This data is used to validate addon IAM configurations.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import json
+import sys
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both accept the raw file bytes, so the read path has no text decoding step
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 # Comprehensive mapping of EKS addons to their required AWS managed policies
@@ -146,21 +156,38 @@ EKS_ADDON_IAM_POLICIES = {
 }
 
 
-def generate_addon_iam_mapping() -> Dict[str, Any]:
-    """Generate the complete addon IAM policy mapping."""
-    return {
-        "metadata": {
-            "generated_at": "2025-08-13T08:42:55.987Z",
-            "description": "EKS Addon IAM Policy Requirements Mapping",
-            "version": "1.0.0"
-        },
-        "addon_iam_policies": EKS_ADDON_IAM_POLICIES,
-        "summary": {
-            "total_addons": len(EKS_ADDON_IAM_POLICIES),
-            "require_iam": len([k for k, v in EKS_ADDON_IAM_POLICIES.items() if v["requires_iam"]]),
-            "no_iam_required": len([k for k, v in EKS_ADDON_IAM_POLICIES.items() if not v["requires_iam"]])
-        }
+# Freeze the table so it can be shared across threads without copying; ARNs become
+# interned tuples so repeated policies are one object
+for _entry in EKS_ADDON_IAM_POLICIES.values():
+    _entry["managed_policies"] = tuple(sys.intern(p) for p in _entry["managed_policies"])
+del _entry
+EKS_ADDON_IAM_POLICIES = MappingProxyType(EKS_ADDON_IAM_POLICIES)
+
+# Parsed mapping files keyed by path, with the mtime they were read at
+_MAPPING_CACHE: Dict[Path, Tuple[float, Dict[str, Any]]] = {}
+
+_TOTAL_ADDONS = len(EKS_ADDON_IAM_POLICIES)
+_REQUIRE_IAM_COUNT = sum(1 for v in EKS_ADDON_IAM_POLICIES.values() if v["requires_iam"])
+
+# The mapping is constant, so it is built once and shared by every caller
+_MAPPING_SINGLETON = {
+    "metadata": {
+        "generated_at": "2025-08-13T08:42:55.987Z",
+        "description": "EKS Addon IAM Policy Requirements Mapping",
+        "version": "1.0.0"
+    },
+    "addon_iam_policies": EKS_ADDON_IAM_POLICIES,
+    "summary": {
+        "total_addons": _TOTAL_ADDONS,
+        "require_iam": _REQUIRE_IAM_COUNT,
+        "no_iam_required": _TOTAL_ADDONS - _REQUIRE_IAM_COUNT
     }
+}
+
+
+def generate_addon_iam_mapping() -> Dict[str, Any]:
+    """Generate the complete addon IAM policy mapping (shared; do not mutate)."""
+    return _MAPPING_SINGLETON
 
 
 def save_addon_iam_mapping(output_dir: Path) -> Path:
@@ -171,8 +198,15 @@ def save_addon_iam_mapping(output_dir: Path) -> Path:
     mapping_file = shared_data_dir / "eks-addon-iam-policies.json"
     mapping_data = generate_addon_iam_mapping()
     
-    with open(mapping_file, 'w') as f:
-        json.dump(mapping_data, f, indent=2)
+    if orjson is not None:
+        # default=dict serialises the read-only policy table
+        mapping_file.write_bytes(orjson.dumps(mapping_data, default=dict, option=orjson.OPT_INDENT_2))
+    else:
+        with open(mapping_file, 'w') as f:
+            json.dump(mapping_data, f, indent=2, default=dict)
+    
+    # The file now holds the in-memory mapping, so a later load can skip the read
+    _MAPPING_CACHE[mapping_file] = (mapping_file.stat().st_mtime, mapping_data)
     
     return mapping_file
 
@@ -181,20 +215,32 @@ def load_addon_iam_mapping(shared_data_dir: Path) -> Dict[str, Any]:
     """Load the addon IAM mapping from shared data directory."""
     mapping_file = shared_data_dir / "eks-addon-iam-policies.json"
     
-    if not mapping_file.exists():
+    try:
+        mtime = mapping_file.stat().st_mtime
+    except FileNotFoundError:
         # Return default mapping if file doesn't exist
         return generate_addon_iam_mapping()
     
-    with open(mapping_file, 'r') as f:
-        return json.load(f)
+    cached = _MAPPING_CACHE.get(mapping_file)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    mapping_data = _json_loads(mapping_file.read_bytes())
+    _MAPPING_CACHE[mapping_file] = (mtime, mapping_data)
+    return mapping_data
 
 
-def get_addon_iam_requirements(addon_name: str, shared_data_dir: Path = None) -> Dict[str, Any]:
-    """Get IAM requirements for a specific addon."""
-    if shared_data_dir:
-        mapping_data = load_addon_iam_mapping(shared_data_dir)
-    else:
-        mapping_data = generate_addon_iam_mapping()
+def get_addon_iam_requirements(addon_name: str, shared_data_dir: Path = None,
+                               mapping_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Get IAM requirements for a specific addon.
+    
+    When looking up many addons, load the mapping once and pass it as mapping_data.
+    """
+    if mapping_data is None:
+        if shared_data_dir:
+            mapping_data = load_addon_iam_mapping(shared_data_dir)
+        else:
+            mapping_data = generate_addon_iam_mapping()
     
     return mapping_data["addon_iam_policies"].get(addon_name, {
         "description": f"Unknown addon: {addon_name}",
@@ -0,0 +1,11 @@
+"""
+Output file helpers shared by the report and script generators.
+"""
+
+# Coalesce the many small template chunks into few large writes
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def _open_out(path):
+    """Open a generated text file for writing with a 1 MiB buffer and LF line endings."""
+    return open(path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE, newline='\n')
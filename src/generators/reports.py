@@ -8,9 +8,55 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 from jinja2 import Environment, FileSystemLoader, Template
 
+from ._output import _open_out
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+# One Jinja environment per template directory, shared by every ReportGenerator
+_ENV_CACHE: Dict[Path, Environment] = {}
+
+
+def _get_environment(template_dir: Path) -> Environment:
+    """Return the shared environment for a template directory, creating it on first use."""
+    env = _ENV_CACHE.get(template_dir)
+    if env is None:
+        # Templates ship with the tool, so skip Jinja's mtime check on every get_template
+        env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False
+        )
+        
+        # Add custom filters
+        env.filters['timestamp'] = ReportGenerator._format_timestamp
+        env.filters['severity_color'] = ReportGenerator._get_severity_color
+        env = _ENV_CACHE.setdefault(template_dir, env)
+    return env
+
+
+def _generation_time() -> str:
+    """Timestamp stamped into generated reports."""
+    return datetime.utcnow().isoformat() + 'Z'
+
+
+def _render_to_file(template: Template, template_data: Dict[str, Any], output_path) -> None:
+    """Stream a rendered template into output_path, removing the partial file if rendering fails."""
+    try:
+        with _open_out(output_path) as f:
+            template.stream(**template_data).dump(f)
+    except Exception:
+        Path(output_path).unlink(missing_ok=True)
+        raise
+
 
 class ReportGenerator:
     """Generates assessment reports in multiple formats."""
@@ -22,23 +68,20 @@ class ReportGenerator:
             template_dir = current_dir.parent.parent / "templates"
         
         self.template_dir = Path(template_dir)
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        self.env = _get_environment(self.template_dir)
         
-        # Add custom filters
-        self.env.filters['timestamp'] = self._format_timestamp
-        self.env.filters['severity_color'] = self._get_severity_color
+        # Last (assessment_data, summary) pair, so multi-format runs summarise once
+        self._summary_cache: Optional[Tuple[Dict, Dict]] = None
     
-    def generate_markdown_report(self, assessment_data: Dict, output_path: str) -> bool:
+    def generate_markdown_report(self, assessment_data: Dict, output_path: str,
+                                 generation_time: Optional[str] = None) -> bool:
         """
         Generate markdown assessment report.
         
         Args:
             assessment_data: Complete assessment data
             output_path: Path to save the markdown report
+            generation_time: Timestamp to stamp; defaults to now
             
         Returns:
             True if successful, False otherwise
@@ -49,16 +92,12 @@ class ReportGenerator:
             # Prepare data for template
             template_data = {
                 'assessment': assessment_data,
-                'generation_time': datetime.utcnow().isoformat() + 'Z',
+                'generation_time': generation_time or _generation_time(),
                 'summary': self._generate_summary(assessment_data)
             }
             
-            # Render template
-            content = template.render(**template_data)
-            
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Render template to file
+            _render_to_file(template, template_data, output_path)
             
             return True
             
@@ -66,13 +105,15 @@ class ReportGenerator:
             print(f"Error generating markdown report: {e}")
             return False
     
-    def generate_html_report(self, assessment_data: Dict, output_path: str) -> bool:
+    def generate_html_report(self, assessment_data: Dict, output_path: str,
+                             generation_time: Optional[str] = None) -> bool:
         """
         Generate HTML assessment report.
         
         Args:
             assessment_data: Complete assessment data
             output_path: Path to save the HTML report
+            generation_time: Timestamp to stamp; defaults to now
             
         Returns:
             True if successful, False otherwise
@@ -83,17 +124,12 @@ class ReportGenerator:
             # Prepare data for template
             template_data = {
                 'assessment': assessment_data,
-                'generation_time': datetime.utcnow().isoformat() + 'Z',
-                'summary': self._generate_summary(assessment_data),
-                'json_data': json.dumps(assessment_data, indent=2)
+                'generation_time': generation_time or _generation_time(),
+                'summary': self._generate_summary(assessment_data)
             }
             
-            # Render template
-            content = template.render(**template_data)
-            
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Render template to file
+            _render_to_file(template, template_data, output_path)
             
             return True
             
@@ -101,13 +137,15 @@ class ReportGenerator:
             print(f"Error generating HTML report: {e}")
             return False
     
-    def generate_web_dashboard(self, assessment_data: Dict, output_dir: str) -> bool:
+    def generate_web_dashboard(self, assessment_data: Dict, output_dir: str,
+                               generation_time: Optional[str] = None) -> bool:
         """
         Generate interactive web dashboard.
         
         Args:
             assessment_data: Complete assessment data
             output_dir: Directory to save the web dashboard
+            generation_time: Timestamp to stamp; defaults to now
             
         Returns:
             True if successful, False otherwise
@@ -121,18 +159,20 @@ class ReportGenerator:
             
             template_data = {
                 'assessment': assessment_data,
-                'generation_time': datetime.utcnow().isoformat() + 'Z',
+                'generation_time': generation_time or _generation_time(),
                 'summary': self._generate_summary(assessment_data)
             }
             
-            content = template.render(**template_data)
-            
-            with open(output_path / 'index.html', 'w', encoding='utf-8') as f:
-                f.write(content)
+            _render_to_file(template, template_data, output_path / 'index.html')
             
             # Generate assessment data JSON
-            with open(output_path / 'assessment-data.json', 'w', encoding='utf-8') as f:
-                json.dump(assessment_data, f, indent=2)
+            if orjson is not None:
+                (output_path / 'assessment-data.json').write_bytes(
+                    orjson.dumps(assessment_data, option=_ORJSON_OPTIONS)
+                )
+            else:
+                with _open_out(output_path / 'assessment-data.json') as f:
+                    f.write(json.dumps(assessment_data, indent=2))
             
             # Copy assets if they exist
             assets_src = self.template_dir / 'assets'
@@ -146,13 +186,15 @@ class ReportGenerator:
             print(f"Error generating web dashboard: {e}")
             return False
     
-    def generate_json_report(self, assessment_data: Dict, output_path: str) -> bool:
+    def generate_json_report(self, assessment_data: Dict, output_path: str,
+                             generation_time: Optional[str] = None) -> bool:
         """
         Generate JSON assessment report.
         
         Args:
             assessment_data: Complete assessment data
             output_path: Path to save the JSON report
+            generation_time: Timestamp to stamp; defaults to now
             
         Returns:
             True if successful, False otherwise
@@ -161,7 +203,7 @@ class ReportGenerator:
             # Add metadata
             report_data = {
                 'metadata': {
-                    'generation_time': datetime.utcnow().isoformat() + 'Z',
+                    'generation_time': generation_time or _generation_time(),
                     'version': '1.0.0',
                     'format': 'eks-upgrade-assessment'
                 },
@@ -169,8 +211,13 @@ class ReportGenerator:
                 'assessment_data': assessment_data
             }
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2)
+            if orjson is not None:
+                Path(output_path).write_bytes(
+                    orjson.dumps(report_data, option=_ORJSON_OPTIONS)
+                )
+            else:
+                with _open_out(output_path) as f:
+                    f.write(json.dumps(report_data, indent=2))
             
             return True
             
@@ -178,6 +225,37 @@ class ReportGenerator:
             print(f"Error generating JSON report: {e}")
             return False
     
+    def generate_all(self, assessment_data: Dict, output_dir: str) -> Dict[str, bool]:
+        """
+        Generate markdown, HTML and JSON reports plus the web dashboard.
+        
+        Args:
+            assessment_data: Complete assessment data
+            output_dir: Directory to save the reports
+            
+        Returns:
+            Dictionary with report names and success status
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        
+        # Stamp every format with the same time
+        generation_time = _generation_time()
+        
+        jobs = {
+            'assessment-report.md': self.generate_markdown_report,
+            'assessment-report.html': self.generate_html_report,
+            'assessment-report.json': self.generate_json_report,
+            'web-dashboard': self.generate_web_dashboard,
+        }
+        
+        # Rendering holds the GIL, so formats are generated one after another;
+        # the summary is computed once and reused from the cache
+        return {
+            name: generate(assessment_data, str(output_path / name), generation_time)
+            for name, generate in jobs.items()
+        }
+    
     def generate_deprecated_apis_report(self, deprecated_apis_data: Dict, output_path: str) -> bool:
         """
         Generate dedicated deprecated APIs report.
@@ -194,13 +272,10 @@ class ReportGenerator:
             
             template_data = {
                 'deprecated_apis': deprecated_apis_data,
-                'generation_time': datetime.utcnow().isoformat() + 'Z'
+                'generation_time': _generation_time()
             }
             
-            content = template.render(**template_data)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            _render_to_file(template, template_data, output_path)
             
             return True
             
@@ -224,13 +299,10 @@ class ReportGenerator:
             
             template_data = {
                 'compatibility': compatibility_data,
-                'generation_time': datetime.utcnow().isoformat() + 'Z'
+                'generation_time': _generation_time()
             }
             
-            content = template.render(**template_data)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            _render_to_file(template, template_data, output_path)
             
             return True
             
@@ -239,7 +311,17 @@ class ReportGenerator:
             return False
     
     def _generate_summary(self, assessment_data: Dict) -> Dict:
-        """Generate assessment summary."""
+        """Generate assessment summary, reusing the last one for the same assessment_data."""
+        cached = self._summary_cache
+        if cached is not None and cached[0] is assessment_data:
+            return cached[1]
+        
+        summary = self._build_summary(assessment_data)
+        self._summary_cache = (assessment_data, summary)
+        return summary
+    
+    def _build_summary(self, assessment_data: Dict) -> Dict:
+        """Walk every cluster once and tally readiness counts."""
         summary = {
             'total_clusters': 0,
             'clusters_ready': 0,
@@ -256,17 +338,18 @@ class ReportGenerator:
         summary['total_clusters'] = len(clusters)
         
         for cluster in clusters:
-            cluster_name = cluster.get('cluster_name', 'unknown')
             has_issues = False
             
             # Check cluster insights
             insights = cluster.get('cluster_insights', {})
-            if insights.get('upgrade_blockers'):
-                summary['critical_issues'] += len(insights['upgrade_blockers'])
+            upgrade_blockers = insights.get('upgrade_blockers')
+            if upgrade_blockers:
+                summary['critical_issues'] += len(upgrade_blockers)
                 has_issues = True
             
-            if insights.get('warnings'):
-                summary['warnings'] += len(insights['warnings'])
+            insight_warnings = insights.get('warnings')
+            if insight_warnings:
+                summary['warnings'] += len(insight_warnings)
                 has_issues = True
             
             # Check deprecated APIs
@@ -275,15 +358,15 @@ class ReportGenerator:
             pluto_results = deprecated_apis.get('pluto_results', {})
             
             if kubent_results.get('status') == 'success':
-                kubent_summary = kubent_results.get('summary', {})
-                summary['deprecated_apis_found'] += kubent_summary.get('total_deprecated', 0)
-                if kubent_summary.get('total_deprecated', 0) > 0:
+                kubent_deprecated = kubent_results.get('summary', {}).get('total_deprecated', 0)
+                summary['deprecated_apis_found'] += kubent_deprecated
+                if kubent_deprecated > 0:
                     has_issues = True
             
             if pluto_results.get('status') == 'success':
-                pluto_summary = pluto_results.get('summary', {})
-                summary['deprecated_apis_found'] += pluto_summary.get('total_deprecated', 0)
-                if pluto_summary.get('total_deprecated', 0) > 0:
+                pluto_deprecated = pluto_results.get('summary', {}).get('total_deprecated', 0)
+                summary['deprecated_apis_found'] += pluto_deprecated
+                if pluto_deprecated > 0:
                     has_issues = True
             
             # Check compatibility
@@ -312,7 +395,8 @@ class ReportGenerator:
         
         return summary
     
-    def _format_timestamp(self, timestamp_str: str) -> str:
+    @staticmethod
+    def _format_timestamp(timestamp_str: str) -> str:
         """Format timestamp for display."""
         try:
             dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
@@ -320,7 +404,8 @@ class ReportGenerator:
         except Exception:
             return timestamp_str
     
-    def _get_severity_color(self, severity: str) -> str:
+    @staticmethod
+    def _get_severity_color(severity: str) -> str:
         """Get color for severity level."""
         colors = {
             'high': '#dc3545',
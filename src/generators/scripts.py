@@ -6,9 +6,29 @@ This module generates automation scripts for assessment and validation.
 
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 from jinja2 import Environment, FileSystemLoader
 
+from ._output import _open_out
+
+# One Jinja environment per script template directory, shared by every ScriptGenerator
+_ENV_CACHE: Dict[Path, Environment] = {}
+
+
+def _get_environment(template_dir: Path) -> Environment:
+    """Return the shared environment for a template directory, creating it on first use."""
+    env = _ENV_CACHE.get(template_dir)
+    if env is None:
+        # Templates ship with the tool, so skip Jinja's mtime check on every get_template
+        env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False
+        )
+        env = _ENV_CACHE.setdefault(template_dir, env)
+    return env
+
 
 class ScriptGenerator:
     """Generates automation scripts for EKS upgrade assessment."""
@@ -20,40 +40,35 @@ class ScriptGenerator:
             template_dir = current_dir.parent.parent / "templates"
         
         self.template_dir = Path(template_dir)
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.template_dir / "scripts")),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        self.env = _get_environment(self.template_dir / "scripts")
     
-    def generate_assessment_checks_script(self, assessment_data: Dict, output_path: str) -> bool:
+    def generate_assessment_checks_script(self, assessment_data: Dict, output_path: str,
+                                          context: Optional[Dict[str, Any]] = None) -> bool:
         """
         Generate assessment validation script.
         
         Args:
             assessment_data: Assessment data to base checks on
             output_path: Path to save the script
+            context: Precomputed _script_context(assessment_data), if already built
             
         Returns:
             True if successful, False otherwise
         """
         try:
             template = self.env.get_template('assessment-checks.sh.j2')
-            
-            # Extract cluster information
-            clusters = assessment_data.get('clusters', [])
-            cluster_names = [cluster.get('cluster_name') for cluster in clusters]
+            ctx = context or self._script_context(assessment_data)
             
             template_data = {
-                'clusters': clusters,
-                'cluster_names': cluster_names,
-                'aws_region': assessment_data.get('config', {}).get('aws_configuration', {}).get('region', 'us-west-2'),
-                'aws_profile': assessment_data.get('config', {}).get('aws_configuration', {}).get('credentials_profile', 'default')
+                'clusters': ctx['clusters'],
+                'cluster_names': ctx['cluster_names'],
+                'aws_region': ctx['aws_region'],
+                'aws_profile': ctx['aws_profile']
             }
             
             content = template.render(**template_data)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with _open_out(output_path) as f:
                 f.write(content)
             
             # Make script executable
@@ -65,32 +80,33 @@ class ScriptGenerator:
             print(f"Error generating assessment checks script: {e}")
             return False
     
-    def generate_deprecated_api_scanner_script(self, assessment_data: Dict, output_path: str) -> bool:
+    def generate_deprecated_api_scanner_script(self, assessment_data: Dict, output_path: str,
+                                               context: Optional[Dict[str, Any]] = None) -> bool:
         """
         Generate deprecated API scanner script.
         
         Args:
             assessment_data: Assessment data
             output_path: Path to save the script
+            context: Precomputed _script_context(assessment_data), if already built
             
         Returns:
             True if successful, False otherwise
         """
         try:
             template = self.env.get_template('deprecated-api-scanner.sh.j2')
-            
-            clusters = assessment_data.get('clusters', [])
+            ctx = context or self._script_context(assessment_data)
             
             template_data = {
-                'clusters': clusters,
-                'target_version': assessment_data.get('config', {}).get('upgrade_targets', {}).get('control_plane_target_version', '1.28'),
-                'aws_region': assessment_data.get('config', {}).get('aws_configuration', {}).get('region', 'us-west-2'),
-                'aws_profile': assessment_data.get('config', {}).get('aws_configuration', {}).get('credentials_profile', 'default')
+                'clusters': ctx['clusters'],
+                'target_version': ctx['target_version'],
+                'aws_region': ctx['aws_region'],
+                'aws_profile': ctx['aws_profile']
             }
             
             content = template.render(**template_data)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with _open_out(output_path) as f:
                 f.write(content)
             
             # Make script executable
@@ -102,32 +118,32 @@ class ScriptGenerator:
             print(f"Error generating deprecated API scanner script: {e}")
             return False
     
-    def generate_cluster_metadata_collector_script(self, assessment_data: Dict, output_path: str) -> bool:
+    def generate_cluster_metadata_collector_script(self, assessment_data: Dict, output_path: str,
+                                                   context: Optional[Dict[str, Any]] = None) -> bool:
         """
         Generate cluster metadata collection script.
         
         Args:
             assessment_data: Assessment data
             output_path: Path to save the script
+            context: Precomputed _script_context(assessment_data), if already built
             
         Returns:
             True if successful, False otherwise
         """
         try:
             template = self.env.get_template('cluster-metadata-collector.sh.j2')
-            
-            clusters = assessment_data.get('clusters', [])
-            cluster_names = [cluster.get('cluster_name') for cluster in clusters]
+            ctx = context or self._script_context(assessment_data)
             
             template_data = {
-                'cluster_names': cluster_names,
-                'aws_region': assessment_data.get('config', {}).get('aws_configuration', {}).get('region', 'us-west-2'),
-                'aws_profile': assessment_data.get('config', {}).get('aws_configuration', {}).get('credentials_profile', 'default')
+                'cluster_names': ctx['cluster_names'],
+                'aws_region': ctx['aws_region'],
+                'aws_profile': ctx['aws_profile']
             }
             
             content = template.render(**template_data)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with _open_out(output_path) as f:
                 f.write(content)
             
             # Make script executable
@@ -139,21 +155,23 @@ class ScriptGenerator:
             print(f"Error generating cluster metadata collector script: {e}")
             return False
     
-    def generate_upgrade_validation_script(self, assessment_data: Dict, output_path: str) -> bool:
+    def generate_upgrade_validation_script(self, assessment_data: Dict, output_path: str,
+                                           context: Optional[Dict[str, Any]] = None) -> bool:
         """
         Generate upgrade validation script.
         
         Args:
             assessment_data: Assessment data
             output_path: Path to save the script
+            context: Precomputed _script_context(assessment_data), if already built
             
         Returns:
             True if successful, False otherwise
         """
         try:
             template = self.env.get_template('upgrade-validation.sh.j2')
-            
-            clusters = assessment_data.get('clusters', [])
+            ctx = context or self._script_context(assessment_data)
+            clusters = ctx['clusters']
             
             # Extract validation checks based on assessment findings
             validation_checks = []
@@ -186,14 +204,14 @@ class ScriptGenerator:
             template_data = {
                 'clusters': clusters,
                 'validation_checks': validation_checks,
-                'target_version': assessment_data.get('config', {}).get('upgrade_targets', {}).get('control_plane_target_version', '1.28'),
-                'aws_region': assessment_data.get('config', {}).get('aws_configuration', {}).get('region', 'us-west-2'),
-                'aws_profile': assessment_data.get('config', {}).get('aws_configuration', {}).get('credentials_profile', 'default')
+                'target_version': ctx['target_version'],
+                'aws_region': ctx['aws_region'],
+                'aws_profile': ctx['aws_profile']
             }
             
             content = template.render(**template_data)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with _open_out(output_path) as f:
                 f.write(content)
             
             # Make script executable
@@ -219,30 +237,32 @@ class ScriptGenerator:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        results = {}
-        
-        # Generate assessment checks script
-        results['assessment-checks.sh'] = self.generate_assessment_checks_script(
-            assessment_data,
-            str(output_path / 'assessment-checks.sh')
-        )
-        
-        # Generate deprecated API scanner script
-        results['deprecated-api-scanner.sh'] = self.generate_deprecated_api_scanner_script(
-            assessment_data,
-            str(output_path / 'deprecated-api-scanner.sh')
-        )
+        # Config lookups shared by every script
+        context = self._script_context(assessment_data)
         
-        # Generate cluster metadata collector script
-        results['cluster-metadata-collector.sh'] = self.generate_cluster_metadata_collector_script(
-            assessment_data,
-            str(output_path / 'cluster-metadata-collector.sh')
-        )
+        jobs = {
+            'assessment-checks.sh': self.generate_assessment_checks_script,
+            'deprecated-api-scanner.sh': self.generate_deprecated_api_scanner_script,
+            'cluster-metadata-collector.sh': self.generate_cluster_metadata_collector_script,
+            'upgrade-validation.sh': self.generate_upgrade_validation_script,
+        }
         
-        # Generate upgrade validation script
-        results['upgrade-validation.sh'] = self.generate_upgrade_validation_script(
-            assessment_data,
-            str(output_path / 'upgrade-validation.sh')
-        )
+        return {
+            name: generate(assessment_data, str(output_path / name), context)
+            for name, generate in jobs.items()
+        }
+    
+    @staticmethod
+    def _script_context(assessment_data: Dict) -> Dict[str, Any]:
+        """Extract the cluster list and config values the script templates share."""
+        config = assessment_data.get('config', {})
+        aws_config = config.get('aws_configuration', {})
+        clusters = assessment_data.get('clusters', [])
         
-        return results
+        return {
+            'clusters': clusters,
+            'cluster_names': [cluster.get('cluster_name') for cluster in clusters],
+            'aws_region': aws_config.get('region', 'us-west-2'),
+            'aws_profile': aws_config.get('credentials_profile', 'default'),
+            'target_version': config.get('upgrade_targets', {}).get('control_plane_target_version', '1.28')
+        }
@@ -7,6 +7,7 @@ following AWS best practices.
 """
 
 import click
+import logging
 import os
 import sys
 from typing import Optional
@@ -30,7 +31,13 @@ def cli():
     A comprehensive toolkit to assess EKS cluster readiness for upgrades 
     following AWS best practices.
     """
-    pass
+    # AWSClient reports progress and errors through logging; print them with the CLI output
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter('%(message)s'))
+    aws_client_logger = logging.getLogger(AWSClient.__module__)
+    aws_client_logger.addHandler(stdout_handler)
+    aws_client_logger.setLevel(logging.INFO)
+    aws_client_logger.propagate = False
 
 
 @cli.command()
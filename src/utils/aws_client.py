@@ -2,11 +2,32 @@
 
 import boto3
 import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from dataclasses import dataclass
 from pathlib import Path
 
+# Independent describe calls issued at once for a single cluster
+METADATA_MAX_WORKERS = 8
+# Sized so several clusters can share one client without exhausting its pool
+CLIENT_MAX_POOL_CONNECTIONS = 50
+# Error codes meaning the credentials are missing, invalid, expired or not allowed to call EKS
+AUTH_ERROR_CODES = frozenset({
+    'UnrecognizedClientException', 'InvalidClientTokenId', 'InvalidSignatureException',
+    'SignatureDoesNotMatch', 'ExpiredToken', 'ExpiredTokenException', 'RequestExpired',
+    'AccessDenied', 'AccessDeniedException', 'AuthFailure'
+})
+
+logger = logging.getLogger(__name__)
+
+
+class AWSCredentialsError(Exception):
+    """Raised when AWS credentials are missing or rejected."""
+
 
 @dataclass
 class EKSClusterInfo:
@@ -46,10 +67,11 @@ class NodeGroupInfo:
 class AWSClient:
     """AWS client wrapper for EKS operations."""
     
-    def __init__(self, region: str, profile: str = "default"):
+    def __init__(self, region: str, profile: str = "default", max_workers: int = METADATA_MAX_WORKERS):
         """Initialize AWS client."""
         self.region = region
         self.profile = profile
+        self.max_workers = max_workers
         self._session = None
         self._eks_client = None
         self._ec2_client = None
@@ -57,6 +79,8 @@ class AWSClient:
         self._logs_client = None
         self._sts_client = None
         self._autoscaling_client = None
+        # Clients are shared across worker threads; boto3 sessions aren't thread-safe
+        self._client_lock = threading.RLock()
         
     @property
     def session(self) -> boto3.Session:
@@ -71,44 +95,51 @@ class AWSClient:
     @property
     def eks_client(self):
         """Get EKS client."""
-        if self._eks_client is None:
-            self._eks_client = self.session.client('eks')
-        return self._eks_client
+        return self._lazy_client('eks')
     
     @property
     def ec2_client(self):
         """Get EC2 client."""
-        if self._ec2_client is None:
-            self._ec2_client = self.session.client('ec2')
-        return self._ec2_client
+        return self._lazy_client('ec2')
     
     @property
     def iam_client(self):
         """Get IAM client."""
-        if self._iam_client is None:
-            self._iam_client = self.session.client('iam')
-        return self._iam_client
+        return self._lazy_client('iam')
     
     @property
     def logs_client(self):
         """Get CloudWatch Logs client."""
-        if self._logs_client is None:
-            self._logs_client = self.session.client('logs')
-        return self._logs_client
+        return self._lazy_client('logs')
     
     @property
     def sts_client(self):
         """Get STS client."""
-        if self._sts_client is None:
-            self._sts_client = self.session.client('sts')
-        return self._sts_client
+        return self._lazy_client('sts')
     
     @property
     def autoscaling_client(self):
         """Get Auto Scaling client."""
-        if self._autoscaling_client is None:
-            self._autoscaling_client = self.session.client('autoscaling')
-        return self._autoscaling_client
+        return self._lazy_client('autoscaling')
+    
+    def _lazy_client(self, service_name: str):
+        """Create the cached client for a service once, even when called from several threads."""
+        attr = f'_{service_name}_client'
+        client = getattr(self, attr)
+        if client is None:
+            with self._client_lock:
+                client = getattr(self, attr)
+                if client is None:
+                    client = self.session.client(
+                        service_name, config=Config(max_pool_connections=CLIENT_MAX_POOL_CONNECTIONS)
+                    )
+                    setattr(self, attr, client)
+        return client
+    
+    def get_client(self, service_name: str, config: Optional[Config] = None):
+        """Get a client for any AWS service from the shared session."""
+        with self._client_lock:
+            return self.session.client(service_name, config=config)
     
     def test_connection(self) -> bool:
         """Test AWS connection and permissions."""
@@ -117,7 +148,7 @@ class AWSClient:
             self.eks_client.list_clusters()
             return True
         except (ClientError, NoCredentialsError) as e:
-            print(f"AWS connection test failed: {str(e)}")
+            logger.error("AWS connection test failed: %s", e)
             return False
     
     def get_account_id(self) -> str:
@@ -129,14 +160,29 @@ class AWSClient:
             raise Exception(f"Failed to get AWS account ID: {str(e)}")
     
     def discover_clusters(self) -> List[str]:
-        """Discover all EKS clusters in the region."""
+        """Discover all EKS clusters in the region.
+        
+        Raises:
+            AWSCredentialsError: If the credentials are missing or rejected
+        """
         try:
             response = self.eks_client.list_clusters()
             return response.get('clusters', [])
-        except ClientError as e:
-            print(f"Failed to discover clusters: {str(e)}")
+        except (ClientError, NoCredentialsError) as e:
+            self._raise_if_credentials_error(e)
+            logger.error("Failed to discover clusters: %s", e)
             return []
     
+    def _raise_if_credentials_error(self, error: Exception):
+        """Re-raise missing or rejected credentials as AWSCredentialsError."""
+        if isinstance(error, NoCredentialsError) or (
+                isinstance(error, ClientError)
+                and error.response.get('Error', {}).get('Code') in AUTH_ERROR_CODES):
+            raise AWSCredentialsError(
+                f"AWS credentials for profile '{self.profile}' in {self.region} are missing or "
+                f"were rejected ({error}). Check credentials and permissions."
+            ) from error
+    
     def get_cluster_info(self, cluster_name: str) -> Optional[EKSClusterInfo]:
         """Get detailed information about an EKS cluster."""
         try:
@@ -157,8 +203,9 @@ class AWSClient:
                 identity=cluster_data.get('identity', {}),
                 tags=cluster_data.get('tags', {})
             )
-        except ClientError as e:
-            print(f"Failed to get cluster info for {cluster_name}: {str(e)}")
+        except (ClientError, NoCredentialsError) as e:
+            self._raise_if_credentials_error(e)
+            logger.error("Failed to get cluster info for %s: %s", cluster_name, e)
             return None
     
     def get_node_groups(self, cluster_name: str) -> List[NodeGroupInfo]:
@@ -175,14 +222,14 @@ class AWSClient:
                 if ng_info:
                     all_node_groups.append(ng_info)
         except ClientError as e:
-            print(f"Failed to get managed node groups for {cluster_name}: {str(e)}")
+            logger.error("Failed to get managed node groups for %s: %s", cluster_name, e)
         
         # Get self-managed node groups from Auto Scaling Groups
         try:
             self_managed_groups = self.get_self_managed_node_groups(cluster_name)
             all_node_groups.extend(self_managed_groups)
         except Exception as e:
-            print(f"Failed to get self-managed node groups for {cluster_name}: {str(e)}")
+            logger.error("Failed to get self-managed node groups for %s: %s", cluster_name, e)
         
         return all_node_groups
     
@@ -211,7 +258,7 @@ class AWSClient:
                 nodegroup_type='managed'
             )
         except ClientError as e:
-            print(f"Failed to get node group info for {nodegroup_name}: {str(e)}")
+            logger.error("Failed to get node group info for %s: %s", nodegroup_name, e)
             return None
     
     def get_self_managed_node_groups(self, cluster_name: str) -> List[NodeGroupInfo]:
@@ -264,7 +311,7 @@ class AWSClient:
                                             if 'InstanceType' in lt_data:
                                                 instance_types = [lt_data['InstanceType']]
                                 except Exception as e:
-                                    print(f"Warning: Could not get launch template details for {asg_name}: {e}")
+                                    logger.warning("Warning: Could not get launch template details for %s: %s", asg_name, e)
                         elif asg.get('LaunchConfigurationName'):
                             # Legacy launch configuration
                             try:
@@ -274,7 +321,7 @@ class AWSClient:
                                 if lc_response['LaunchConfigurations']:
                                     instance_types = [lc_response['LaunchConfigurations'][0]['InstanceType']]
                             except Exception as e:
-                                print(f"Warning: Could not get launch configuration details for {asg_name}: {e}")
+                                logger.warning("Warning: Could not get launch configuration details for %s: %s", asg_name, e)
                         
                         # Determine capacity type from tags or instance types
                         capacity_type = "ON_DEMAND"  # Default
@@ -318,7 +365,7 @@ class AWSClient:
             return self_managed_groups
             
         except ClientError as e:
-            print(f"Failed to get self-managed node groups for {cluster_name}: {str(e)}")
+            logger.error("Failed to get self-managed node groups for %s: %s", cluster_name, e)
             return []
     
     def get_cluster_insights(self, cluster_name: str) -> List[Dict[str, Any]]:
@@ -326,13 +373,21 @@ class AWSClient:
         try:
             # Check if the client has the list_insights method
             if not hasattr(self.eks_client, 'list_insights'):
-                print(f"Warning: EKS Insights API not available in this AWS SDK version for cluster {cluster_name}")
+                logger.warning("Warning: EKS Insights API not available in this AWS SDK version for cluster %s", cluster_name)
                 return []
             
-            response = self.eks_client.list_insights(
-                clusterName=cluster_name
-            )
-            insights = response.get('insights', [])
+            if self.eks_client.can_paginate('list_insights'):
+                paginator = self.eks_client.get_paginator('list_insights')
+                insights = [
+                    insight
+                    for page in paginator.paginate(clusterName=cluster_name, PaginationConfig={'PageSize': 100})
+                    for insight in page.get('insights', [])
+                ]
+            else:
+                response = self.eks_client.list_insights(
+                    clusterName=cluster_name
+                )
+                insights = response.get('insights', [])
             
             # For each non-passing insight, fetch detailed information
             enhanced_insights = []
@@ -354,10 +409,10 @@ class AWSClient:
                             insight['insight'] = detailed_insight
                             
                     except ClientError as e:
-                        print(f"Failed to get detailed insight {insight.get('id', 'unknown')} for {cluster_name}: {str(e)}")
+                        logger.error("Failed to get detailed insight %s for %s: %s", insight.get('id', 'unknown'), cluster_name, e)
                         # Continue without detailed info if describe_insight fails
                     except Exception as e:
-                        print(f"Warning: Could not retrieve insight details: {str(e)}")
+                        logger.warning("Warning: Could not retrieve insight details: %s", e)
                         # Continue without detailed info
                 
                 enhanced_insights.append(insight)
@@ -367,12 +422,12 @@ class AWSClient:
         except ClientError as e:
             error_msg = str(e)
             if 'list_insights' in error_msg or 'describe_insight' in error_msg:
-                print(f"Warning: EKS Insights API not available in region {self.eks_client.meta.region_name} for cluster {cluster_name}: {error_msg}")
+                logger.warning("Warning: EKS Insights API not available in region %s for cluster %s: %s", self.eks_client.meta.region_name, cluster_name, error_msg)
             else:
-                print(f"Failed to get cluster insights for {cluster_name}: {error_msg}")
+                logger.error("Failed to get cluster insights for %s: %s", cluster_name, error_msg)
             return []
         except Exception as e:
-            print(f"Warning: Could not retrieve cluster insights for {cluster_name}: {str(e)}")
+            logger.warning("Warning: Could not retrieve cluster insights for %s: %s", cluster_name, e)
             return []
     
     def get_insight_details(self, cluster_name: str, insight_id: str) -> Optional[Dict[str, Any]]:
@@ -384,7 +439,7 @@ class AWSClient:
             )
             return response.get('insight', {})
         except ClientError as e:
-            print(f"Failed to get insight details for {insight_id}: {str(e)}")
+            logger.error("Failed to get insight details for %s: %s", insight_id, e)
             return None
     
     def get_addons(self, cluster_name: str) -> List[Dict[str, Any]]:
@@ -401,7 +456,7 @@ class AWSClient:
             
             return addons
         except ClientError as e:
-            print(f"Failed to get addons for {cluster_name}: {str(e)}")
+            logger.error("Failed to get addons for %s: %s", cluster_name, e)
             return []
     
     def get_addon_info(self, cluster_name: str, addon_name: str) -> Optional[Dict[str, Any]]:
@@ -413,10 +468,10 @@ class AWSClient:
             )
             return response.get('addon', {})
         except ClientError as e:
-            print(f"Failed to get addon info for {addon_name}: {str(e)}")
+            logger.error("Failed to get addon info for %s: %s", addon_name, e)
             return None
         except Exception as e:
-            print(f"Unexpected error getting addon info for {addon_name}: {str(e)}")
+            logger.error("Unexpected error getting addon info for %s: %s", addon_name, e)
             return None
     
     def get_fargate_profiles(self, cluster_name: str) -> List[Dict[str, Any]]:
@@ -433,7 +488,7 @@ class AWSClient:
             
             return profiles
         except ClientError as e:
-            print(f"Failed to get Fargate profiles for {cluster_name}: {str(e)}")
+            logger.error("Failed to get Fargate profiles for %s: %s", cluster_name, e)
             return []
     
     def get_fargate_profile_info(self, cluster_name: str, profile_name: str) -> Optional[Dict[str, Any]]:
@@ -445,7 +500,7 @@ class AWSClient:
             )
             return response.get('fargateProfile', {})
         except ClientError as e:
-            print(f"Failed to get Fargate profile info for {profile_name}: {str(e)}")
+            logger.error("Failed to get Fargate profile info for %s: %s", profile_name, e)
             return None
     
     def get_cluster_metadata(self, cluster_name: str, output_dir: str = None) -> Dict[str, Any]:
@@ -469,6 +524,7 @@ class AWSClient:
         }
         
         # Create cluster-specific directory structure for original data
+        cluster_dir = None
         if output_dir:
             cluster_dir = Path(output_dir) / "cluster-metadata" / cluster_name
             cluster_dir.mkdir(parents=True, exist_ok=True)
@@ -481,149 +537,177 @@ class AWSClient:
             (cluster_dir / "karpenter").mkdir(exist_ok=True)
             (cluster_dir / "plugins").mkdir(exist_ok=True)
         
-        try:
-            print(f"    📊 Collecting basic cluster info...")
-            # Get basic cluster information
-            cluster_info = self.get_cluster_info(cluster_name)
-            if cluster_info:
-                metadata['cluster_version'] = cluster_info.version
-                metadata['cluster_status'] = cluster_info.status
-                metadata['platform_version'] = cluster_info.platform_version
-                metadata['created_at'] = cluster_info.created_at
+        # Each section is an independent describe call, so fetch them side by side
+        sections = {
+            'cluster': self._collect_cluster_section,
+            'node_groups': self._collect_node_groups_section,
+            'fargate_profiles': self._collect_fargate_section,
+            'addons': self._collect_addons_section,
+            'karpenter': self._get_karpenter_info_lightweight,
+        }
+        section_labels = {
+            'node_groups': 'node groups',
+            'fargate_profiles': 'Fargate profiles',
+            'addons': 'addons',
+            'karpenter': 'Karpenter info',
+        }
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(sections))) as executor:
+            futures = {
+                executor.submit(collect, cluster_name, cluster_dir): key
+                for key, collect in sections.items()
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    result = future.result()
+                except AWSCredentialsError:
+                    raise
+                except Exception as e:
+                    if key == 'cluster':
+                        logger.error("Error collecting metadata for %s: %s", cluster_name, e)
+                        metadata['error'] = str(e)
+                    else:
+                        logger.warning("    ⚠️  Error collecting %s: %s", section_labels[key], e)
+                    continue
                 
-                # Save original cluster data to YAML file
-                if output_dir:
-                    cluster_data = {
-                        'apiVersion': 'eks.aws.amazon.com/v1',
-                        'kind': 'Cluster',
-                        'metadata': {
-                            'name': cluster_info.name,
-                            'arn': cluster_info.arn,
-                            'tags': cluster_info.tags
-                        },
-                        'spec': {
-                            'version': cluster_info.version,
-                            'platformVersion': cluster_info.platform_version,
-                            'status': cluster_info.status,
-                            'endpoint': cluster_info.endpoint,
-                            'roleArn': cluster_info.role_arn,
-                            'vpcConfig': cluster_info.vpc_config,
-                            'logging': cluster_info.logging,
-                            'identity': cluster_info.identity,
-                            'createdAt': cluster_info.created_at
-                        }
-                    }
-                    self._save_yaml_file(cluster_dir / "cluster" / "cluster.yaml", cluster_data)
+                if key == 'cluster':
+                    metadata.update(result)
+                else:
+                    metadata[key] = result
+        
+        # AWS plugins info is now available in the addons section - no separate collection needed
+        
+        return metadata
+    
+    def _collect_cluster_section(self, cluster_name: str, cluster_dir: Path = None) -> Dict[str, Any]:
+        """Get basic cluster information and save the original cluster data."""
+        logger.info("    📊 Collecting basic cluster info...")
+        cluster_info = self.get_cluster_info(cluster_name)
+        if not cluster_info:
+            return {}
+        
+        # Save original cluster data to YAML file
+        if cluster_dir:
+            cluster_data = {
+                'apiVersion': 'eks.aws.amazon.com/v1',
+                'kind': 'Cluster',
+                'metadata': {
+                    'name': cluster_info.name,
+                    'arn': cluster_info.arn,
+                    'tags': cluster_info.tags
+                },
+                'spec': {
+                    'version': cluster_info.version,
+                    'platformVersion': cluster_info.platform_version,
+                    'status': cluster_info.status,
+                    'endpoint': cluster_info.endpoint,
+                    'roleArn': cluster_info.role_arn,
+                    'vpcConfig': cluster_info.vpc_config,
+                    'logging': cluster_info.logging,
+                    'identity': cluster_info.identity,
+                    'createdAt': cluster_info.created_at
+                }
+            }
+            self._save_yaml_file(cluster_dir / "cluster" / "cluster.yaml", cluster_data)
+        
+        return {
+            'cluster_version': cluster_info.version,
+            'cluster_status': cluster_info.status,
+            'platform_version': cluster_info.platform_version,
+            'created_at': cluster_info.created_at
+        }
+    
+    def _collect_node_groups_section(self, cluster_name: str, cluster_dir: Path = None) -> List[Dict[str, Any]]:
+        """Get node groups - upgrade-focused info only."""
+        logger.info("    📊 Collecting node groups...")
+        node_groups = []
+        for ng in self.get_node_groups(cluster_name):
+            node_groups.append({
+                'name': ng.nodegroup_name,
+                'status': ng.status,
+                'version': ng.version,
+                'capacity_type': ng.capacity_type,
+                'instance_types': ng.instance_types,
+                'ami_type': ng.ami_type,
+                'node_role': ng.node_role,
+                'is_managed': ng.is_managed,  # True for managed, False for self-managed
+                'nodegroup_type': ng.nodegroup_type,  # 'managed' or 'unmanaged'
+                'asg_name': ng.asg_name,  # ASG name for self-managed groups
+                'scaling_config': ng.scaling_config
+            })
             
-            print(f"    📊 Collecting node groups...")
-            # Get node groups - upgrade-focused info only
-            try:
-                node_groups = self.get_node_groups(cluster_name)
-                for ng in node_groups:
-                    metadata['node_groups'].append({
+            # Save original node group data
+            if cluster_dir:
+                ng_data = {
+                    'apiVersion': 'eks.aws.amazon.com/v1',
+                    'kind': 'NodeGroup',
+                    'metadata': {
                         'name': ng.nodegroup_name,
+                        'clusterName': ng.cluster_name
+                    },
+                    'spec': {
                         'status': ng.status,
+                        'capacityType': ng.capacity_type,
+                        'instanceTypes': ng.instance_types,
+                        'amiType': ng.ami_type,
+                        'nodeRole': ng.node_role,
+                        'scalingConfig': ng.scaling_config,
                         'version': ng.version,
-                        'capacity_type': ng.capacity_type,
-                        'instance_types': ng.instance_types,
-                        'ami_type': ng.ami_type,
-                        'node_role': ng.node_role,
-                        'is_managed': ng.is_managed,  # True for managed, False for self-managed
-                        'nodegroup_type': ng.nodegroup_type,  # 'managed' or 'unmanaged'
-                        'asg_name': ng.asg_name,  # ASG name for self-managed groups
-                        'scaling_config': ng.scaling_config
-                    })
-                    
-                    # Save original node group data
-                    if output_dir:
-                        ng_data = {
-                            'apiVersion': 'eks.aws.amazon.com/v1',
-                            'kind': 'NodeGroup',
-                            'metadata': {
-                                'name': ng.nodegroup_name,
-                                'clusterName': ng.cluster_name
-                            },
-                            'spec': {
-                                'status': ng.status,
-                                'capacityType': ng.capacity_type,
-                                'instanceTypes': ng.instance_types,
-                                'amiType': ng.ami_type,
-                                'nodeRole': ng.node_role,
-                                'scalingConfig': ng.scaling_config,
-                                'version': ng.version,
-                                'releaseVersion': ng.release_version
-                            }
-                        }
-                        self._save_yaml_file(cluster_dir / "nodegroups" / f"nodegroup-{ng.nodegroup_name}.yaml", ng_data)
-            except Exception as e:
-                print(f"    ⚠️  Error collecting node groups: {str(e)}")
+                        'releaseVersion': ng.release_version
+                    }
+                }
+                self._save_yaml_file(cluster_dir / "nodegroups" / f"nodegroup-{ng.nodegroup_name}.yaml", ng_data)
+        return node_groups
+    
+    def _collect_fargate_section(self, cluster_name: str, cluster_dir: Path = None) -> List[Dict[str, Any]]:
+        """Get Fargate profiles - upgrade-focused info only."""
+        logger.info("    📊 Collecting Fargate profiles...")
+        fargate_profiles = []
+        for fp in self.get_fargate_profiles(cluster_name):
+            fargate_profiles.append({
+                'name': fp.get('fargateProfileName'),
+                'status': fp.get('status')
+            })
             
-            print(f"    📊 Collecting Fargate profiles...")
-            # Get Fargate profiles - upgrade-focused info only
-            try:
-                fargate_profiles = self.get_fargate_profiles(cluster_name)
-                for fp in fargate_profiles:
-                    metadata['fargate_profiles'].append({
+            # Save original Fargate profile data
+            if cluster_dir:
+                fp_data = {
+                    'apiVersion': 'eks.aws.amazon.com/v1',
+                    'kind': 'FargateProfile',
+                    'metadata': {
                         'name': fp.get('fargateProfileName'),
-                        'status': fp.get('status')
-                    })
-                    
-                    # Save original Fargate profile data
-                    if output_dir:
-                        fp_data = {
-                            'apiVersion': 'eks.aws.amazon.com/v1',
-                            'kind': 'FargateProfile',
-                            'metadata': {
-                                'name': fp.get('fargateProfileName'),
-                                'clusterName': cluster_name
-                            },
-                            'spec': fp
-                        }
-                        self._save_yaml_file(cluster_dir / "fargate" / f"fargate-{fp.get('fargateProfileName')}.yaml", fp_data)
-            except Exception as e:
-                print(f"    ⚠️  Error collecting Fargate profiles: {str(e)}")
+                        'clusterName': cluster_name
+                    },
+                    'spec': fp
+                }
+                self._save_yaml_file(cluster_dir / "fargate" / f"fargate-{fp.get('fargateProfileName')}.yaml", fp_data)
+        return fargate_profiles
+    
+    def _collect_addons_section(self, cluster_name: str, cluster_dir: Path = None) -> List[Dict[str, Any]]:
+        """Get addons - upgrade-focused info only."""
+        logger.info("    📊 Collecting EKS addons...")
+        addons = []
+        for addon in self.get_addons(cluster_name):
+            addons.append({
+                'name': addon.get('addonName'),
+                'version': addon.get('addonVersion'),
+                'status': addon.get('status')
+            })
             
-            print(f"    📊 Collecting EKS addons...")
-            # Get addons - upgrade-focused info only
-            try:
-                addons = self.get_addons(cluster_name)
-                for addon in addons:
-                    metadata['addons'].append({
+            # Save original addon data
+            if cluster_dir:
+                addon_data = {
+                    'apiVersion': 'eks.aws.amazon.com/v1',
+                    'kind': 'Addon',
+                    'metadata': {
                         'name': addon.get('addonName'),
-                        'version': addon.get('addonVersion'),
-                        'status': addon.get('status')
-                    })
-                    
-                    # Save original addon data
-                    if output_dir:
-                        addon_data = {
-                            'apiVersion': 'eks.aws.amazon.com/v1',
-                            'kind': 'Addon',
-                            'metadata': {
-                                'name': addon.get('addonName'),
-                                'clusterName': cluster_name
-                            },
-                            'spec': addon
-                        }
-                        self._save_yaml_file(cluster_dir / "addons" / f"addon-{addon.get('addonName')}.yaml", addon_data)
-            except Exception as e:
-                print(f"    ⚠️  Error collecting addons: {str(e)}")
-            
-            print(f"    📊 Collecting Karpenter info...")
-            # Get Karpenter information - upgrade-focused info only
-            try:
-                karpenter_info = self._get_karpenter_info_lightweight(cluster_name, cluster_dir if output_dir else None)
-                metadata['karpenter'] = karpenter_info
-            except Exception as e:
-                print(f"    ⚠️  Error collecting Karpenter info: {str(e)}")
-            
-            # AWS plugins info is now available in the addons section - no separate collection needed
-            
-        except Exception as e:
-            print(f"Error collecting metadata for {cluster_name}: {str(e)}")
-            metadata['error'] = str(e)
-        
-        return metadata
+                        'clusterName': cluster_name
+                    },
+                    'spec': addon
+                }
+                self._save_yaml_file(cluster_dir / "addons" / f"addon-{addon.get('addonName')}.yaml", addon_data)
+        return addons
     
     def _save_yaml_file(self, file_path: Path, data: Dict[str, Any]):
         """Save data to YAML file."""
@@ -639,6 +723,7 @@ class AWSClient:
     
     def _get_karpenter_info_lightweight(self, cluster_name: str, cluster_dir: Path = None) -> Dict[str, Any]:
         """Get lightweight Karpenter information for upgrade purposes."""
+        logger.info("    📊 Collecting Karpenter info...")
         karpenter_info = {
             'installed': False,
             'node_pools_count': 0,
@@ -816,10 +901,10 @@ class AWSClient:
                                 pass
                     
             except Exception as e:
-                print(f"    ⚠️  Error checking manual controllers: {str(e)}")
+                logger.warning("    ⚠️  Error checking manual controllers: %s", e)
                 
         except Exception as e:
-            print(f"    ⚠️  Error collecting AWS plugins: {str(e)}")
+            logger.warning("    ⚠️  Error collecting AWS plugins: %s", e)
             plugins_info['error'] = str(e)
         
         return plugins_info
@@ -0,0 +1,127 @@
+"""
+Tests for EKS addon compatibility analysis
+"""
+
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+from botocore.stub import Stubber
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import addon_compatibility
+from addon_compatibility import EKSAddonCompatibilityAnalyzer
+
+
+def compatibility_data(min_version, max_version):
+    """Compatibility matrix with a single vpc-cni entry for EKS 1.30."""
+    return {
+        '1.30': {
+            'vpc-cni': {
+                'min_addon_version': min_version,
+                'max_addon_version': max_version,
+                'default_version': max_version,
+                'all_versions': [max_version, min_version],
+                'addon_type': 'core_aws'
+            }
+        }
+    }
+
+
+class TestAddonCompatibility(unittest.TestCase):
+    """Test per-addon compatibility verdicts."""
+    
+    def setUp(self):
+        self.analyzer = EKSAddonCompatibilityAnalyzer(region='us-east-1')
+        self.analyzer.compatibility_data = compatibility_data('v1.16.0-eksbuild.1', 'v1.18.3-eksbuild.2')
+    
+    def analyze(self, analyzer, current_version):
+        result = analyzer.analyze_cluster_addon_compatibility(
+            'test-cluster', '1.29', '1.30', [{'name': 'vpc-cni', 'version': current_version}]
+        )
+        return result['addon_analysis'][0]['compatibility_status']
+    
+    def test_compatibility_status(self):
+        """Versions are compared against the target range."""
+        self.assertEqual(self.analyze(self.analyzer, 'v1.17.0-eksbuild.1'), 'compatible')
+        self.assertEqual(self.analyze(self.analyzer, 'v1.15.0-eksbuild.1'), 'upgrade_required')
+        self.assertEqual(self.analyze(self.analyzer, 'v1.19.0-eksbuild.1'), 'upgrade_required')
+    
+    def test_unknown_addon(self):
+        """Addons missing from the compatibility data need manual verification."""
+        result = self.analyzer.analyze_cluster_addon_compatibility(
+            'test-cluster', '1.29', '1.30', [{'name': 'custom-addon', 'version': 'v1.0.0'}]
+        )
+        self.assertEqual(result['addon_analysis'][0]['compatibility_status'], 'unknown')
+    
+    def test_verdict_cache_is_bounded(self):
+        """Verdicts are cached in a bounded LRU rather than an ever-growing dict."""
+        cache_info = EKSAddonCompatibilityAnalyzer._determine_compatibility_status.cache_info()
+        self.assertIsNotNone(cache_info.maxsize)
+    
+    def test_rebuilt_index_is_not_served_stale_verdicts(self):
+        """A new compatibility range for the same target and addon gets a fresh verdict."""
+        self.assertEqual(self.analyze(self.analyzer, 'v1.17.0-eksbuild.1'), 'compatible')
+        
+        analyzer = EKSAddonCompatibilityAnalyzer(region='us-east-1')
+        analyzer.compatibility_data = compatibility_data('v1.18.0-eksbuild.1', 'v1.19.0-eksbuild.1')
+        self.assertEqual(self.analyze(analyzer, 'v1.17.0-eksbuild.1'), 'upgrade_required')
+
+
+
+class TestCompatibilityDiskCache(unittest.TestCase):
+    """Test that only complete describe_addon_versions scans reach the disk cache."""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(addon_compatibility, 'CACHE_DIR', Path(self.tmp_dir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+        
+        self.analyzer = EKSAddonCompatibilityAnalyzer(region='us-east-1')
+        self.stubber = Stubber(self.analyzer.eks_client)
+        self.stubber.activate()
+        self.addCleanup(self.stubber.deactivate)
+    
+    def stub_page(self, next_token=None, request_token=None):
+        response = {'addons': [{
+            'addonName': 'vpc-cni',
+            'addonVersions': [{
+                'addonVersion': 'v1.18.3-eksbuild.2',
+                'compatibilities': [{'clusterVersion': '1.30', 'defaultVersion': True}]
+            }]
+        }]}
+        if next_token:
+            response['nextToken'] = next_token
+        params = {'maxResults': 100}
+        if request_token:
+            params['nextToken'] = request_token
+        self.stubber.add_response('describe_addon_versions', response, params)
+    
+    def test_complete_scan_is_cached(self):
+        """A finished scan is written to the disk cache."""
+        self.stub_page()
+        
+        data = self.analyzer.get_compatibility_data()
+        
+        self.assertIn('vpc-cni', data['1.30'])
+        self.assertTrue(self.analyzer._get_cache_file().exists())
+    
+    def test_partial_scan_is_not_cached(self):
+        """A scan that fails part-way is used for this run but not cached."""
+        self.stub_page(next_token='page-2')
+        self.stubber.add_client_error('describe_addon_versions', 'ThrottlingException')
+        
+        data = self.analyzer.get_compatibility_data()
+        
+        self.assertIn('vpc-cni', data['1.30'])
+        self.assertFalse(self.analyzer._get_cache_file().exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
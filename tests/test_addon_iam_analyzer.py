@@ -0,0 +1,95 @@
+"""
+Tests for EKS addon IAM analysis
+"""
+
+import gc
+import unittest
+import sys
+import weakref
+from pathlib import Path
+
+import boto3
+from botocore.stub import Stubber
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from addon_iam_analyzer import AddonIAMAnalyzer
+
+CLUSTER = 'test-cluster'
+ROLE_ARN = 'arn:aws:iam::123456789012:role/vpc-cni-role'
+
+
+class FakeAWSClient:
+    """Minimal AWSClient stand-in exposing stubbed EKS and IAM clients."""
+    
+    def __init__(self):
+        credentials = {'aws_access_key_id': 'testing', 'aws_secret_access_key': 'testing'}
+        self.eks_client = boto3.client('eks', region_name='us-east-1', **credentials)
+        self.iam_client = boto3.client('iam', region_name='us-east-1', **credentials)
+
+
+class TestDescribeAddonCache(unittest.TestCase):
+    """Test that describe_addon results are cached per analyzer instance."""
+    
+    def setUp(self):
+        self.aws_client = FakeAWSClient()
+        self.stubber = Stubber(self.aws_client.eks_client)
+        self.stubber.activate()
+    
+    def tearDown(self):
+        self.stubber.deactivate()
+    
+    def stub_describe(self, addon_name='vpc-cni'):
+        self.stubber.add_response(
+            'describe_addon',
+            {'addon': {'addonName': addon_name, 'clusterName': CLUSTER, 'serviceAccountRoleArn': ROLE_ARN}},
+            {'clusterName': CLUSTER, 'addonName': addon_name}
+        )
+    
+    def test_describe_once_per_analyzer(self):
+        """Repeat lookups on one analyzer reuse the first response."""
+        self.stub_describe()
+        analyzer = AddonIAMAnalyzer(self.aws_client)
+        
+        first = analyzer._describe_addon_cached(CLUSTER, 'vpc-cni')
+        second = analyzer._describe_addon_cached(CLUSTER, 'vpc-cni')
+        
+        self.assertEqual(first['serviceAccountRoleArn'], ROLE_ARN)
+        self.assertIs(first, second)
+        self.stubber.assert_no_pending_responses()
+    
+    def test_cache_not_shared_between_analyzers(self):
+        """Each analyzer describes addons itself, so a new run sees fresh data."""
+        self.stub_describe()
+        self.stub_describe()
+        
+        AddonIAMAnalyzer(self.aws_client)._describe_addon_cached(CLUSTER, 'vpc-cni')
+        AddonIAMAnalyzer(self.aws_client)._describe_addon_cached(CLUSTER, 'vpc-cni')
+        
+        self.stubber.assert_no_pending_responses()
+    
+    def test_failures_are_not_cached(self):
+        """A failed describe is retried on the next lookup."""
+        self.stubber.add_client_error('describe_addon', 'ResourceNotFoundException')
+        self.stub_describe()
+        analyzer = AddonIAMAnalyzer(self.aws_client)
+        
+        with self.assertRaises(Exception):
+            analyzer._describe_addon_cached(CLUSTER, 'vpc-cni')
+        self.assertEqual(analyzer._describe_addon_cached(CLUSTER, 'vpc-cni')['addonName'], 'vpc-cni')
+    
+    def test_analyzer_can_be_collected(self):
+        """Cached responses do not keep the analyzer alive."""
+        self.stub_describe()
+        analyzer = AddonIAMAnalyzer(self.aws_client)
+        analyzer._describe_addon_cached(CLUSTER, 'vpc-cni')
+        
+        ref = weakref.ref(analyzer)
+        del analyzer
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,7 +10,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from config.parser import ConfigParser
-from assessment.compatibility import CompatibilityChecker
+from addon_compatibility import EKSAddonCompatibilityAnalyzer
 from generators.reports import ReportGenerator
 
 
@@ -21,24 +21,25 @@ class TestBasicFunctionality(unittest.TestCase):
         """Test that ConfigParser can be imported."""
         self.assertIsNotNone(ConfigParser)
     
-    def test_compatibility_checker_import(self):
-        """Test that CompatibilityChecker can be imported."""
-        self.assertIsNotNone(CompatibilityChecker)
+    def test_compatibility_analyzer_import(self):
+        """Test that EKSAddonCompatibilityAnalyzer can be imported."""
+        self.assertIsNotNone(EKSAddonCompatibilityAnalyzer)
     
     def test_report_generator_import(self):
         """Test that ReportGenerator can be imported."""
         self.assertIsNotNone(ReportGenerator)
     
-    def test_compatibility_checker_initialization(self):
-        """Test that CompatibilityChecker can be initialized."""
-        checker = CompatibilityChecker()
-        self.assertIsNotNone(checker)
+    def test_compatibility_analyzer_initialization(self):
+        """Test that EKSAddonCompatibilityAnalyzer can be initialized."""
+        analyzer = EKSAddonCompatibilityAnalyzer(region='us-east-1')
+        self.assertIsNotNone(analyzer)
     
-    def test_supported_versions(self):
-        """Test that supported versions are defined."""
-        checker = CompatibilityChecker()
-        self.assertGreater(len(checker.EKS_SUPPORTED_VERSIONS), 0)
-        self.assertIn("1.28", checker.EKS_SUPPORTED_VERSIONS)
+    def test_addon_types(self):
+        """Test that core and AWS managed addons are classified."""
+        analyzer = EKSAddonCompatibilityAnalyzer(region='us-east-1')
+        self.assertEqual(analyzer._determine_addon_type('vpc-cni'), 'core_aws')
+        self.assertEqual(analyzer._determine_addon_type('aws-for-fluent-bit'), 'aws_managed')
+        self.assertEqual(analyzer._determine_addon_type('custom-addon'), 'third_party')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,206 @@
+"""
+Tests for EKS Cluster Insights readiness analysis
+"""
+
+import unittest
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+import boto3
+from botocore.stub import Stubber
+
+# The assessment package uses relative imports into utils, so import it through src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.assessment import cluster_insights
+from src.assessment.cluster_insights import ClusterInsightsAnalyzer, InsightFetcher
+
+CLUSTER = 'test-cluster'
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def insight_summary(insight_id, status):
+    """A list_insights summary row as the EKS API returns it."""
+    return {
+        'id': insight_id,
+        'name': f'insight {insight_id}',
+        'category': 'UPGRADE_READINESS',
+        'kubernetesVersion': '1.30',
+        'lastRefreshTime': NOW,
+        'lastTransitionTime': NOW,
+        'description': f'summary {insight_id}',
+        'insightStatus': {'status': status, 'reason': 'reason'}
+    }
+
+
+class FakeAWSClient:
+    """Minimal AWSClient stand-in; the EKS client is injected into the analyzer."""
+
+    def __init__(self):
+        self.region = 'us-east-1'
+        self.profile = 'test'
+
+    def get_client(self, service_name, config=None):
+        raise AssertionError('tests inject the EKS client')
+
+
+class TestUpgradeReadiness(unittest.TestCase):
+    """Test analyze_upgrade_readiness against Stubber-shaped EKS responses."""
+
+    def setUp(self):
+        cluster_insights._insights_cache.clear()
+        self.eks = boto3.client(
+            'eks', region_name='us-east-1',
+            aws_access_key_id='testing', aws_secret_access_key='testing'
+        )
+        self.stubber = Stubber(self.eks)
+        self.stubber.activate()
+        # One worker keeps describe_insight calls in submission order for the stubber
+        self.fetcher = InsightFetcher(self.eks, workers=1)
+        self.analyzer = ClusterInsightsAnalyzer(
+            FakeAWSClient(), insight_fetcher=self.fetcher, eks_client=self.eks
+        )
+
+    def tearDown(self):
+        self.fetcher.close()
+        self.stubber.deactivate()
+
+    def stub_list(self, summaries):
+        self.stubber.add_response(
+            'list_insights', {'insights': summaries},
+            {'clusterName': CLUSTER, 'maxResults': 100}
+        )
+
+    def stub_describe(self, summary):
+        self.stubber.add_response(
+            'describe_insight',
+            {'insight': {**summary, 'recommendation': f"fix {summary['id']}"}},
+            {'clusterName': CLUSTER, 'id': summary['id']}
+        )
+
+    def test_severity_from_insight_status(self):
+        """ERROR, WARNING and PASSING insights land in separate buckets with recommendations."""
+        summaries = [
+            insight_summary('error', 'ERROR'),
+            insight_summary('warning', 'WARNING'),
+            insight_summary('passing', 'PASSING')
+        ]
+        self.stub_list(summaries)
+        for summary in summaries:
+            self.stub_describe(summary)
+
+        result = self.analyzer.analyze_upgrade_readiness(CLUSTER)
+
+        self.assertEqual([i['id'] for i in result['upgrade_blockers']], ['error'])
+        self.assertEqual([i['id'] for i in result['warnings']], ['warning'])
+        self.assertEqual([i['id'] for i in result['recommendations']], ['passing'])
+        self.assertEqual(result['upgrade_blockers'][0]['recommendation'], 'fix error')
+        self.assertEqual(result['recommendations'][0]['recommendation'], 'fix passing')
+        self.assertEqual(result['readiness_score'], 50)
+        self.stubber.assert_no_pending_responses()
+
+    def test_min_severity_filters_on_status(self):
+        """min_severity=MEDIUM keeps ERROR and WARNING insights and describes only those."""
+        summaries = [
+            insight_summary('error', 'ERROR'),
+            insight_summary('passing', 'PASSING'),
+            insight_summary('warning', 'WARNING')
+        ]
+        self.stub_list(summaries)
+        self.stub_describe(summaries[0])
+        self.stub_describe(summaries[2])
+
+        result = self.analyzer.analyze_upgrade_readiness(CLUSTER, min_severity='MEDIUM')
+
+        self.assertEqual([i['id'] for i in result['upgrade_blockers']], ['error'])
+        self.assertEqual([i['id'] for i in result['warnings']], ['warning'])
+        self.assertEqual(result['recommendations'], [])
+        self.assertEqual(result['readiness_score'], 55)
+        self.stubber.assert_no_pending_responses()
+
+    def test_min_severity_high_still_reports_errors(self):
+        """min_severity=HIGH must not report a clean score while ERROR insights exist."""
+        summaries = [insight_summary('error', 'ERROR'), insight_summary('warning', 'WARNING')]
+        self.stub_list(summaries)
+        self.stub_describe(summaries[0])
+
+        result = self.analyzer.analyze_upgrade_readiness(CLUSTER, min_severity='HIGH')
+
+        self.assertEqual(len(result['upgrade_blockers']), 1)
+        self.assertEqual(result['readiness_score'], 70)
+
+    def test_only_score_skips_describe(self):
+        """only_score scores from list_insights alone and stops at 0."""
+        self.stub_list([insight_summary(f'e{i}', 'ERROR') for i in range(5)])
+
+        result = self.analyzer.analyze_upgrade_readiness(CLUSTER, only_score=True)
+
+        self.assertEqual(result['readiness_score'], 0)
+        self.assertEqual(result['upgrade_blockers'], [])
+        self.stubber.assert_no_pending_responses()
+
+    def test_failed_describe_keeps_finding(self):
+        """A failed describe_insight still reports the finding from its summary."""
+        summary = insight_summary('error', 'ERROR')
+        self.stub_list([summary])
+        self.stubber.add_client_error('describe_insight', 'ResourceNotFoundException')
+
+        result = self.analyzer.analyze_upgrade_readiness(CLUSTER)
+
+        self.assertEqual([i['id'] for i in result['upgrade_blockers']], ['error'])
+        self.assertIsNone(result['upgrade_blockers'][0]['recommendation'])
+        self.assertEqual(result['readiness_score'], 70)
+
+    def test_details_reused_from_cache(self):
+        """A second analysis within the TTL reuses the cached list and describe results."""
+        summary = insight_summary('error', 'ERROR')
+        self.stub_list([summary])
+        self.stub_describe(summary)
+
+        first = self.analyzer.analyze_upgrade_readiness(CLUSTER)
+        second = self.analyzer.analyze_upgrade_readiness(CLUSTER)
+
+        self.assertEqual(first, second)
+        self.assertEqual(second['upgrade_blockers'][0]['recommendation'], 'fix error')
+        self.stubber.assert_no_pending_responses()
+
+    def test_invalid_min_severity(self):
+        """An unknown min_severity is rejected rather than silently filtering everything."""
+        with self.assertRaises(ValueError):
+            self.analyzer.analyze_upgrade_readiness(CLUSTER, min_severity='CRITICAL')
+
+
+class TestClientCache(unittest.TestCase):
+    """Test the EKS client cache shared by analyzers."""
+
+    def setUp(self):
+        ClusterInsightsAnalyzer.clear_client_cache()
+        self.addCleanup(ClusterInsightsAnalyzer.clear_client_cache)
+
+    def test_client_cached_per_aws_client(self):
+        """Analyzers built from one AWSClient share an EKS client; others get their own."""
+        aws_client = mock.Mock(region='us-east-1', profile='default')
+        other = mock.Mock(region='us-east-1', profile='default')
+
+        first = ClusterInsightsAnalyzer(aws_client)
+        second = ClusterInsightsAnalyzer(aws_client)
+        third = ClusterInsightsAnalyzer(other)
+
+        self.assertIs(first.eks_client, second.eks_client)
+        self.assertIsNot(first.eks_client, third.eks_client)
+        aws_client.get_client.assert_called_once()
+
+    def test_clear_client_cache(self):
+        """Clearing the cache makes the next analyzer create a fresh client."""
+        aws_client = mock.Mock(region='us-east-1', profile='default')
+        ClusterInsightsAnalyzer(aws_client)
+        ClusterInsightsAnalyzer.clear_client_cache()
+        ClusterInsightsAnalyzer(aws_client)
+
+        self.assertEqual(aws_client.get_client.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
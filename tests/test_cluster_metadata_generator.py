@@ -0,0 +1,88 @@
+"""
+Tests for cluster metadata generation
+"""
+
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+import boto3
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
+from click.testing import CliRunner
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import cluster_metadata_generator
+from cluster_metadata_generator import ClusterMetadataGenerator
+from utils.aws_client import AWSClient, AWSCredentialsError
+
+
+class TestCredentialErrors(unittest.TestCase):
+    """Test that credential failures stop the run with a clear error."""
+    
+    def setUp(self):
+        self.eks = boto3.client(
+            'eks', region_name='us-east-1',
+            aws_access_key_id='testing', aws_secret_access_key='testing'
+        )
+        self.stubber = Stubber(self.eks)
+        self.stubber.activate()
+        self.addCleanup(self.stubber.deactivate)
+        
+        self.generator = ClusterMetadataGenerator('us-east-1', 'test')
+        self.generator.aws_client._eks_client = self.eks
+        self.output_file = str(Path(tempfile.mkdtemp()) / 'clusters-metadata.json')
+    
+    def test_rejected_credentials_on_discovery(self):
+        """An auth error from list_clusters is a credentials error, not 'No clusters found'."""
+        self.stubber.add_client_error('list_clusters', 'UnrecognizedClientException')
+        
+        with self.assertRaises(AWSCredentialsError) as ctx:
+            self.generator.generate_and_save(output_file=self.output_file)
+        self.assertIn("profile 'test'", str(ctx.exception))
+        self.assertFalse(Path(self.output_file).exists())
+    
+    def test_other_discovery_errors_find_no_clusters(self):
+        """Errors unrelated to credentials still fall back to an empty discovery."""
+        self.stubber.add_client_error('list_clusters', 'ServerException', http_status_code=500)
+        
+        with self.assertRaises(ValueError):
+            self.generator.generate_and_save(output_file=self.output_file)
+    
+    def test_expired_credentials_for_named_clusters(self):
+        """An auth error describing a named cluster stops the run instead of a per-cluster error."""
+        self.stubber.add_client_error('describe_cluster', 'ExpiredTokenException')
+        # Only the cluster section calls EKS, so the stubbed responses stay in order
+        aws_client = self.generator.aws_client
+        for section in ('_collect_node_groups_section', '_collect_fargate_section',
+                        '_collect_addons_section', '_get_karpenter_info_lightweight'):
+            setattr(aws_client, section, lambda cluster_name, cluster_dir: [])
+        
+        with self.assertRaises(AWSCredentialsError):
+            self.generator.generate_cluster_metadata(['c1'])
+    
+    def test_cli_exits_non_zero(self):
+        """The CLI reports the credentials problem and exits with a failure status."""
+        auth_error = ClientError({'Error': {'Code': 'InvalidClientTokenId', 'Message': 'bad token'}}, 'ListClusters')
+        
+        def rejecting_discovery(aws_client):
+            aws_client._raise_if_credentials_error(auth_error)
+        
+        patcher = mock.patch.object(AWSClient, 'discover_clusters', rejecting_discovery)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        result = CliRunner().invoke(cluster_metadata_generator.main, [
+            '--region', 'us-east-1', '--profile', 'test', '--output', self.output_file
+        ])
+        
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('credentials', result.output)
+
+
+if __name__ == '__main__':
+    unittest.main()
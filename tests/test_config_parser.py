@@ -0,0 +1,63 @@
+"""
+Tests for configuration loading
+"""
+
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from config.parser import ConfigParser
+
+
+class TestLoadConfig(unittest.TestCase):
+    """Test ConfigParser.load_config and its (path, mtime) cache."""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.tmp_dir.name, 'eks-upgrade-config.yaml')
+        ConfigParser.create_sample_config(self.config_path)
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_sample_config(self):
+        """The sample config parses into its sections."""
+        config = ConfigParser.load_config(self.config_path)
+        self.assertEqual(config.aws_configuration.region, 'us-east-1')
+        self.assertEqual(config.upgrade_targets.control_plane_target_version, '1.33')
+        self.assertEqual(ConfigParser.validate_config(config), [])
+    
+    def test_unchanged_file_is_cached(self):
+        """Loading an unchanged file returns the cached config."""
+        first = ConfigParser.load_config(self.config_path)
+        second = ConfigParser.load_config(os.path.relpath(self.config_path))
+        self.assertIs(first, second)
+    
+    def test_modified_file_is_reloaded(self):
+        """Editing the file invalidates the cached config."""
+        first = ConfigParser.load_config(self.config_path)
+        
+        with open(self.config_path) as file:
+            content = file.read()
+        with open(self.config_path, 'w') as file:
+            file.write(content.replace('us-east-1', 'eu-west-1'))
+        stat = os.stat(self.config_path)
+        os.utime(self.config_path, (stat.st_atime, stat.st_mtime + 10))
+        
+        second = ConfigParser.load_config(self.config_path)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.aws_configuration.region, 'eu-west-1')
+    
+    def test_missing_file(self):
+        """A missing file raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            ConfigParser.load_config(os.path.join(self.tmp_dir.name, 'missing.yaml'))
+
+
+if __name__ == '__main__':
+    unittest.main()
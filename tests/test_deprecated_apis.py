@@ -0,0 +1,63 @@
+"""
+Tests for deprecated API scan result handling
+"""
+
+import json
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from assessment.deprecated_apis import DeprecatedAPIScanner
+from generators.reports import ReportGenerator
+
+
+def scan_result(api_versions, kinds, total):
+    """A successful kubent/pluto result summary."""
+    return {
+        'status': 'success',
+        'summary': {
+            'total_deprecated': total,
+            'by_api_version': {api_version: 1 for api_version in api_versions},
+            'by_kind': {kind: 1 for kind in kinds}
+        }
+    }
+
+
+class TestCombineResults(unittest.TestCase):
+    """Test combining kubent and pluto results."""
+    
+    def setUp(self):
+        self.scanner = DeprecatedAPIScanner()
+        self.combined = self.scanner._combine_results(
+            scan_result(['extensions/v1beta1', 'policy/v1beta1'], ['Ingress', 'PodSecurityPolicy'], 2),
+            scan_result(['policy/v1beta1'], ['PodSecurityPolicy'], 1)
+        )
+    
+    def test_unique_values_are_lists(self):
+        """Unique API versions and kinds are de-duplicated into lists."""
+        self.assertIsInstance(self.combined['unique_api_versions'], list)
+        self.assertIsInstance(self.combined['unique_kinds'], list)
+        self.assertEqual(sorted(self.combined['unique_api_versions']), ['extensions/v1beta1', 'policy/v1beta1'])
+        self.assertEqual(sorted(self.combined['unique_kinds']), ['Ingress', 'PodSecurityPolicy'])
+        self.assertEqual(self.combined['total_issues_found'], 3)
+    
+    def test_combined_results_serialize(self):
+        """Combined results serialize with plain json and through the JSON report."""
+        json.dumps(self.combined)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = Path(tmp_dir) / 'assessment-report.json'
+            self.assertTrue(ReportGenerator().generate_json_report(
+                {'deprecated_apis': self.combined}, str(output_path)
+            ))
+            report = json.loads(output_path.read_text())
+        
+        self.assertEqual(report['assessment_data']['deprecated_apis']['total_issues_found'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
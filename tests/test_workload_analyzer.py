@@ -0,0 +1,49 @@
+"""
+Tests for Kubernetes workload analysis
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from assessment.workload_analyzer import WorkloadAnalyzer
+
+
+class TestListRaw(unittest.TestCase):
+    """Test paging raw list responses."""
+    
+    def setUp(self):
+        # Skip loading a kubeconfig; _list_raw only needs the list method
+        self.analyzer = WorkloadAnalyzer.__new__(WorkloadAnalyzer)
+    
+    def response(self, data):
+        return mock.Mock(data=data)
+    
+    def test_pages_are_joined(self):
+        """Items from every page are returned and each connection is released."""
+        responses = [
+            self.response(b'{"items": [{"n": 1}], "metadata": {"continue": "next"}}'),
+            self.response(b'{"items": [{"n": 2}], "metadata": {}}')
+        ]
+        list_method = mock.Mock(side_effect=responses)
+        
+        self.assertEqual(self.analyzer._list_raw(list_method), [{'n': 1}, {'n': 2}])
+        self.assertEqual(list_method.call_args.kwargs['_continue'], 'next')
+        for response in responses:
+            response.release_conn.assert_called_once()
+    
+    def test_connection_released_on_bad_body(self):
+        """A truncated body still returns its connection to the pool."""
+        response = self.response(b'{"items": [')
+        
+        with self.assertRaises(ValueError):
+            self.analyzer._list_raw(mock.Mock(return_value=response))
+        response.release_conn.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()